@@ -0,0 +1,164 @@
+# ---
+# jupyter:
+#   jupytext:
+#     text_representation:
+#       extension: .py
+#       format_name: percent
+#       format_version: '1.3'
+#       jupytext_version: 1.17.2
+#   kernelspec:
+#     display_name: vuecore-dev
+#     language: python
+#     name: python3
+# ---
+
+# %% [markdown]
+# # Clustermap Plot
+#
+# ![VueCore logo][vuecore_logo]
+#
+# [![Open In Colab][colab_badge]][colab_link]
+#
+# [VueCore][vuecore_repo] is a Python package for creating interactive and static visualizations of multi-omics data.
+# It is part of a broader ecosystem of tools—including [ACore][acore_repo] for data processing and [VueGen][vuegen_repo] for automated reporting—that together enable end-to-end workflows for omics analysis.
+#
+# This notebook demonstrates how to generate clustermaps (clustered heatmaps with dendrograms) using plotting functions from VueCore. We showcase basic and advanced plot configurations, highlighting key customization options such as z-score scaling, optimal leaf ordering, long-format data, and export to multiple file formats.
+#
+# ## Notebook structure
+#
+# First, we will set up the work environment by installing the necessary packages and importing the required libraries. Next, we will create basic and advanced clustermaps.
+#
+# 0. [Work environment setup](#0-work-environment-setup)
+# 1. [Basic clustermap](#1-basic-clustermap)
+# 2. [Advanced clustermap](#2-advanced-clustermap)
+#
+# ## Credits and Contributors
+#
+# - This notebook was created by Sebastián Ayala-Ruano under the supervision of Henry Webel and Alberto Santos, head of the [Multiomics Network Analytics Group (MoNA)][Mona] at the [Novo Nordisk Foundation Center for Biosustainability (DTU Biosustain)][Biosustain].
+# - You can find more details about the project in this [GitHub repository][vuecore_repo].
+#
+# [colab_badge]: https://colab.research.google.com/assets/colab-badge.svg
+# [colab_link]: https://colab.research.google.com/github/Multiomics-Analytics-Group/vuecore/blob/main/docs/api_examples/bar_plot.ipynb
+# [vuecore_logo]: https://raw.githubusercontent.com/Multiomics-Analytics-Group/vuecore/main/docs/images/logo/vuecore_logo.svg
+# [Mona]: https://multiomics-analytics-group.github.io/
+# [Biosustain]: https://www.biosustain.dtu.dk/
+# [vuecore_repo]: https://github.com/Multiomics-Analytics-Group/vuecore
+# [vuegen_repo]: https://github.com/Multiomics-Analytics-Group/vuegen
+# [acore_repo]: https://github.com/Multiomics-Analytics-Group/acore
+
+# %% [markdown]
+# ## 0. Work environment setup
+
+# %% [markdown]
+# ### 0.1. Installing libraries and creating global variables for platform and working directory
+#
+# To run this notebook locally, you should create a virtual environment with the required libraries. If you are running this notebook on Google Colab, everything should be set.
+
+# %% tags=["hide-output"]
+# VueCore library
+# %pip install vuecore
+
+# %% tags=["hide-cell"]
+import os
+
+IN_COLAB = "COLAB_GPU" in os.environ
+
+# %% tags=["hide-cell"]
+# Create a directory for outputs
+output_dir = "./outputs"
+os.makedirs(output_dir, exist_ok=True)
+
+# %% [markdown]
+# ### 0.2. Importing libraries
+
+# %%
+# Imports
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from vuecore.plots.basic.clustermap import create_clustermap_plot
+
+# %% [markdown]
+# ### 0.3. Create sample data
+# We create a synthetic dataset simulating the expression of genes in samples from two experimental
+# conditions, where one group of genes is up-regulated in the treated samples.
+
+# %% tags=["hide-input"]
+# Set a random seed for reproducibility of the synthetic data
+np.random.seed(42)
+
+# Define parameters for synthetic gene expression data
+num_genes = 60
+num_samples = 16
+gene_names = [f"Gene_{i}" for i in range(num_genes)]
+sample_names = [f"Control_{i}" for i in range(num_samples // 2)] + [
+    f"Treated_{i}" for i in range(num_samples // 2)
+]
+
+# Simulate expression data, with a block of genes up-regulated in the "Treated" samples
+expression_values = np.random.normal(loc=10, scale=1, size=(num_genes, num_samples))
+expression_values[: num_genes // 3, num_samples // 2 :] += 3
+
+# Create the DataFrame, with genes as rows and samples as columns
+gene_exp_df = pd.DataFrame(expression_values, index=gene_names, columns=sample_names)
+
+gene_exp_df.iloc[:5, :5]
+
+# %% [markdown]
+# ## 1. Basic Clustermap
+# A basic clustermap can be created by simply providing a DataFrame whose numeric columns are clustered,
+# along with style options like `title`
+# using [`create_clustermap_plot`](vuecore.plots.basic.clustermap.create_clustermap_plot) .
+# The rows and the columns are reordered by hierarchical clustering, and the dendrograms are drawn on the sides of the heatmap.
+
+# %%
+# Define output file path for the PNG basic clustermap
+file_path_basic_clustermap_png = Path(output_dir) / "clustermap_plot_basic.png"
+
+# Generate the basic clustermap
+clustermap_plot_basic = create_clustermap_plot(
+    data=gene_exp_df,
+    title="Clustered Gene Expression",
+    file_path=file_path_basic_clustermap_png,
+)
+
+clustermap_plot_basic.show()
+
+# %% [markdown]
+# ## 2. Advanced Clustermap
+# Here is an example of an advanced clustermap with more descriptive parameters, including `long-format data`, `row z-scores`, `correlation distance`, `optimal leaf ordering`, a `diverging colorscale centered at zero`, and export to `HTML`.
+#
+# For matrices with thousands of rows, the heatmap is drawn in blocks of at most `max_rows` x `max_cols` cells
+# of consecutive clustered rows and columns, so the figure stays small.
+
+# %%
+# Convert the matrix to a long DataFrame, with one row per gene and sample
+gene_exp_long_df = gene_exp_df.rename_axis("Gene_ID").reset_index()
+gene_exp_long_df = gene_exp_long_df.melt(
+    id_vars="Gene_ID", var_name="Sample", value_name="Expression"
+)
+
+# Define the output file path for the advanced HTML clustermap
+file_path_adv_clustermap_html = Path(output_dir) / "clustermap_plot_advanced.html"
+
+# Generate the advanced clustermap
+clustermap_plot_adv = create_clustermap_plot(
+    data=gene_exp_long_df,
+    x="Sample",
+    y="Gene_ID",
+    z="Expression",
+    z_score="row",
+    distance_metric="correlation",
+    linkage_method="average",
+    optimal_leaf_ordering=True,
+    zmid=0,
+    title="Clustered Gene Expression by Treatment Condition",
+    subtitle="Row z-scores, correlation distance and optimal leaf ordering",
+    labels={"Sample": "Sample", "Gene_ID": "Gene"},
+    height=900,
+    file_path=file_path_adv_clustermap_html,
+)
+
+clustermap_plot_adv.show()
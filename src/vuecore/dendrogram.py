@@ -1,7 +1,6 @@
 from collections import OrderedDict
 
 import numpy as np
-import scipy as scp
 
 
 def plot_dendrogram(
@@ -15,6 +14,7 @@ def plot_dendrogram(
     colorscale=None,
     hovertext=None,
     color_threshold=None,
+    trace_mode="single",
 ):
     """
     Modified version of Plotly _dendrogram.py that
@@ -41,6 +41,9 @@ def plot_dendrogram(
     :type hovertext: list[list]
     :param color_threshold: Value at which the separation of clusters will be made
     :type color_threshold: double
+    :param trace_mode: 'single' (all links in one trace), 'color' (one trace per cluster color)
+                       or 'merge' (one trace per link, slow for large dendrograms)
+    :type trace_mode: str
     :return: Plotly figure object
 
     Example::
@@ -57,6 +60,7 @@ def plot_dendrogram(
         colorscale,
         hovertext=hovertext,
         color_threshold=color_threshold,
+        trace_mode=trace_mode,
     )
 
     if cutoff_line:
@@ -100,8 +104,10 @@ class Dendrogram(object):
         height=np.inf,
         xaxis="xaxis",
         yaxis="yaxis",
+        trace_mode="single",
     ):
         self.orientation = orientation
+        self.trace_mode = trace_mode
         self.labels = labels
         self.xaxis = xaxis
         self.yaxis = yaxis
@@ -126,14 +132,8 @@ class Dendrogram(object):
 
         self.labels = ordered_labels
         self.leaves = leaves
-        yvals_flat = yvals.flatten()
-        xvals_flat = xvals.flatten()
-
-        self.zero_vals = []
-
-        for i in range(len(yvals_flat)):
-            if yvals_flat[i] == 0.0 and xvals_flat[i] not in self.zero_vals:
-                self.zero_vals.append(xvals_flat[i])
+        # Leaf positions, sorted and unique
+        self.zero_vals = np.unique(xvals[yvals == 0.0]).tolist()
 
         if len(self.zero_vals) > len(yvals) + 1:
             l_border = int(min(self.zero_vals))
@@ -278,70 +278,108 @@ class Dendrogram(object):
                 d. ordered_labels: leaf labels in the order they are going to appear on the plot
                 e. Z_dendrogram['leaves']: left-to-right traversal of the leaves
         """
-        icoord = scp.array(Z_dendrogram["icoord"])
-        dcoord = scp.array(Z_dendrogram["dcoord"])
-        ordered_labels = scp.array(Z_dendrogram["ivl"])
-        # color_list = scp.array(Z_dendrogram["color_list"])
-        # colors = self.get_color_dict(colorscale)
+        icoord = np.asarray(Z_dendrogram["icoord"], dtype=float)
+        dcoord = np.asarray(Z_dendrogram["dcoord"], dtype=float)
+        ordered_labels = np.asarray(Z_dendrogram["ivl"])
+        if self.trace_mode not in ["single", "color", "merge"]:
+            raise ValueError(
+                "Unsupported trace_mode: '{}'. Supported modes: single, color, merge".format(
+                    self.trace_mode
+                )
+            )
 
-        trace_list = []
+        # Leaf ends (distance 0) hang from their link, at least at distance 0
+        hung = dcoord.copy()
+        if len(hung):
+            for end, top in ((0, 1), (3, 2)):
+                leaf = hung[:, end] == 0
+                hung[leaf, end] = np.maximum(0, np.maximum(hung[leaf, top], 0) - hang)
 
-        for i in range(len(icoord)):
-            if self.orientation in ["top", "bottom"]:
-                xs = icoord[i]
-            else:
-                xs = dcoord[i]
+        if self.orientation in ["top", "bottom"]:
+            xs, ys = icoord, hung
+        else:
+            xs, ys = hung, icoord
+        xs = self.sign[self.xaxis] * xs
+        ys = self.sign[self.yaxis] * ys
+
+        texts = None
+        if hovertext and self.trace_mode != "merge":
+            texts = np.empty((len(icoord), 4), dtype=object)
+            for i, text in enumerate(hovertext[: len(icoord)]):
+                texts[i, :] = text if isinstance(text, str) else list(text)
+
+        if self.trace_mode == "merge":
+            groups = [([i], "rgb(40,35,35)") for i in range(len(icoord))]
+        elif self.trace_mode == "single":
+            groups = [(np.arange(len(icoord)), "rgb(40,35,35)")]
+        else:
+            groups = self.get_color_groups(
+                Z_dendrogram.get("color_list", []), len(icoord), colorscale
+            )
+
+        try:
+            x_index = int(self.xaxis[-1])
+        except ValueError:
+            x_index = ""
+
+        try:
+            y_index = int(self.yaxis[-1])
+        except ValueError:
+            y_index = ""
 
-            if self.orientation in ["top", "bottom"]:
-                ys = dcoord[i]
+        trace_list = []
+        for links, color in groups:
+            if self.trace_mode == "merge":
+                x, y = xs[links[0]], ys[links[0]]
+                text = hovertext[links[0]] if hovertext else None
             else:
-                ys = icoord[i]
-            # color_key = color_list[i] # not used
-            hovertext_label = None
-            if hovertext:
-                hovertext_label = hovertext[i]
-
-            coord = [list(a) for a in zip(xs, ys)]
-            x_coord = []
-            y_coord = []
-            y_at_x = {}
-            for n, seg in enumerate(coord):
-                x, y = seg
-                if y > 0 and y < y_at_x.get(x, np.inf):
-                    y_at_x[x] = y
-            for n, seg in enumerate(coord):
-                x, y = seg
-                if y == 0:
-                    y = max(0, y_at_x.get(x, 0) - hang)
-                x_coord.append(x)
-                y_coord.append(y)
+                # Links joined into one line, separated by NaN (line breaks)
+                x = np.column_stack([xs[links], np.full(len(links), np.nan)]).ravel()
+                y = np.column_stack([ys[links], np.full(len(links), np.nan)]).ravel()
+                text = None
+                if texts is not None:
+                    separators = np.full((len(links), 1), None, dtype=object)
+                    text = np.hstack([texts[links], separators]).ravel()
 
             trace = dict(
                 type="scattergl",
-                x=np.multiply(self.sign[self.xaxis], x_coord),
-                y=np.multiply(self.sign[self.yaxis], y_coord),
+                x=x,
+                y=y,
                 mode="lines",
-                marker=dict(color="rgb(40,35,35)"),
-                line=dict(
-                    color="rgb(40,35,35)", width=1
-                ),  # dict(color=colors[color_key]),
-                text=hovertext_label,
+                marker=dict(color=color),
+                line=dict(color=color, width=1),
+                text=text,
                 hoverinfo="text",
             )
-
-            try:
-                x_index = int(self.xaxis[-1])
-            except ValueError:
-                x_index = ""
-
-            try:
-                y_index = int(self.yaxis[-1])
-            except ValueError:
-                y_index = ""
-
             trace["xaxis"] = "x" + x_index
             trace["yaxis"] = "y" + y_index
 
             trace_list.append(trace)
 
         return trace_list, icoord, dcoord, ordered_labels, Z_dendrogram["leaves"]
+
+    def get_color_groups(self, color_list, n_links, colorscale):
+        """
+        Groups the dendrogram links by cluster color.
+
+        :param color_list: color code of each link, as returned by scipy dendrogram
+        :type color_list: list
+        :param n_links: number of links
+        :type n_links: int
+        :param colorscale: colors to use for the plot in rgb format
+        :type colorscale: list
+        :return (list): tuples with the link indices and the color of each group
+        """
+        colors = self.get_color_dict(colorscale)
+        palette = list(colors.values())
+        codes = np.asarray(list(color_list)[:n_links], dtype=object)
+        if len(codes) < n_links:
+            codes = np.append(codes, ["k"] * (n_links - len(codes)))
+
+        groups = []
+        # Codes without a default color (e.g., 'C1') cycle through the colorscale
+        for n, code in enumerate(dict.fromkeys(codes)):
+            color = colors.get(code, palette[n % len(palette)])
+            groups.append((np.flatnonzero(codes == code), color))
+
+        return groups
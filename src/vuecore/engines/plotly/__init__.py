@@ -1,27 +1,43 @@
 from vuecore.engines.registry import register_builder, register_saver
 from vuecore import PlotType, EngineType
 
-from .scatter import build as build_scatter
-from .line import build as build_line
-from .bar import build as build_bar
-from .box import build as build_box
-from .violin import build as build_violin
-from .histogram import build as build_histogram
-from .saver import save
-
-# Import build_utils to ensure it's available
-from . import plot_builder  # noqa: F401
-
-# Register the functions with the central dispatcher
+# Register the functions with the central dispatcher. The builder modules,
+# and therefore plotly.express and kaleido, are only imported when a plot of
+# that type is first requested
+register_builder(
+    plot_type=PlotType.SCATTER,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.scatter:build",
+)
+register_builder(
+    plot_type=PlotType.LINE,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.line:build",
+)
+register_builder(
+    plot_type=PlotType.BAR,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.bar:build",
+)
+register_builder(
+    plot_type=PlotType.BOX,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.box:build",
+)
+register_builder(
+    plot_type=PlotType.VIOLIN,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.violin:build",
+)
 register_builder(
-    plot_type=PlotType.SCATTER, engine=EngineType.PLOTLY, func=build_scatter
+    plot_type=PlotType.HISTOGRAM,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.histogram:build",
 )
-register_builder(plot_type=PlotType.LINE, engine=EngineType.PLOTLY, func=build_line)
-register_builder(plot_type=PlotType.BAR, engine=EngineType.PLOTLY, func=build_bar)
-register_builder(plot_type=PlotType.BOX, engine=EngineType.PLOTLY, func=build_box)
-register_builder(plot_type=PlotType.VIOLIN, engine=EngineType.PLOTLY, func=build_violin)
 register_builder(
-    plot_type=PlotType.HISTOGRAM, engine=EngineType.PLOTLY, func=build_histogram
+    plot_type=PlotType.CLUSTERMAP,
+    engine=EngineType.PLOTLY,
+    func="vuecore.engines.plotly.clustermap:build",
 )
 
-register_saver(engine=EngineType.PLOTLY, func=save)
+register_saver(engine=EngineType.PLOTLY, func="vuecore.engines.plotly.saver:save")
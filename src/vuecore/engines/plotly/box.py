@@ -1,10 +1,12 @@
 # vuecore/engines/plotly/box.py
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
 from vuecore.schemas.basic.box import BoxConfig
+from vuecore.utils.statistics import compute_box_stats
 from .theming import apply_box_theme
 from .plot_builder import build_plot
 
@@ -24,8 +26,125 @@ THEMING_PARAMS = [
     "template",
     "width",
     "height",
+    "precompute_stats",
 ]
 
+# Parameters that only apply to raw observations and are dropped when
+# the box statistics are precomputed
+RAW_DATA_PARAMS = ["hover_name", "hover_data"]
+
+# Column of the summary DataFrame used to match boxes with their statistics
+BOX_ID_COL = "_box_id"
+
+# Summary statistics passed to `go.Box` under the q1/median/q3 signature
+BOX_STATS = ["q1", "median", "q3", "lowerfence", "upperfence", "notchspan"]
+
+
+def _infer_orientation(data: pd.DataFrame, config: BoxConfig) -> str:
+    """
+    Infers the box orientation like `plotly.express.box` does.
+    """
+    if config.orientation:
+        return config.orientation
+    if config.y is None:
+        return "h"
+    if config.x is not None and not pd.api.types.is_numeric_dtype(data[config.y]):
+        return "h"
+    return "v"
+
+
+def box_preprocess(data, plot_args, config):
+    """
+    Preprocess data and arguments to plot precomputed box statistics.
+
+    This function computes the quartiles, fences, notch spans and outliers
+    of every box, i.e., every combination of the category axis, `color` and
+    facet columns, with `compute_box_stats`. The returned DataFrame holds one
+    row per box, with the median as value, so `plotly.express.box` lays out
+    the traces, colors and facets as it would for the raw data.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express function.
+    config : BoxConfig
+        The validated Pydantic model with all box plot configurations.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - data : pd.DataFrame
+            The summary DataFrame with one row per box.
+        - plot_args : dict
+            The plot arguments for `plotly.express.box`.
+    """
+    orientation = _infer_orientation(data, config)
+    if orientation == "v":
+        value_col, category_col = config.y, config.x
+    else:
+        value_col, category_col = config.x, config.y
+
+    group_cols = [
+        plot_args[param]
+        for param in ["color", "facet_row", "facet_col"]
+        if isinstance(plot_args.get(param), str)
+    ]
+    if category_col is not None:
+        group_cols.insert(0, category_col)
+
+    stats = compute_box_stats(
+        data, value_col=value_col, group_cols=list(dict.fromkeys(group_cols))
+    )
+    stats[value_col] = stats["median"]
+    stats[BOX_ID_COL] = np.arange(len(stats))
+
+    plot_args = {k: v for k, v in plot_args.items() if k not in RAW_DATA_PARAMS}
+    plot_args["orientation"] = orientation
+    plot_args["custom_data"] = [BOX_ID_COL]
+
+    return stats, plot_args
+
+
+def precomputed_box(data: pd.DataFrame, **kwargs) -> go.Figure:
+    """
+    Creates a box plot from the summary DataFrame built by `box_preprocess`.
+
+    The figure is laid out by `plotly.express.box`, then each trace is switched
+    to the q1/median/q3 signature of `go.Box`, with the outliers of each box as
+    its only sample points, and Plotly's default hover labels of the box
+    statistics.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The summary DataFrame with one row per box.
+    **kwargs
+        Arguments for `plotly.express.box`.
+
+    Returns
+    -------
+    go.Figure
+        A `plotly.graph_objects.Figure` object representing the box plot.
+    """
+    fig = px.box(data, **kwargs)
+    value_axis = "y" if kwargs.get("orientation", "v") == "v" else "x"
+
+    for trace in fig.select_traces(selector=dict(type="box")):
+        box_ids = np.asarray(trace.customdata)[:, 0].astype(int)
+        boxes = data.iloc[box_ids]
+        update = {stat: boxes[stat].to_numpy() for stat in BOX_STATS}
+        update[value_axis] = [outliers.tolist() for outliers in boxes["outliers"]]
+        # The px hover template refers to the raw rows and to the custom data,
+        # so it is reset to the default box hover, which lists the statistics
+        update["customdata"] = None
+        update["hovertemplate"] = None
+        trace.update(update)
+
+    return fig
+
 
 def build(data: pd.DataFrame, config: BoxConfig) -> go.Figure:
     """
@@ -38,6 +157,9 @@ def build(data: pd.DataFrame, config: BoxConfig) -> go.Figure:
     is then customized with layout and theme settings using `plotly.graph_objects`.
     (https://plotly.com/python-api-reference/generated/plotly.express.box.html).
 
+    If `precompute_stats` is set, the box statistics and outliers are computed
+    in Python, so the figure does not carry every observation.
+
     Parameters
     ----------
     data : pd.DataFrame
@@ -50,6 +172,16 @@ def build(data: pd.DataFrame, config: BoxConfig) -> go.Figure:
     go.Figure
         A `plotly.graph_objects.Figure` object representing the box plot.
     """
+    if config.precompute_stats:
+        return build_plot(
+            data=data,
+            config=config,
+            px_function=precomputed_box,
+            theming_function=apply_box_theme,
+            theming_params=THEMING_PARAMS,
+            preprocess=box_preprocess,
+        )
+
     return build_plot(
         data=data,
         config=config,
@@ -0,0 +1,272 @@
+import warnings
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from scipy.cluster.hierarchy import leaves_list
+
+from vuecore.schemas.basic.clustermap import ClustermapConfig
+from vuecore.utils.clustering import compute_linkage
+from vuecore.utils.downsampling import aggregate_blocks
+from .theming import apply_clustermap_theme
+
+# Define parameters handled by the builder and the theme script
+CLUSTERMAP_PARAMS = set(ClustermapConfig.model_fields)
+
+# Maximum number of rows or columns labeled by default
+MAX_AUTO_LABELS = 100
+
+
+def clustermap_matrix(data: pd.DataFrame, config: ClustermapConfig) -> pd.DataFrame:
+    """
+    Extracts the matrix of a clustermap, standardized if `z_score` is set.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        A wide DataFrame, whose numeric columns are used, or a long DataFrame
+        with the `x`, `y` and `z` columns of the configuration.
+    config : ClustermapConfig
+        The validated Pydantic model with all clustermap configurations.
+
+    Returns
+    -------
+    pd.DataFrame
+        The float matrix, with the heatmap rows as index and the heatmap
+        columns as columns.
+
+    Raises
+    ------
+    ValueError
+        If the matrix has no rows or no columns.
+    """
+    if config.z is not None:
+        matrix = data.pivot_table(
+            index=config.y, columns=config.x, values=config.z, aggfunc="mean"
+        )
+    else:
+        matrix = data.select_dtypes("number")
+    matrix = matrix.astype(float)
+    if matrix.empty:
+        raise ValueError("The clustermap matrix has no numeric rows or columns.")
+
+    if config.z_score is not None:
+        axis = 1 if config.z_score == "row" else 0
+        values = matrix.to_numpy()
+        # Rows or columns without values stay missing
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(values, axis=axis, keepdims=True)
+            std = np.nanstd(values, axis=axis, keepdims=True)
+            values = (values - mean) / np.where(std > 0, std, 1.0)
+        matrix = pd.DataFrame(values, index=matrix.index, columns=matrix.columns)
+    return matrix
+
+
+def dendrogram_lines(
+    linkage: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the leaf order and the links of a dendrogram as NaN-separated lines.
+
+    Leaf `i` of the order is drawn at position `i`, and each merge is drawn
+    as a U-shaped link between the positions and heights of its two children,
+    so the whole dendrogram is a single trace. The order matches
+    `scipy.cluster.hierarchy.dendrogram`, without its recursion.
+
+    Parameters
+    ----------
+    linkage : np.ndarray
+        The linkage matrix, as returned by `scipy.cluster.hierarchy.linkage`.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The leaves in dendrogram order, and the positions and heights of the
+        links.
+    """
+    n_leaves = len(linkage) + 1
+    leaves = leaves_list(linkage)
+    children = linkage[:, :2].astype(int)
+    positions = np.empty(2 * n_leaves - 1)
+    positions[leaves] = np.arange(n_leaves)
+    heights = np.zeros(2 * n_leaves - 1)
+    heights[n_leaves:] = linkage[:, 2]
+    # Children are always merged before their parent
+    for i, (left, right) in enumerate(children):
+        positions[n_leaves + i] = (positions[left] + positions[right]) / 2
+
+    left, right = children[:, 0], children[:, 1]
+    gap = np.full(len(linkage), np.nan)
+    link_positions = np.column_stack(
+        [positions[left], positions[left], positions[right], positions[right], gap]
+    )
+    link_heights = np.column_stack(
+        [heights[left], linkage[:, 2], linkage[:, 2], heights[right], gap]
+    )
+    return leaves, link_positions.ravel(), link_heights.ravel()
+
+
+def _axis_order(
+    values: np.ndarray, cluster: bool, config: ClustermapConfig
+) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Clusters the rows of `values`, returning their order and dendrogram links.
+    """
+    if not cluster or len(values) < 2:
+        return np.arange(len(values)), None, None
+    # Missing values are imputed with the column means for the clustering only
+    missing = np.isnan(values)
+    counts = np.maximum((~missing).sum(axis=0), 1)
+    means = np.where(missing, 0.0, values).sum(axis=0) / counts
+    filled = np.where(missing, means, values)
+    linkage = compute_linkage(
+        filled,
+        distfun=config.distance_metric,
+        method=config.linkage_method,
+        optimal_ordering=config.optimal_leaf_ordering,
+    )
+    return dendrogram_lines(linkage)
+
+
+def _axis_ticks(labels, block_starts, show: Optional[bool]):
+    """
+    Returns the tick positions and labels of an axis, or None to hide them.
+    """
+    aggregated = len(block_starts) < len(labels)
+    if show is None:
+        show = not aggregated and len(labels) <= MAX_AUTO_LABELS
+    if not show:
+        return None
+    if aggregated:
+        # One label per block: its first row or column
+        return block_starts, [str(labels[i]) for i in block_starts]
+    return np.arange(len(labels)), [str(label) for label in labels]
+
+
+def build(data: pd.DataFrame, config: ClustermapConfig) -> go.Figure:
+    """
+    Creates a Plotly clustered heatmap from a DataFrame and a Pydantic configuration.
+
+    The rows and the columns of the matrix are each clustered once (see
+    `vuecore.utils.clustering.compute_linkage`, which caches the linkages),
+    and the same linkage orders the heatmap and draws the dendrogram on its
+    side. Each dendrogram is a single NaN-separated line trace. Matrices
+    larger than `max_rows` x `max_cols` are aggregated into blocks of
+    consecutive clustered rows and columns after reordering, so the figure
+    size does not depend on the size of the matrix. Additional, unvalidated
+    keyword arguments are forwarded to `plotly.graph_objects.Heatmap`, and
+    override the arguments set by the builder (e.g., `colorscale`).
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    config : ClustermapConfig
+        The validated Pydantic model with all plot configurations.
+
+    Returns
+    -------
+    go.Figure
+        A `plotly.graph_objects.Figure` object representing the clustermap.
+    """
+    matrix = clustermap_matrix(data, config)
+    values = matrix.to_numpy()
+
+    row_order, row_positions, row_heights = _axis_order(
+        values, config.cluster_rows, config
+    )
+    col_order, col_positions, col_heights = _axis_order(
+        values.T, config.cluster_cols, config
+    )
+    ordered = values[np.ix_(row_order, col_order)]
+    cells, row_starts, col_starts = aggregate_blocks(
+        ordered, config.max_rows, config.max_cols, config.aggregation
+    )
+    row_size = row_starts[1] if len(row_starts) > 1 else 1
+    col_size = col_starts[1] if len(col_starts) > 1 else 1
+
+    ratio = config.dendrogram_ratio
+    fig = make_subplots(
+        rows=2,
+        cols=2,
+        specs=[[None, {}], [{}, {}]],
+        column_widths=[ratio, 1 - ratio],
+        row_heights=[ratio, 1 - ratio],
+        shared_xaxes=True,
+        shared_yaxes=True,
+        horizontal_spacing=0.005,
+        vertical_spacing=0.005,
+    )
+
+    heatmap_args = dict(
+        z=cells,
+        x0=(col_size - 1) / 2,
+        dx=col_size,
+        y0=(row_size - 1) / 2,
+        dy=row_size,
+        colorscale=config.color_continuous_scale,
+        zmid=config.zmid,
+        name="",
+        # The colorbar fills the corner left free by the dendrograms, so it
+        # does not overlap the row labels
+        colorbar=dict(x=0, xanchor="left", y=1, yanchor="top", len=ratio, thickness=15),
+    )
+    # Additional Heatmap arguments take precedence over the defaults above
+    extra_args = {
+        k: v for k, v in config.model_dump().items() if k not in CLUSTERMAP_PARAMS
+    }
+    heatmap_args.update(extra_args)
+    fig.add_trace(go.Heatmap(**heatmap_args), row=2, col=2)
+    line = dict(color="#444444", width=1)
+    if col_positions is not None:
+        fig.add_trace(
+            go.Scatter(
+                x=col_positions,
+                y=col_heights,
+                mode="lines",
+                line=line,
+                hoverinfo="skip",
+            ),
+            row=1,
+            col=2,
+        )
+    if row_positions is not None:
+        fig.add_trace(
+            go.Scatter(
+                x=row_heights,
+                y=row_positions,
+                mode="lines",
+                line=line,
+                hoverinfo="skip",
+            ),
+            row=2,
+            col=1,
+        )
+
+    # Heatmap rows are drawn top-down, and the row dendrogram grows leftwards
+    fig.update_yaxes(range=[len(row_order) - 0.5, -0.5], row=2)
+    fig.update_xaxes(range=[-0.5, len(col_order) - 0.5], col=2)
+    fig.update_xaxes(autorange="reversed", row=2, col=1)
+    col_ticks = _axis_ticks(
+        matrix.columns[col_order], col_starts, config.show_col_labels
+    )
+    if col_ticks is not None:
+        fig.update_xaxes(tickvals=col_ticks[0], ticktext=col_ticks[1], row=2, col=2)
+    else:
+        fig.update_xaxes(showticklabels=False, row=2, col=2)
+    row_ticks = _axis_ticks(matrix.index[row_order], row_starts, config.show_row_labels)
+    if row_ticks is not None:
+        fig.update_yaxes(
+            tickvals=row_ticks[0],
+            ticktext=row_ticks[1],
+            showticklabels=True,
+            side="right",
+            row=2,
+            col=2,
+        )
+
+    fig = apply_clustermap_theme(fig, config)
+    return fig
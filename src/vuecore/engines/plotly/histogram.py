@@ -3,6 +3,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from vuecore.schemas.basic.histogram import HistogramConfig
+from vuecore.utils.statistics import compute_histogram
 from .theming import apply_histogram_theme
 from .plot_builder import build_plot
 
@@ -23,8 +24,91 @@ THEMING_PARAMS = [
     "template",
     "width",
     "height",
+    "precompute_bins",
 ]
 
+# Parameters that only apply to raw observations and are dropped when
+# the bins are precomputed
+RAW_DATA_PARAMS = [
+    "nbins",
+    "histfunc",
+    "cumulative",
+    "marginal",
+    "hover_name",
+    "hover_data",
+]
+
+
+def histogram_preprocess(data, plot_args, config):
+    """
+    Preprocess data and arguments to plot precomputed histogram bins as bars.
+
+    This function bins the data per `color`, `pattern_shape` and facet group
+    with `compute_histogram`, honouring `nbins`, `histfunc`, `histnorm`,
+    `cumulative` and `barnorm`, and maps the aggregated values to the
+    arguments of `plotly.express.bar`.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express function.
+    config : HistogramConfig
+        The validated Pydantic model with all histogram configurations.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - data : pd.DataFrame
+            The aggregated DataFrame with one row per bin and group.
+        - plot_args : dict
+            The plot arguments for `plotly.express.bar`.
+
+    Notes
+    -----
+    The size of the resulting figure depends on the number of bins and
+    groups, not on the number of rows of the input data.
+    """
+    orientation = config.orientation or ("h" if config.x is None else "v")
+    if orientation == "v":
+        value_col, agg_col = config.x, config.y
+    else:
+        value_col, agg_col = config.y, config.x
+
+    stack_cols = [
+        plot_args[param]
+        for param in ["color", "pattern_shape"]
+        if isinstance(plot_args.get(param), str)
+    ]
+    facet_cols = [
+        plot_args[param]
+        for param in ["facet_row", "facet_col"]
+        if isinstance(plot_args.get(param), str)
+    ]
+    binned, value_name = compute_histogram(
+        data,
+        value_col=value_col,
+        agg_col=agg_col,
+        group_cols=list(dict.fromkeys(stack_cols + facet_cols)),
+        stack_cols=stack_cols,
+        nbins=config.nbins,
+        histfunc=config.histfunc or "count",
+        histnorm=config.histnorm,
+        cumulative=config.cumulative,
+        barnorm=config.barnorm,
+    )
+
+    plot_args = {k: v for k, v in plot_args.items() if k not in RAW_DATA_PARAMS}
+    if orientation == "v":
+        plot_args.update(x=value_col, y=value_name)
+    else:
+        plot_args.update(x=value_name, y=value_col)
+    plot_args["orientation"] = orientation
+
+    return binned, plot_args
+
 
 def build(data: pd.DataFrame, config: HistogramConfig) -> go.Figure:
     """
@@ -37,6 +121,9 @@ def build(data: pd.DataFrame, config: HistogramConfig) -> go.Figure:
     is then customized with layout and theme settings using `plotly.graph_objects`.
     (https://plotly.com/python-api-reference/generated/plotly.express.histogram.html).
 
+    If `precompute_bins` is set, the bins are computed in Python and plotted
+    with `plotly.express.bar`, so the figure only carries the aggregated values.
+
     Parameters
     ----------
     data : pd.DataFrame
@@ -49,6 +136,16 @@ def build(data: pd.DataFrame, config: HistogramConfig) -> go.Figure:
     go.Figure
         A `plotly.graph_objects.Figure` object representing the histogram.
     """
+    if config.precompute_bins:
+        return build_plot(
+            data=data,
+            config=config,
+            px_function=px.bar,
+            theming_function=apply_histogram_theme,
+            theming_params=THEMING_PARAMS,
+            preprocess=histogram_preprocess,
+        )
+
     return build_plot(
         data=data,
         config=config,
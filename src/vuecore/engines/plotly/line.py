@@ -5,8 +5,9 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from vuecore.schemas.basic.line import LineConfig
+from vuecore.utils.downsampling import downsample_groups
 from .theming import apply_line_theme
-from .plot_builder import build_plot
+from .plot_builder import build_plot, resolve_render_mode
 
 # Define parameters handled by the theme script
 THEMING_PARAMS = [
@@ -23,8 +24,77 @@ THEMING_PARAMS = [
     "template",
     "width",
     "height",
+    "webgl_threshold",
+    "max_points_per_trace",
+    "downsample_method",
 ]
 
+# Parameters whose columns split the data into separate traces
+GROUPING_PARAMS = [
+    "color",
+    "line_group",
+    "line_dash",
+    "symbol",
+    "facet_row",
+    "facet_col",
+    "animation_frame",
+]
+
+
+def line_preprocess(data, plot_args, config):
+    """
+    Preprocess data and arguments for line plots.
+
+    This function downsamples long lines when `max_points_per_trace` is set
+    and selects SVG or WebGL traces based on the configured `render_mode` and
+    the number of remaining points.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express line function.
+    config : LineConfig
+        The validated Pydantic model with all line plot configurations.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - data : pd.DataFrame
+            The DataFrame, downsampled if `max_points_per_trace` is set.
+        - plot_args : dict
+            The plot arguments dictionary with an explicit render mode.
+
+    Notes
+    -----
+    Downsampling runs separately for each combination of the columns that
+    split the data into traces (`color`, `line_group`, `line_dash`, `symbol`
+    and facets), so every line keeps its own shape and peaks.
+    """
+    # Downsample each line to bound the figure size
+    if config.max_points_per_trace is not None and config.y is not None:
+        group_cols = list(
+            dict.fromkeys(
+                plot_args[param]
+                for param in GROUPING_PARAMS
+                if isinstance(plot_args.get(param), str)
+            )
+        )
+        data = downsample_groups(
+            data,
+            x=config.x,
+            y=config.y,
+            group_cols=group_cols,
+            max_points=config.max_points_per_trace,
+            method=config.downsample_method,
+        )
+
+    plot_args["render_mode"] = resolve_render_mode(data, config)
+
+    return data, plot_args
+
 
 def build(data: pd.DataFrame, config: LineConfig) -> go.Figure:
     """
@@ -55,4 +125,5 @@ def build(data: pd.DataFrame, config: LineConfig) -> go.Figure:
         px_function=px.line,
         theming_function=apply_line_theme,
         theming_params=THEMING_PARAMS,
+        preprocess=line_preprocess,
     )
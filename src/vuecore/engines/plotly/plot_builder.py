@@ -1,8 +1,40 @@
 # vuecore/engines/plotly/plot_builder.py
+import logging
 from typing import Any, Optional, List, Callable
 import pandas as pd
 import plotly.graph_objects as go
 
+logger = logging.getLogger(__name__)
+
+# Render modes accepted by the `render_mode` argument of plotly.express
+RENDER_MODES = ("auto", "svg", "webgl")
+
+# Arguments of plotly.express functions that reference DataFrame columns
+COLUMN_PARAMS = [
+    "x",
+    "y",
+    "z",
+    "color",
+    "symbol",
+    "size",
+    "text",
+    "facet_row",
+    "facet_col",
+    "hover_name",
+    "hover_data",
+    "custom_data",
+    "error_x",
+    "error_x_minus",
+    "error_y",
+    "error_y_minus",
+    "pattern_shape",
+    "line_group",
+    "line_dash",
+    "base",
+    "animation_frame",
+    "animation_group",
+]
+
 
 def build_plot(
     data: pd.DataFrame,
@@ -18,9 +50,10 @@ def build_plot(
     The function follows these steps:
     1. Get all parameters from the config model
     2. Create the dictionary of arguments for the plot function
-    3. Apply preprocessing
-    4. Create the base figure
-    5. Apply theme and additional styling
+    3. Project the data to the referenced columns
+    4. Apply preprocessing
+    5. Create the base figure
+    6. Apply theme and additional styling
 
     Parameters
     ----------
@@ -52,6 +85,9 @@ def build_plot(
         if k not in theming_params and v is not None
     }
 
+    # Keep only the columns referenced by the plot arguments
+    data = project_columns(data, plot_args)
+
     # Apply preprocessing if provided
     if preprocess and callable(preprocess):
         data, plot_args = preprocess(data, plot_args, config)
@@ -63,3 +99,122 @@ def build_plot(
     fig = theming_function(fig, config)
 
     return fig
+
+
+def resolve_render_mode(data: pd.DataFrame, config: Any) -> str:
+    """
+    Resolves the configured render mode into an explicit 'svg' or 'webgl' mode.
+
+    In 'auto' mode, WebGL (`go.Scattergl`) traces are used once the number of
+    rows reaches `config.webgl_threshold`, and SVG (`go.Scatter`) traces
+    otherwise. Explicit 'svg' and 'webgl' modes are returned unchanged.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    config : Any
+        The Pydantic model with `render_mode` and `webgl_threshold` attributes.
+
+    Returns
+    -------
+    str
+        Either 'svg' or 'webgl'.
+
+    Raises
+    ------
+    ValueError
+        If `config.render_mode` is not one of the supported render modes.
+    """
+    if config.render_mode not in RENDER_MODES:
+        raise ValueError(
+            f"Unsupported render mode: '{config.render_mode}'. "
+            f"Supported modes: {', '.join(RENDER_MODES)}"
+        )
+    if config.render_mode != "auto":
+        return config.render_mode
+    return "webgl" if len(data) >= config.webgl_threshold else "svg"
+
+
+def referenced_columns(data: pd.DataFrame, plot_args: dict) -> List[Any]:
+    """
+    Lists the DataFrame columns referenced by plotly.express arguments.
+
+    Column references are collected from the arguments in `COLUMN_PARAMS`,
+    given either as a single column name, a list of names (e.g., wide-form
+    `y` or `hover_data`) or a dictionary keyed by column names (e.g.,
+    `hover_data` with formats). Arrays and other values that are not column
+    names are ignored.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express function.
+
+    Returns
+    -------
+    List[Any]
+        The referenced columns, in the order of the DataFrame.
+    """
+    referenced = set()
+    for param in COLUMN_PARAMS:
+        value = plot_args.get(param)
+        if isinstance(value, dict):
+            candidates = value.keys()
+        elif isinstance(value, (list, tuple)):
+            candidates = value
+        else:
+            candidates = [value]
+        for candidate in candidates:
+            try:
+                if candidate in data.columns:
+                    referenced.add(candidate)
+            except TypeError:
+                # Unhashable values, e.g., arrays, are not column names
+                continue
+    return [column for column in data.columns if column in referenced]
+
+
+def project_columns(data: pd.DataFrame, plot_args: dict) -> pd.DataFrame:
+    """
+    Restricts a DataFrame to the columns referenced by the plot arguments.
+
+    plotly.express copies and inspects every column of the DataFrame it is
+    given, so dropping the unreferenced ones up front avoids that work for
+    wide frames (e.g., with many annotation columns). The projected frame
+    shares its column data with `data`, without copying. Wide-form calls
+    (neither `x` nor `y` given) are left untouched, as they use every column.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express function.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with only the referenced columns, or `data` itself if
+        nothing can be dropped.
+    """
+    if plot_args.get("x") is None and plot_args.get("y") is None:
+        return data
+    if not data.columns.is_unique:
+        return data
+
+    columns = referenced_columns(data, plot_args)
+    if len(columns) == len(data.columns):
+        return data
+
+    if logger.isEnabledFor(logging.DEBUG):
+        dropped = [column for column in data.columns if column not in set(columns)]
+        logger.debug(
+            "Dropped %d of %d columns not referenced by the plot: %s",
+            len(dropped),
+            len(data.columns),
+            dropped[:20] + (["..."] if len(dropped) > 20 else []),
+        )
+    return pd.DataFrame({column: data[column] for column in columns}, copy=False)
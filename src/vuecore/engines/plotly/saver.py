@@ -1,9 +1,104 @@
-import plotly.graph_objects as go
-import kaleido
+import warnings
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, List, Sequence
+
+import kaleido
+import plotly.graph_objects as go
+import plotly.io as pio
 
 from vuecore.constants import OutputFileFormat
 
+# Static suffixes from the OutputFileFormat enum, rendered by Kaleido
+IMAGE_SUFFIXES = [
+    OutputFileFormat.PNG.value_with_dot,
+    OutputFileFormat.JPG.value_with_dot,
+    OutputFileFormat.JPEG.value_with_dot,
+    OutputFileFormat.WEBP.value_with_dot,
+    OutputFileFormat.SVG.value_with_dot,
+    OutputFileFormat.PDF.value_with_dot,
+]
+
+# Messages of the Plotly and Kaleido errors raised when Chrome is missing
+CHROME_MISSING_MESSAGES = ("Kaleido requires Google Chrome", "requires Chrome")
+
+
+def _with_chrome(render, *args, **kwargs):
+    """
+    Runs a Kaleido render call, installing Chrome once if it is missing.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Plotly passes renderer options that a running server ignores
+            warnings.filterwarnings("ignore", message="The kopts argument is ignored")
+            return render(*args, **kwargs)
+    except RuntimeError as e:
+        # Handle specific Kaleido errors for Chrome installation
+        if not any(message in str(e) for message in CHROME_MISSING_MESSAGES):
+            raise  # Re-raise other RuntimeError exceptions
+        print(
+            "[VueCore] Chrome not found. Attempting automatic install using `kaleido.get_chrome_sync()`..."
+        )
+        try:
+            kaleido.get_chrome_sync()
+            # Retry after installing Chrome
+            return render(*args, **kwargs)
+        except Exception as install_error:
+            raise RuntimeError(
+                "[VueCore] Failed to install Chrome automatically. "
+                "Please install it manually or run `plotly_get_chrome`."
+            ) from install_error
+
+
+@contextmanager
+def renderer_session(n: int = 1, **kwargs) -> Iterator[None]:
+    """
+    Keeps a Kaleido renderer running for all static image exports in a block.
+
+    Outside a session, every static export starts and stops its own Chrome
+    process. Inside a session, `save`, `save_many` and `fig.write_image` reuse
+    one long-lived Kaleido server, so exporting many figures is bounded by
+    rendering time instead of process startup. If a server is already running
+    (e.g., in a nested session), it is reused and left running on exit.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of Chrome tabs rendering in parallel. Defaults to 1.
+    **kwargs
+        Additional arguments for `kaleido.Kaleido` (e.g., `timeout`).
+
+    Yields
+    ------
+    None
+
+    Examples
+    --------
+    >>> with renderer_session():
+    ...     for fig, path in zip(figs, paths):
+    ...         save(fig, path)
+    """
+    # Locate (or install) Chrome up front with a one-pixel render: the server
+    # runs in a background thread and would otherwise fail there, leaving
+    # export calls waiting forever
+    _with_chrome(
+        kaleido.calc_fig_sync,
+        {"data": [], "layout": {}},
+        opts=dict(format="png", width=1, height=1),
+        kopts=kwargs,
+    )
+    # Kaleido keeps a single global server and warns if it is already open,
+    # in which case it belongs to an outer session and is left running
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", RuntimeWarning)
+        kaleido.start_sync_server(n=n, **kwargs)
+    started = not any(issubclass(w.category, RuntimeWarning) for w in caught)
+    try:
+        yield
+    finally:
+        if started:
+            kaleido.stop_sync_server(silence_warnings=True)
+
 
 def save(fig: go.Figure, filepath: str) -> None:
     """
@@ -35,36 +130,8 @@ def save(fig: go.Figure, filepath: str) -> None:
     suffix = path.suffix.lower()
 
     try:
-        # Define static suffixes from the OutputFileFormat enum
-        image_suffixes = [
-            OutputFileFormat.PNG.value_with_dot,
-            OutputFileFormat.JPG.value_with_dot,
-            OutputFileFormat.JPEG.value_with_dot,
-            OutputFileFormat.WEBP.value_with_dot,
-            OutputFileFormat.SVG.value_with_dot,
-            OutputFileFormat.PDF.value_with_dot,
-        ]
-
-        if suffix in image_suffixes:
-            try:
-                fig.write_image(filepath)
-            except RuntimeError as e:
-                # Handle specific Kaleido errors for Chrome installation
-                if "Kaleido requires Google Chrome" in str(e):
-                    print(
-                        "[VueCore] Chrome not found. Attempting automatic install using `kaleido.get_chrome_sync()`..."
-                    )
-                    try:
-                        kaleido.get_chrome_sync()
-                        # Retry after installing Chrome
-                        fig.write_image(filepath)
-                    except Exception as install_error:
-                        raise RuntimeError(
-                            "[VueCore] Failed to install Chrome automatically. "
-                            "Please install it manually or run `plotly_get_chrome`."
-                        ) from install_error
-                else:
-                    raise  # Re-raise other RuntimeError exceptions
+        if suffix in IMAGE_SUFFIXES:
+            _with_chrome(fig.write_image, filepath)
         elif suffix == OutputFileFormat.HTML.value_with_dot:
             fig.write_html(filepath, include_plotlyjs="cdn")
         elif suffix == OutputFileFormat.JSON.value_with_dot:
@@ -85,3 +152,64 @@ def save(fig: go.Figure, filepath: str) -> None:
         raise RuntimeError(f"[VueCore] Failed to save plot: {filepath}") from e
 
     print(f"[VueCore] Plot saved to {filepath}")
+
+
+def save_many(
+    figs: Sequence[go.Figure], filepaths: Sequence[str], n: int = 1
+) -> List[str]:
+    """
+    Saves many Plotly figures, rendering all static images in one Kaleido session.
+
+    Static images (PNG, JPG, WEBP, SVG, PDF) are rendered together with
+    `plotly.io.write_images` by a single Kaleido server with `n` parallel
+    tabs, started for the call unless a `renderer_session` is already
+    active. HTML and JSON files are written with `save`.
+
+    Parameters
+    ----------
+    figs : Sequence[go.Figure]
+        The Plotly figure objects to save.
+    filepaths : Sequence[str]
+        The destination paths, one per figure. The format of each file is
+        determined by its extension.
+    n : int, optional
+        Number of Chrome tabs rendering in parallel. Defaults to 1.
+
+    Returns
+    -------
+    List[str]
+        The paths of the saved files, in the order of `filepaths`.
+
+    Raises
+    ------
+    ValueError
+        If the numbers of figures and paths differ.
+    RuntimeError
+        If a figure cannot be saved, e.g., because its file extension is not
+        one of the supported formats.
+    """
+    if len(figs) != len(filepaths):
+        raise ValueError(f"Got {len(figs)} figures but {len(filepaths)} file paths.")
+
+    images = [
+        (fig, str(path))
+        for fig, path in zip(figs, filepaths)
+        if Path(path).suffix.lower() in IMAGE_SUFFIXES
+    ]
+    for fig, path in zip(figs, filepaths):
+        if Path(path).suffix.lower() not in IMAGE_SUFFIXES:
+            save(fig, str(path))
+
+    if images:
+        image_figs, image_paths = map(list, zip(*images))
+        try:
+            with renderer_session(n=n):
+                _with_chrome(pio.write_images, image_figs, image_paths)
+        except Exception as e:
+            raise RuntimeError(
+                f"[VueCore] Failed to save {len(image_paths)} static images"
+            ) from e
+        for path in image_paths:
+            print(f"[VueCore] Plot saved to {path}")
+
+    return [str(path) for path in filepaths]
@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 from vuecore.schemas.basic.scatter import ScatterConfig
 from vuecore.utils.statistics import get_density
 from .theming import apply_scatter_theme
-from .plot_builder import build_plot
+from .plot_builder import build_plot, resolve_render_mode
 
 # Define parameters handled by the theme script
 THEMING_PARAMS = [
@@ -24,6 +24,11 @@ THEMING_PARAMS = [
     "marker_line_width",
     "marker_line_color",
     "color_by_density",
+    "density_method",
+    "density_grid_size",
+    "density_bandwidth",
+    "density_neighbors",
+    "webgl_threshold",
 ]
 
 
@@ -32,7 +37,7 @@ def scatter_preprocess(data, plot_args, config):
     Preprocess data and arguments for scatter plots with density coloring.
 
     This function handles special preprocessing for scatter plots, particularly
-    for density-based coloring.
+    for density-based coloring and the selection of SVG or WebGL traces.
 
     Parameters
     ----------
@@ -50,19 +55,31 @@ def scatter_preprocess(data, plot_args, config):
         - data : pd.DataFrame
             The original DataFrame (unchanged).
         - plot_args : dict
-            The modified plot arguments dictionary with color settings adjusted
-            based on the configuration.
+            The modified plot arguments dictionary with color and render mode
+            settings adjusted based on the configuration.
 
     Notes
     -----
     When density coloring is enabled, this function calculates density values
     for the data points and uses them for color mapping, removing any discrete
-    color mapping that might conflict with continuous coloring.
+    color mapping that might conflict with continuous coloring. The estimator
+    is selected with `density_method`; the default 'grid' estimator scales
+    linearly with the number of points.
     """
+    # Use WebGL traces for large datasets
+    plot_args["render_mode"] = resolve_render_mode(data, config)
+
     # Handle density coloring
     if config.color_by_density:
         # Calculate density and pass it to the 'color' argument
-        density_values = get_density(data[config.x].values, data[config.y].values)
+        density_values = get_density(
+            data[config.x].values,
+            data[config.y].values,
+            method=config.density_method,
+            grid_size=config.density_grid_size,
+            bandwidth=config.density_bandwidth,
+            n_neighbors=config.density_neighbors,
+        )
         plot_args["color"] = density_values
 
         # Remove discrete color mapping for density plots
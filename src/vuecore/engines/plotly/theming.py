@@ -6,6 +6,12 @@ from vuecore.schemas.basic.bar import BarConfig
 from vuecore.schemas.basic.box import BoxConfig
 from vuecore.schemas.basic.violin import ViolinConfig
 from vuecore.schemas.basic.histogram import HistogramConfig
+from vuecore.schemas.basic.clustermap import ClustermapConfig
+
+
+def _is_marker_trace(trace) -> bool:
+    """Checks if a trace is an SVG or WebGL scatter trace that draws markers."""
+    return trace.type in ["scatter", "scattergl"] and "markers" in (trace.mode or "")
 
 
 def _get_axis_title(config, axis: str) -> str:
@@ -110,13 +116,13 @@ def apply_scatter_theme(fig: go.Figure, config: ScatterConfig) -> go.Figure:
     go.Figure
         The styled Plotly figure object.
     """
-    # Apply trace-specific updates
+    # Apply trace-specific updates to both SVG and WebGL marker traces
     fig.update_traces(
         marker=dict(
             opacity=config.opacity,
             line=dict(width=config.marker_line_width, color=config.marker_line_color),
         ),
-        selector=dict(mode="markers"),
+        selector=_is_marker_trace,
     )
 
     # Apply common layout
@@ -146,10 +152,13 @@ def apply_line_theme(fig: go.Figure, config: LineConfig) -> go.Figure:
         The styled Plotly figure object.
     """
     # Apply trace-specific updates
-    fig.update_traces(
-        mode="lines+markers" if config.markers else "lines",
-        line_shape=config.line_shape,
-    )
+    fig.update_traces(mode="lines+markers" if config.markers else "lines")
+    fig.update_traces(line_shape=config.line_shape, selector=dict(type="scatter"))
+
+    # WebGL traces only support straight and step shapes, so 'spline' falls
+    # back to straight lines
+    gl_line_shape = "linear" if config.line_shape == "spline" else config.line_shape
+    fig.update_traces(line_shape=gl_line_shape, selector=dict(type="scattergl"))
 
     # Apply common layout
     fig = _apply_common_layout(fig, config)
@@ -270,13 +279,67 @@ def apply_histogram_theme(fig: go.Figure, config: HistogramConfig) -> go.Figure:
         The styled Plotly figure object.
     """
     # Apply trace-specific updates for histogram
+    trace_updates = {"opacity": config.opacity, "orientation": config.orientation}
     fig.update_traces(
-        opacity=config.opacity,
-        orientation=config.orientation,
+        **{k: v for k, v in trace_updates.items() if v is not None},
         selector=dict(type="histogram"),
     )
 
+    # Precomputed bins are drawn as adjacent bars
+    if config.precompute_bins:
+        fig.update_traces(opacity=config.opacity, selector=dict(type="bar"))
+        fig.update_layout(bargap=0)
+    fig.update_layout(barmode=config.barmode)
+
     # Apply common layout
     fig = _apply_common_layout(fig, config)
 
     return fig
+
+
+def apply_clustermap_theme(fig: go.Figure, config: ClustermapConfig) -> go.Figure:
+    """
+    Applies a consistent layout and theme to a Plotly clustermap.
+
+    This function handles all styling and layout adjustments, such as titles,
+    dimensions, templates, and axis properties, separating these concerns
+    from the clustering and the data mapping. The axis titles are set on the
+    heatmap, and the axes of the dendrograms are hidden.
+
+    Parameters
+    ----------
+    fig : go.Figure
+        The Plotly figure object to be styled.
+    config : ClustermapConfig
+        The configuration object containing all styling and layout info.
+
+    Returns
+    -------
+    go.Figure
+        The styled Plotly figure object.
+    """
+    layout_updates = {
+        "title_text": config.title,
+        "title_subtitle_text": config.subtitle,
+        "height": config.height,
+        "width": config.width,
+        "template": config.template,
+    }
+    fig.update_layout(
+        **{k: v for k, v in layout_updates.items() if v is not None},
+        showlegend=False,
+    )
+
+    # Dendrogram axes (top and left subplots) carry no information
+    fig.update_xaxes(visible=False, row=1, col=2)
+    fig.update_yaxes(visible=False, row=1, col=2)
+    fig.update_xaxes(visible=False, row=2, col=1)
+    fig.update_yaxes(visible=False, row=2, col=1)
+    fig.update_xaxes(
+        title_text=_get_axis_title(config, "x"), showgrid=False, row=2, col=2
+    )
+    fig.update_yaxes(
+        title_text=_get_axis_title(config, "y"), showgrid=False, row=2, col=2
+    )
+
+    return fig
@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
 from vuecore.schemas.basic.violin import ViolinConfig
+from vuecore.utils.statistics import compute_box_stats, compute_kde_curves
 from .theming import apply_violin_theme
 from .plot_builder import build_plot
 
@@ -22,8 +24,327 @@ THEMING_PARAMS = [
     "template",
     "width",
     "height",
+    "precompute_kde",
+    "kde_grid_size",
+    "kde_bandwidth",
+    "max_points",
 ]
 
+# Parameters that only apply to raw observations and are dropped when
+# the densities are precomputed
+RAW_DATA_PARAMS = ["hover_name", "hover_data"]
+
+# Helper columns of the path DataFrame built by `violin_preprocess`
+PART_COL = "_part"
+CATEGORY_COL = "_category"
+CATEGORY_POS_COL = "_category_pos"
+
+# Fraction of a category slot covered by the violins
+VIOLIN_SPAN = 0.8
+
+
+def _infer_orientation(data: pd.DataFrame, config: ViolinConfig) -> str:
+    """
+    Infers the violin orientation like `plotly.express.violin` does.
+    """
+    if config.orientation:
+        return config.orientation
+    if config.y is None:
+        return "h"
+    if config.x is not None and not pd.api.types.is_numeric_dtype(data[config.y]):
+        return "h"
+    return "v"
+
+
+def _ordered_values(values: pd.Series, order) -> list:
+    """
+    Returns the unique values of a column, following `category_orders` first.
+    """
+    unique = list(pd.unique(values))
+    if not order:
+        return unique
+    return [v for v in order if v in unique] + [v for v in unique if v not in order]
+
+
+def _interp_rows(
+    x: np.ndarray, rows: np.ndarray, xp: np.ndarray, fp: np.ndarray
+) -> np.ndarray:
+    """
+    Interpolates each value of `x` on its own row of `xp` and `fp`.
+
+    Every row of `xp` must be increasing. Rows are rescaled to [0, 1] and
+    shifted apart, so all values are interpolated by one `numpy.interp` call.
+    Values outside their row take the value of the closest end.
+    """
+    low = xp[:, :1]
+    span = xp[:, -1:] - low
+    span = np.where(span > 0, span, 1.0)
+    offsets = 2.0 * np.arange(len(xp))[:, None]
+    flat_xp = ((xp - low) / span + offsets).ravel()
+    query = np.clip((x - low[rows, 0]) / span[rows, 0], 0, 1) + offsets[rows, 0]
+    return np.interp(query, flat_xp, fp.ravel())
+
+
+def violin_preprocess(data, plot_args, config):
+    """
+    Preprocess data and arguments to plot precomputed violins as filled paths.
+
+    This function estimates the density of every violin, i.e., every
+    combination of the category axis, `color` and facet columns, on a grid of
+    `kde_grid_size` points with `compute_kde_curves`, and turns it into a
+    closed outline. The quartiles from `compute_box_stats` are drawn as lines
+    across the violin (only the median if `box` is False), and at most
+    `max_points` sample points per violin are kept. Paths of the same color
+    are separated by missing values, so they are drawn by a single trace.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    plot_args : dict
+        Dictionary of arguments to be passed to the Plotly Express function.
+    config : ViolinConfig
+        The validated Pydantic model with all violin plot configurations.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - data : pd.DataFrame
+            The DataFrame with the outline, quartile and point coordinates.
+        - plot_args : dict
+            The plot arguments for `plotly.express.line`.
+
+    Notes
+    -----
+    The size of the resulting figure depends on the number of violins,
+    `kde_grid_size` and `max_points`, not on the number of rows of the input
+    data. Categories are placed at integer positions on a numeric axis,
+    labelled with the category names.
+    """
+    orientation = _infer_orientation(data, config)
+    if orientation == "v":
+        value_col, category_col = config.y, config.x
+    else:
+        value_col, category_col = config.x, config.y
+    category_orders = config.category_orders or {}
+    color_col = (
+        plot_args.get("color") if isinstance(plot_args.get("color"), str) else None
+    )
+    facet_cols = [
+        plot_args[param]
+        for param in ["facet_row", "facet_col"]
+        if isinstance(plot_args.get(param), str)
+    ]
+    group_cols = list(
+        dict.fromkeys(
+            ([category_col] if category_col else [])
+            + ([color_col] if color_col else [])
+            + facet_cols
+        )
+    )
+
+    stats = compute_box_stats(data, value_col=value_col, group_cols=group_cols)
+    curves = compute_kde_curves(
+        data,
+        value_col=value_col,
+        group_cols=group_cols,
+        grid_size=config.kde_grid_size,
+        bandwidth=config.kde_bandwidth,
+    )
+
+    # Category positions, and color offsets within a category slot
+    categories = (
+        _ordered_values(data[category_col], category_orders.get(category_col))
+        if category_col
+        else [""]
+    )
+    colors = (
+        _ordered_values(data[color_col], category_orders.get(color_col))
+        if color_col
+        else [None]
+    )
+    category_pos = {category: i for i, category in enumerate(categories)}
+    if config.violinmode == "group" and color_col and color_col != category_col:
+        slot = VIOLIN_SPAN / len(colors)
+        color_offset = {
+            color: (j - (len(colors) - 1) / 2) * slot for j, color in enumerate(colors)
+        }
+    else:
+        slot = VIOLIN_SPAN
+        color_offset = {color: 0.0 for color in colors}
+
+    # The category axis carries numeric positions, named after the category
+    # column unless that column is also needed to group the traces
+    pos_col = category_col or "position"
+    if category_col and category_col in [color_col] + facet_cols:
+        pos_col = "position"
+
+    # Both estimates list the groups in the same order, with one row per group
+    # in `stats` and `kde_grid_size` rows per group in `curves`
+    max_density = curves.groupby(
+        np.repeat(np.arange(len(stats)), config.kde_grid_size)
+    )["density"].max()
+
+    # One row per violin: grids, half widths and positions of the centers
+    n_violins, grid_size = len(stats), config.kde_grid_size
+    grid = curves[value_col].to_numpy(dtype=float).reshape(n_violins, grid_size)
+    half_width = (
+        curves["density"].to_numpy(dtype=float).reshape(n_violins, grid_size)
+        / max_density.to_numpy()[:, None]
+        * slot
+        / 2
+    )
+    violin_categories = (
+        stats[category_col].to_numpy() if category_col else np.full(n_violins, "")
+    )
+    violin_colors = stats[color_col].to_numpy() if color_col else [None] * n_violins
+    center = np.array(
+        [
+            category_pos[category] + color_offset[color]
+            for category, color in zip(violin_categories, violin_colors)
+        ]
+    )[:, None]
+
+    # Closed outline, then one line across the violin per quartile, each
+    # violin ending with a gap
+    quartiles = ["q1", "median", "q3"] if config.box else ["median"]
+    quartile_val = stats[quartiles].to_numpy(dtype=float)
+    quartile_width = _interp_rows(
+        quartile_val,
+        np.repeat(np.arange(n_violins)[:, None], len(quartiles), axis=1),
+        grid,
+        half_width,
+    )
+    gap = np.full((n_violins, len(quartiles)), np.nan)
+    line_pos = np.stack(
+        [gap, center - quartile_width, center + quartile_width], axis=2
+    ).reshape(n_violins, -1)
+    line_val = np.stack([gap, quartile_val, quartile_val], axis=2).reshape(
+        n_violins, -1
+    )
+    end = np.full((n_violins, 1), np.nan)
+    outline_pos = np.hstack([center + half_width, center - half_width[:, ::-1]])
+    outline_val = np.hstack([grid, grid[:, ::-1]])
+    violin_pos = np.hstack([outline_pos, outline_pos[:, :1], line_pos, end])
+    violin_val = np.hstack([outline_val, outline_val[:, :1], line_val, end])
+    pos = [violin_pos.ravel()]
+    val = [violin_val.ravel()]
+    owner = [np.repeat(np.arange(n_violins), violin_pos.shape[1])]
+    part = [np.full(violin_pos.size, "violin", dtype=object)]
+
+    if config.points:
+        # Sample values of each violin, numbered like the rows of `stats`
+        values = data[value_col].to_numpy(dtype=float)
+        if group_cols:
+            codes = (
+                data.groupby(group_cols, sort=False, dropna=False).ngroup().to_numpy()
+            )
+        else:
+            codes = np.zeros(len(data), dtype=int)
+        keep = ~np.isnan(values)
+        # Groups without values have no row in `stats`, so the codes are
+        # renumbered over the groups that have values, as in `compute_box_stats`
+        present, codes = np.unique(np.where(keep, codes, -1), return_inverse=True)
+        if len(present) and present[0] == -1:
+            codes = codes - 1
+        if config.points != "all":
+            lower = stats["lowerfence"].to_numpy(dtype=float)
+            upper = stats["upperfence"].to_numpy(dtype=float)
+            keep &= (values < lower[codes]) | (values > upper[codes])
+        values, codes = values[keep], codes[keep]
+
+        # At most `max_points` random points per violin: points are shuffled
+        # within each violin and ranked
+        rng = np.random.default_rng(0)
+        order = np.lexsort((rng.random(len(values)), codes))
+        values, codes = values[order], codes[order]
+        starts = np.searchsorted(codes, codes, side="left")
+        sampled = np.arange(len(codes)) - starts < config.max_points
+        values, codes = values[sampled], codes[sampled]
+
+        jitter = rng.uniform(-0.3, 0.3, len(values)) * _interp_rows(
+            values, codes, grid, half_width
+        )
+        pos.append(center[codes, 0] + jitter)
+        val.append(values)
+        owner.append(codes)
+        part.append(np.full(len(values), "points", dtype=object))
+
+    # Rows of each violin, outline first, then its points
+    owner = np.concatenate(owner)
+    order = np.argsort(owner, kind="stable")
+    owner = owner[order]
+    path_data = pd.DataFrame(
+        {
+            "pos": np.concatenate(pos)[order],
+            "val": np.concatenate(val)[order],
+            PART_COL: np.concatenate(part)[order],
+        }
+    )
+    for col in group_cols:
+        if col != pos_col:
+            path_data[col] = stats[col].to_numpy()[owner]
+    path_data[CATEGORY_COL] = violin_categories[owner]
+    path_data[CATEGORY_POS_COL] = np.array(
+        [category_pos[category] for category in violin_categories]
+    )[owner]
+    path_data = path_data.rename(columns={"pos": pos_col, "val": value_col})
+
+    plot_args = {k: v for k, v in plot_args.items() if k not in RAW_DATA_PARAMS}
+    if orientation == "v":
+        plot_args.update(x=pos_col, y=value_col)
+    else:
+        plot_args.update(x=value_col, y=pos_col)
+    plot_args["orientation"] = orientation
+    plot_args["line_group"] = PART_COL
+    # Filled paths with gaps are only closed per segment by SVG traces
+    plot_args["render_mode"] = "svg"
+    plot_args["custom_data"] = [PART_COL]
+
+    return path_data, plot_args
+
+
+def precomputed_violin(data: pd.DataFrame, **kwargs) -> go.Figure:
+    """
+    Creates a violin plot from the path DataFrame built by `violin_preprocess`.
+
+    The figure is laid out by `plotly.express.line`, then outline traces are
+    filled and point traces are switched to markers. The category axis shows
+    the category names at the violin positions.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The path DataFrame with the outline, quartile and point coordinates.
+    **kwargs
+        Arguments for `plotly.express.line`.
+
+    Returns
+    -------
+    go.Figure
+        A `plotly.graph_objects.Figure` object representing the violin plot.
+    """
+    orientation = kwargs.pop("orientation", "v")
+    fig = px.line(data, **kwargs)
+
+    for trace in fig.data:
+        part = trace.customdata[0][0] if trace.customdata is not None else "violin"
+        if part == "violin":
+            trace.update(fill="toself", hoverinfo="skip", customdata=None)
+        else:
+            trace.update(mode="markers", marker_size=3, customdata=None)
+
+    ticks = data[[CATEGORY_COL, CATEGORY_POS_COL]].drop_duplicates()
+    update_axes = fig.update_xaxes if orientation == "v" else fig.update_yaxes
+    update_axes(
+        tickmode="array",
+        tickvals=ticks[CATEGORY_POS_COL].tolist(),
+        ticktext=[str(category) for category in ticks[CATEGORY_COL]],
+    )
+
+    return fig
+
 
 def build(data: pd.DataFrame, config: ViolinConfig) -> go.Figure:
     """
@@ -36,6 +357,10 @@ def build(data: pd.DataFrame, config: ViolinConfig) -> go.Figure:
     is then customized with layout and theme settings using `plotly.graph_objects`.
     (https://plotly.com/python-api-reference/generated/plotly.express.violin.html).
 
+    If `precompute_kde` is set, the densities, quartiles and a subsample of
+    the points are computed in Python and drawn as filled paths, so the figure
+    size does not depend on the number of observations.
+
     Parameters
     ----------
     data : pd.DataFrame
@@ -48,6 +373,16 @@ def build(data: pd.DataFrame, config: ViolinConfig) -> go.Figure:
     go.Figure
         A `plotly.graph_objects.Figure` object representing the violin plot.
     """
+    if config.precompute_kde:
+        return build_plot(
+            data=data,
+            config=config,
+            px_function=precomputed_violin,
+            theming_function=apply_violin_theme,
+            theming_params=THEMING_PARAMS,
+            preprocess=violin_preprocess,
+        )
+
     return build_plot(
         data=data,
         config=config,
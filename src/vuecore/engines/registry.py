@@ -1,12 +1,28 @@
-from typing import Callable
+from importlib import import_module
+from typing import Callable, Union
 from vuecore import PlotType, EngineType
 
-# Registries to hold the functions from each backend
+# Registries to hold the functions from each backend. Entries are either
+# callables or lazy 'module:function' references, resolved on first use
 PLOT_BUILDERS = {}
 PLOT_SAVERS = {}
 
 
-def register_builder(plot_type: PlotType, engine: EngineType, func: Callable):
+def _resolve(func: Union[Callable, str]) -> Callable:
+    """
+    Imports the function behind a lazy 'module:function' reference.
+
+    Callables are returned unchanged.
+    """
+    if callable(func):
+        return func
+    module_path, _, attr = func.partition(":")
+    return getattr(import_module(module_path), attr)
+
+
+def register_builder(
+    plot_type: PlotType, engine: EngineType, func: Union[Callable, str]
+):
     """
     Registers a plot builder function for a given plot type and engine.
 
@@ -19,8 +35,11 @@ def register_builder(plot_type: PlotType, engine: EngineType, func: Callable):
         The type of plot (e.g., SCATTER).
     engine : EngineType
         The rendering engine (e.g., PLOTLY).
-    func : Callable
-        The plotting function to register for this type and engine.
+    func : Callable or str
+        The plotting function to register for this type and engine, or a
+        lazy 'module:function' reference (e.g.,
+        'vuecore.engines.plotly.scatter:build'). Lazy references are only
+        imported by the first `get_builder` call that needs them.
 
     Returns
     -------
@@ -31,7 +50,7 @@ def register_builder(plot_type: PlotType, engine: EngineType, func: Callable):
     PLOT_BUILDERS[engine][plot_type] = func
 
 
-def register_saver(engine: EngineType, func: Callable):
+def register_saver(engine: EngineType, func: Union[Callable, str]):
     """
     Registers a save function for a given engine.
 
@@ -42,8 +61,9 @@ def register_saver(engine: EngineType, func: Callable):
     ----------
     engine : EngineType
         The rendering engine for which to register the saver function.
-    func : Callable
-        The saving function to use for this engine.
+    func : Callable or str
+        The saving function to use for this engine, or a lazy
+        'module:function' reference, imported by the first `get_saver` call.
 
     Returns
     -------
@@ -76,9 +96,12 @@ def get_builder(plot_type: PlotType, engine: EngineType) -> Callable:
         If no function is found for the given plot type and engine.
     """
     try:
-        return PLOT_BUILDERS[engine][plot_type]
+        func = PLOT_BUILDERS[engine][plot_type]
     except KeyError:
         raise ValueError(f"No '{plot_type}' builder found for engine '{engine}'")
+    if not callable(func):
+        func = PLOT_BUILDERS[engine][plot_type] = _resolve(func)
+    return func
 
 
 def get_saver(engine: EngineType) -> Callable:
@@ -103,6 +126,9 @@ def get_saver(engine: EngineType) -> Callable:
         If no saver function is registered for the given engine.
     """
     try:
-        return PLOT_SAVERS[engine]
+        func = PLOT_SAVERS[engine]
     except KeyError:
         raise ValueError(f"No saver found for engine '{engine}'")
+    if not callable(func):
+        func = PLOT_SAVERS[engine] = _resolve(func)
+    return func
@@ -0,0 +1,35 @@
+# vuecore/network/__init__.py
+"""Scalable network analysis used by the network visualizations."""
+
+from .centrality import (
+    betweenness_centrality,
+    compute_centralities,
+    eigenvector_centrality,
+)
+from .communities import COMMUNITY_METHODS, detect_communities
+from .layout import (
+    LAYOUT_METHODS,
+    apply_layout,
+    compute_layout,
+    forceatlas2_layout,
+    graph_fingerprint,
+    spring_layout,
+)
+from .sparsify import SPARSIFY_STRATEGIES, register_sparsifier, sparsify_graph
+
+__all__ = [
+    "betweenness_centrality",
+    "eigenvector_centrality",
+    "compute_centralities",
+    "COMMUNITY_METHODS",
+    "detect_communities",
+    "LAYOUT_METHODS",
+    "apply_layout",
+    "compute_layout",
+    "forceatlas2_layout",
+    "graph_fingerprint",
+    "spring_layout",
+    "SPARSIFY_STRATEGIES",
+    "register_sparsifier",
+    "sparsify_graph",
+]
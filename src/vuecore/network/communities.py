@@ -0,0 +1,78 @@
+import time
+from typing import Dict, Hashable, Optional
+
+import networkx as nx
+
+# Community detection methods supported by `detect_communities`
+COMMUNITY_METHODS = ("louvain", "label_propagation", "greedy_modularity")
+
+
+def detect_communities(
+    graph: nx.Graph,
+    method: str = "louvain",
+    weight: Optional[str] = None,
+    time_budget: Optional[float] = None,
+    seed: int = 0,
+) -> Dict[Hashable, int]:
+    """
+    Assigns each node of a graph to a community.
+
+    Louvain builds a hierarchy of partitions, one level at a time. With a
+    `time_budget`, no new level is started once the budget is spent and the
+    last complete level is returned, so large graphs get a finer (but still
+    modularity-optimized) partition instead of a long wait. Label propagation
+    is linear in the number of edges and suits very large graphs. It uses
+    the fast, weighted variant of networkx 3.2 and later, and falls back to
+    the unweighted semi-synchronous variant with older versions.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    method : str, optional
+        Community detection method: 'louvain', 'label_propagation' or
+        'greedy_modularity'. Defaults to 'louvain'.
+    weight : str, optional
+        Non-negative edge attribute used as weight. If None, all edges have
+        weight 1.
+    time_budget : float, optional
+        Time in seconds after which Louvain starts no new level.
+    seed : int, optional
+        Seed of the randomized methods, by default 0.
+
+    Returns
+    -------
+    Dict[Hashable, int]
+        Community of each node, numbered from 0 by decreasing community size.
+
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the supported methods.
+    """
+    if method == "louvain":
+        start = time.perf_counter()
+        communities = [set(graph)]
+        for communities in nx.community.louvain_partitions(
+            graph, weight=weight, seed=seed
+        ):
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+    elif method == "label_propagation":
+        if hasattr(nx.community, "fast_label_propagation_communities"):
+            communities = nx.community.fast_label_propagation_communities(
+                graph, weight=weight, seed=seed
+            )
+        else:
+            # networkx < 3.2 only has the semi-synchronous variant
+            communities = nx.community.label_propagation_communities(graph)
+    elif method == "greedy_modularity":
+        communities = nx.community.greedy_modularity_communities(graph, weight=weight)
+    else:
+        raise ValueError(
+            f"Unsupported community detection method: '{method}'. "
+            f"Supported methods: {', '.join(COMMUNITY_METHODS)}"
+        )
+
+    communities = sorted(communities, key=len, reverse=True)
+    return {node: i for i, members in enumerate(communities) for node in members}
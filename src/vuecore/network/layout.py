@@ -0,0 +1,408 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+# Node layout algorithms supported by `compute_layout`
+LAYOUT_METHODS = ("spring", "forceatlas2", "spectral")
+
+# Maximum number of layouts kept by `compute_layout`
+LAYOUT_CACHE_SIZE = 32
+
+_layout_cache: "OrderedDict[str, Dict[Hashable, Tuple[float, float]]]" = OrderedDict()
+_layout_cache_lock = threading.Lock()
+
+
+def graph_fingerprint(graph: nx.Graph, weight: Optional[str] = None) -> str:
+    """
+    Computes a content-based key for a graph structure.
+
+    The key combines the nodes, the edges and, optionally, one edge attribute,
+    so equal graphs map to the same key regardless of object identity.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    weight : str, optional
+        Edge attribute included in the key.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest identifying the graph.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{type(graph).__name__}|{graph.is_directed()}".encode())
+    digest.update(repr(list(graph.nodes())).encode())
+    if weight is None:
+        digest.update(repr(list(graph.edges())).encode())
+    else:
+        digest.update(repr(list(graph.edges(data=weight))).encode())
+    return digest.hexdigest()
+
+
+def _edge_arrays(graph: nx.Graph, weight: Optional[str]):
+    """
+    Returns the node list and the endpoint positions and absolute weights of the edges.
+    """
+    nodes = list(graph)
+    positions = {node: i for i, node in enumerate(nodes)}
+    edges = [
+        (positions[u], positions[v], w)
+        for u, v, w in graph.edges(data=weight, default=1.0)
+        if u != v
+    ]
+    sources = np.array([u for u, _, _ in edges], dtype=int)
+    targets = np.array([v for _, v, _ in edges], dtype=int)
+    weights = np.nan_to_num(np.abs(np.array([w for _, _, w in edges], dtype=float)))
+    return nodes, sources, targets, weights
+
+
+def _force_directed(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    mass: np.ndarray,
+    repulsion: float,
+    attraction: float,
+    attraction_power: int,
+    gravity: float,
+    iterations: int,
+    grid_size: int,
+    pos: np.ndarray,
+) -> np.ndarray:
+    """
+    Runs a force-directed simulation with Barnes-Hut approximated repulsion.
+
+    Nodes i and j repel each other with a force `repulsion * m_i * m_j / d`,
+    edges pull their endpoints with a force `attraction * w * d**power` and a
+    gravity `gravity * m_i` pulls every node toward the center. For the
+    repulsion, nodes are binned on a `grid_size` x `grid_size` grid and each
+    node is repelled by the center of mass of every occupied cell, with its
+    own cell corrected to exclude the node itself (one level of Barnes-Hut),
+    so an iteration costs O(n * grid_size²) instead of O(n²). Displacements
+    are capped by a temperature that cools linearly.
+    """
+    n_nodes = len(pos)
+    x, y = pos[:, 0].copy(), pos[:, 1].copy()
+    n_cells = grid_size * grid_size
+    block = max(1, 2**21 // n_cells)
+    for iteration in range(iterations):
+        # Mass and center of mass of the occupied cells
+        low_x, low_y = x.min(), y.min()
+        span = max(x.max() - low_x, y.max() - low_y, 1e-9)
+        cell_x = np.clip(((x - low_x) / span * grid_size).astype(int), 0, grid_size - 1)
+        cell_y = np.clip(((y - low_y) / span * grid_size).astype(int), 0, grid_size - 1)
+        cell_ids = cell_x * grid_size + cell_y
+        cell_mass = np.bincount(cell_ids, mass, n_cells)
+        occupied = np.flatnonzero(cell_mass)
+        cell_mass = cell_mass[occupied]
+        center_x = np.bincount(cell_ids, mass * x, n_cells)[occupied] / cell_mass
+        center_y = np.bincount(cell_ids, mass * y, n_cells)[occupied] / cell_mass
+        own = np.searchsorted(occupied, cell_ids)
+
+        # Repulsion from the center of mass of every cell
+        force_x = np.empty(n_nodes)
+        force_y = np.empty(n_nodes)
+        for start in range(0, n_nodes, block):
+            rows = slice(start, start + block)
+            dx = x[rows, None] - center_x[None, :]
+            dy = y[rows, None] - center_y[None, :]
+            strength = cell_mass / np.maximum(dx * dx + dy * dy, 1e-9)
+            force_x[rows] = (strength * dx).sum(axis=1)
+            force_y[rows] = (strength * dy).sum(axis=1)
+
+        # Own cell: replace its center of mass by the one without the node
+        own_mass = cell_mass[own]
+        dx, dy = x - center_x[own], y - center_y[own]
+        strength = own_mass / np.maximum(dx * dx + dy * dy, 1e-9)
+        force_x -= strength * dx
+        force_y -= strength * dy
+        rest_mass = own_mass - mass
+        has_rest = rest_mass > 1e-9 * own_mass
+        safe_rest = np.where(has_rest, rest_mass, 1.0)
+        dx = x - (own_mass * center_x[own] - mass * x) / safe_rest
+        dy = y - (own_mass * center_y[own] - mass * y) / safe_rest
+        strength = np.where(has_rest, rest_mass, 0.0) / np.maximum(
+            dx * dx + dy * dy, 1e-9
+        )
+        force_x = repulsion * mass * (force_x + strength * dx)
+        force_y = repulsion * mass * (force_y + strength * dy)
+
+        # Attraction along the edges
+        dx = x[sources] - x[targets]
+        dy = y[sources] - y[targets]
+        pull = attraction * weights
+        if attraction_power != 1:
+            pull = pull * np.hypot(dx, dy) ** (attraction_power - 1)
+        force_x += np.bincount(targets, pull * dx, n_nodes) - np.bincount(
+            sources, pull * dx, n_nodes
+        )
+        force_y += np.bincount(targets, pull * dy, n_nodes) - np.bincount(
+            sources, pull * dy, n_nodes
+        )
+
+        # Gravity toward the center
+        norm = np.maximum(np.hypot(x, y), 1e-9)
+        force_x -= gravity * mass * x / norm
+        force_y -= gravity * mass * y / norm
+
+        temperature = 0.1 * span * (1 - iteration / iterations) + 1e-6 * span
+        length = np.maximum(np.hypot(force_x, force_y), 1e-12)
+        step = np.minimum(length, temperature) / length
+        x += force_x * step
+        y += force_y * step
+
+    pos = np.stack([x, y], axis=1)
+    pos -= pos.mean(axis=0)
+    return pos / max(np.abs(pos).max(), 1e-9)
+
+
+def forceatlas2_layout(
+    graph: nx.Graph,
+    weight: Optional[str] = None,
+    iterations: int = 100,
+    scaling: float = 2.0,
+    gravity: float = 1.0,
+    grid_size: int = 24,
+    seed: int = 0,
+) -> Dict[Hashable, Tuple[float, float]]:
+    """
+    Computes a ForceAtlas2-style layout with Barnes-Hut approximated repulsion.
+
+    As in ForceAtlas2 (Jacomy et al., 2014), nodes repel each other in
+    proportion to their degrees, edges attract their endpoints linearly and
+    a gravity pulls nodes toward the center. The repulsion is approximated
+    with one level of Barnes-Hut on a `grid_size` x `grid_size` grid, so an
+    iteration costs O(n * grid_size²) instead of O(n²).
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    weight : str, optional
+        Edge attribute scaling the attraction. Absolute values are used. If
+        None, all edges have weight 1.
+    iterations : int, optional
+        Number of iterations, by default 100.
+    scaling : float, optional
+        Strength of the repulsion, by default 2.0.
+    gravity : float, optional
+        Strength of the gravity, by default 1.0.
+    grid_size : int, optional
+        Number of cells per axis of the Barnes-Hut grid, by default 24.
+    seed : int, optional
+        Seed of the initial positions, by default 0.
+
+    Returns
+    -------
+    Dict[Hashable, Tuple[float, float]]
+        Position of each node, centered and scaled to [-1, 1].
+    """
+    nodes, sources, targets, weights = _edge_arrays(graph, weight)
+    n_nodes = len(nodes)
+    if n_nodes <= 1:
+        return {node: (0.0, 0.0) for node in nodes}
+    mass = 1.0 + np.bincount(sources, minlength=n_nodes)
+    mass += np.bincount(targets, minlength=n_nodes)
+    pos = np.random.default_rng(seed).uniform(-1, 1, (n_nodes, 2)) * np.sqrt(n_nodes)
+    pos = _force_directed(
+        sources,
+        targets,
+        weights,
+        mass,
+        repulsion=scaling,
+        attraction=1.0,
+        attraction_power=1,
+        gravity=gravity,
+        iterations=iterations,
+        grid_size=grid_size,
+        pos=pos,
+    )
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, pos)}
+
+
+def spring_layout(
+    graph: nx.Graph,
+    weight: Optional[str] = None,
+    iterations: int = 100,
+    k: Optional[float] = None,
+    grid_size: int = 24,
+    seed: int = 0,
+) -> Dict[Hashable, Tuple[float, float]]:
+    """
+    Computes a Fruchterman-Reingold spring layout with sparse edge forces.
+
+    Edges pull their endpoints with a force `d² / k` and all node pairs
+    repel each other with a force `k² / d`, approximated with one level of
+    Barnes-Hut on a `grid_size` x `grid_size` grid. The edge forces only
+    use the edge list, so an iteration costs O(m + n * grid_size²). Graphs
+    with less than 500 nodes use `networkx.spring_layout`.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    weight : str, optional
+        Edge attribute scaling the attraction. Absolute values are used. If
+        None, all edges have weight 1.
+    iterations : int, optional
+        Number of iterations, by default 100.
+    k : float, optional
+        Optimal distance between nodes. Defaults to 1 / sqrt(n).
+    grid_size : int, optional
+        Number of cells per axis of the Barnes-Hut grid, by default 24.
+    seed : int, optional
+        Seed of the initial positions, by default 0.
+
+    Returns
+    -------
+    Dict[Hashable, Tuple[float, float]]
+        Position of each node, centered and scaled to [-1, 1].
+    """
+    if graph.number_of_nodes() < 500:
+        layout = nx.spring_layout(
+            graph, k=k, iterations=iterations, weight=weight, seed=seed
+        )
+        return {node: (float(x), float(y)) for node, (x, y) in layout.items()}
+
+    nodes, sources, targets, weights = _edge_arrays(graph, weight)
+    n_nodes = len(nodes)
+    k = 1.0 / np.sqrt(n_nodes) if k is None else k
+    pos = np.random.default_rng(seed).uniform(0, 1, (n_nodes, 2))
+    pos = _force_directed(
+        sources,
+        targets,
+        weights,
+        np.ones(n_nodes),
+        repulsion=k * k,
+        attraction=1.0 / k,
+        attraction_power=2,
+        gravity=0.1 * k,
+        iterations=iterations,
+        grid_size=grid_size,
+        pos=pos,
+    )
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, pos)}
+
+
+def compute_layout(
+    graph: nx.Graph,
+    method: str = "spring",
+    weight: Optional[str] = None,
+    seed: int = 0,
+    cache: bool = True,
+    **kwargs,
+) -> Dict[Hashable, Tuple[float, float]]:
+    """
+    Computes node positions on the server, with a cache keyed by graph fingerprint.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    method : str, optional
+        Layout algorithm: 'spring' (see `spring_layout`), 'forceatlas2'
+        (see `forceatlas2_layout`) or 'spectral' (eigenvectors of the sparse
+        Laplacian, from 500 nodes). Defaults to 'spring'.
+    weight : str, optional
+        Edge attribute used as weight. Use a non-negative attribute (e.g.,
+        'edgewidth'). If None, all edges have weight 1.
+    seed : int, optional
+        Seed of the initial positions, by default 0.
+    cache : bool, optional
+        If True (default), layouts are cached by graph fingerprint, method
+        and parameters, so identical graphs are laid out once.
+    **kwargs
+        Additional arguments of the layout algorithm.
+
+    Returns
+    -------
+    Dict[Hashable, Tuple[float, float]]
+        Position of each node, roughly within [-1, 1].
+
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the supported algorithms.
+    """
+    if method not in LAYOUT_METHODS:
+        raise ValueError(
+            f"Unsupported layout method: '{method}'. "
+            f"Supported methods: {', '.join(LAYOUT_METHODS)}"
+        )
+    key = None
+    if cache:
+        key = "|".join(
+            [
+                graph_fingerprint(graph, weight),
+                method,
+                str(weight),
+                str(seed),
+                repr(sorted(kwargs.items())),
+            ]
+        )
+        with _layout_cache_lock:
+            if key in _layout_cache:
+                _layout_cache.move_to_end(key)
+                return _layout_cache[key]
+
+    if method == "spring":
+        layout = spring_layout(graph, weight=weight, seed=seed, **kwargs)
+    elif method == "forceatlas2":
+        layout = forceatlas2_layout(graph, weight=weight, seed=seed, **kwargs)
+    else:
+        layout = nx.spectral_layout(graph, weight=weight, **kwargs)
+    layout = {node: (float(x), float(y)) for node, (x, y) in layout.items()}
+
+    if key is not None:
+        with _layout_cache_lock:
+            _layout_cache[key] = layout
+            while len(_layout_cache) > LAYOUT_CACHE_SIZE:
+                _layout_cache.popitem(last=False)
+    return layout
+
+
+def apply_layout(
+    elements: List[dict],
+    layout: Dict[Hashable, Tuple[float, float]],
+    width: float = 1000.0,
+    height: float = 1000.0,
+) -> List[dict]:
+    """
+    Writes static positions into Cytoscape elements.
+
+    Node elements (those without 'source' in their data) get a 'position'
+    entry, scaled to a `width` x `height` canvas, so Cytoscape can render
+    them with the 'preset' layout instead of simulating a layout in the
+    browser.
+
+    Parameters
+    ----------
+    elements : List[dict]
+        Cytoscape elements, e.g., from `utils_old.networkx_to_cytoscape`.
+    layout : Dict[Hashable, Tuple[float, float]]
+        Position of each node, within [-1, 1], as returned by `compute_layout`.
+    width : float, optional
+        Width of the canvas in pixels, by default 1000.
+    height : float, optional
+        Height of the canvas in pixels, by default 1000.
+
+    Returns
+    -------
+    List[dict]
+        The elements, modified in place.
+    """
+    by_id = {str(node): xy for node, xy in layout.items()}
+    for element in elements:
+        data = element.get("data", {})
+        if "source" in data or str(data.get("id")) not in by_id:
+            continue
+        x, y = by_id[str(data["id"])]
+        # Screen coordinates grow downwards
+        element["position"] = {"x": x * width / 2, "y": -y * height / 2}
+    return elements
@@ -0,0 +1,228 @@
+from typing import Callable, Dict, Optional
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import minimum_spanning_tree
+
+# Edge ranking functions of the sparsification strategies, by name
+SPARSIFY_STRATEGIES: Dict[str, Callable] = {}
+
+
+def register_sparsifier(name: str, strategy: Callable) -> None:
+    """
+    Registers a sparsification strategy.
+
+    A strategy ranks the edges of a graph by importance. It is called as
+    `strategy(graph, sources, targets, weights)`, where `sources` and
+    `targets` are the positions of the edge endpoints in `list(graph)` and
+    `weights` are the absolute edge weights, and returns one sort key per
+    edge: edges with lower keys are kept first.
+
+    Parameters
+    ----------
+    name : str
+        The name used to select the strategy in `sparsify_graph`.
+    strategy : Callable
+        The edge ranking function.
+    """
+    SPARSIFY_STRATEGIES[name] = strategy
+
+
+def _edge_ranks(sources: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+    """
+    Returns, for each edge, its rank by weight among the edges of each endpoint.
+    """
+    n_edges = len(weights)
+    ends = np.concatenate([sources, targets])
+    order = np.lexsort((-np.tile(weights, 2), ends))
+    sorted_ends = ends[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ends[1:] != sorted_ends[:-1]])
+    counts = np.diff(np.append(starts, len(ends)))
+    ranks = np.empty(len(ends), dtype=np.int64)
+    ranks[order] = np.arange(len(ends)) - np.repeat(starts, counts)
+    return ranks[:n_edges], ranks[n_edges:]
+
+
+def topk_ranking(
+    graph: nx.Graph, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Ranks edges by their best rank among the strongest edges of their endpoints.
+
+    Keeping the edges with rank below k keeps the k strongest edges of every
+    node, so weakly connected nodes keep their best links next to the hubs.
+    """
+    source_ranks, target_ranks = _edge_ranks(sources, targets, weights)
+    best_rank = np.minimum(source_ranks, target_ranks)
+    return np.lexsort((-weights, best_rank))
+
+
+def backbone_ranking(
+    graph: nx.Graph, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Ranks edges by the p-value of the disparity filter (Serrano et al., 2009).
+
+    An edge is significant for a node if it carries more of the node strength
+    than expected when the strength is split uniformly among its edges.
+    """
+    n_nodes = graph.number_of_nodes()
+    strength = np.bincount(sources, weights, n_nodes) + np.bincount(
+        targets, weights, n_nodes
+    )
+    degree = np.bincount(sources, minlength=n_nodes) + np.bincount(
+        targets, minlength=n_nodes
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = [
+            np.where(
+                degree[ends] > 1,
+                (1 - np.nan_to_num(weights / strength[ends])) ** (degree[ends] - 1),
+                1.0,
+            )
+            for ends in (sources, targets)
+        ]
+    return np.lexsort((-weights, np.minimum(*alpha)))
+
+
+def kcore_ranking(
+    graph: nx.Graph, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Ranks edges by the core number of their endpoints, then by weight.
+
+    Keeping the edges of the highest cores keeps the densest part of the
+    network.
+    """
+    graph = nx.Graph(graph)
+    graph.remove_edges_from(nx.selfloop_edges(graph))
+    core_number = nx.core_number(graph)
+    core = np.array([core_number[n] for n in graph])
+    edge_core = np.minimum(core[sources], core[targets])
+    return np.lexsort((-weights, -edge_core))
+
+
+def mst_ranking(
+    graph: nx.Graph, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Ranks the edges of the maximum spanning forest first, then the strongest edges.
+
+    The spanning forest keeps every connected component in one piece, and the
+    strongest remaining edges add the most important cycles.
+    """
+    n_nodes = graph.number_of_nodes()
+    # Spanning tree edges must have positive costs, decreasing with the weight
+    costs = weights.max() + 1.0 - weights if len(weights) else weights
+    matrix = coo_matrix((costs, (sources, targets)), shape=(n_nodes, n_nodes))
+    tree = minimum_spanning_tree(matrix.tocsr()).tocoo()
+    in_tree = np.zeros(len(weights), dtype=bool)
+    lookup = {pair: i for i, pair in enumerate(zip(sources, targets))}
+    for u, v in zip(tree.row, tree.col):
+        i = lookup.get((u, v), lookup.get((v, u)))
+        if i is not None:
+            in_tree[i] = True
+    return np.lexsort((-weights, ~in_tree))
+
+
+register_sparsifier("topk", topk_ranking)
+register_sparsifier("backbone", backbone_ranking)
+register_sparsifier("kcore", kcore_ranking)
+register_sparsifier("mst", mst_ranking)
+
+
+def sparsify_graph(
+    graph: nx.Graph,
+    strategy: str = "topk",
+    max_nodes: Optional[int] = 150,
+    max_edges: Optional[int] = 500,
+    weight: Optional[str] = "edgewidth",
+) -> nx.Graph:
+    """
+    Returns the most important subgraph within node and edge budgets.
+
+    The `max_nodes` nodes with the largest strength (sum of absolute edge
+    weights) are kept, so the hubs are always shown. The edges between them
+    are then ranked by the chosen strategy and the best `max_edges` are kept,
+    so the rendered network has a predictable size.
+
+    Parameters
+    ----------
+    graph : nx.Graph
+        The graph.
+    strategy : str, optional
+        The name of a registered strategy: 'topk' (strongest edges of every
+        node), 'backbone' (disparity filter), 'kcore' (densest cores) or
+        'mst' (maximum spanning forest plus strongest edges). Defaults to
+        'topk'.
+    max_nodes : int, optional
+        Maximum number of nodes. If None, the number of nodes is unbounded.
+    max_edges : int, optional
+        Maximum number of edges. If None, the number of edges is unbounded.
+    weight : str, optional
+        Edge attribute used as importance. Absolute values are used. If None,
+        or for edges without it, the weight is 1.
+
+    Returns
+    -------
+    nx.Graph
+        A subgraph of `graph` (a copy, with all attributes).
+
+    Raises
+    ------
+    ValueError
+        If `strategy` is not registered.
+    """
+    if strategy not in SPARSIFY_STRATEGIES:
+        raise ValueError(
+            f"Unsupported sparsification strategy: '{strategy}'. "
+            f"Supported strategies: {', '.join(SPARSIFY_STRATEGIES)}"
+        )
+    n_nodes = graph.number_of_nodes()
+    n_edges = graph.number_of_edges()
+    if (max_nodes is None or n_nodes <= max_nodes) and (
+        max_edges is None or n_edges <= max_edges
+    ):
+        return graph.copy()
+
+    nodes = list(graph)
+    positions = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges(data=weight, default=1.0))
+    sources = np.fromiter((positions[u] for u, _, _ in edges), int, n_edges)
+    targets = np.fromiter((positions[v] for _, v, _ in edges), int, n_edges)
+    weights = np.abs(np.fromiter((w for _, _, w in edges), float, n_edges))
+    weights = np.nan_to_num(weights)
+
+    # The node budget keeps the nodes with the largest strength (the hubs)
+    kept_nodes = nodes
+    ranked_graph = graph
+    if max_nodes is not None and n_nodes > max_nodes:
+        strength = np.bincount(sources, weights, n_nodes) + np.bincount(
+            targets, weights, n_nodes
+        )
+        selected = np.zeros(n_nodes, dtype=bool)
+        selected[np.argsort(-strength, kind="stable")[:max_nodes]] = True
+        kept_nodes = [node for node, keep in zip(nodes, selected) if keep]
+        inside = np.flatnonzero(selected[sources] & selected[targets])
+        edges = [edges[i] for i in inside]
+        # Positions of the endpoints in the list of kept nodes
+        positions = np.cumsum(selected) - 1
+        sources, targets = positions[sources[inside]], positions[targets[inside]]
+        weights = weights[inside]
+        # Strategies index nodes by their position in `list(graph)`, which a
+        # subgraph view does not keep, so the kept nodes are added in order
+        ranked_graph = graph.__class__()
+        ranked_graph.add_nodes_from(kept_nodes)
+        ranked_graph.add_edges_from(edge[:2] for edge in edges)
+
+    order = SPARSIFY_STRATEGIES[strategy](ranked_graph, sources, targets, weights)
+    if max_edges is not None:
+        order = order[:max_edges]
+    kept_edges = [edges[i][:2] for i in order]
+    if max_nodes is None:
+        # Without a node budget, nodes left without edges are dropped
+        return graph.edge_subgraph(kept_edges).copy()
+    subgraph = nx.create_empty_copy(graph.subgraph(kept_nodes))
+    subgraph.add_edges_from((u, v, graph.edges[u, v]) for u, v in kept_edges)
+    return subgraph
@@ -1,4 +1,5 @@
 # vuecore/plots/__init__.py
 from .plot_factory import create_plot
+from .batch import PlotResult, PlotSpec, create_plots
 
-__all__ = ["create_plot"]
+__all__ = ["create_plot", "create_plots", "PlotSpec", "PlotResult"]
@@ -1,6 +1,7 @@
 # vuecore/plots/basic/__init__.py
 from .bar import create_bar_plot
 from .box import create_box_plot
+from .clustermap import create_clustermap_plot
 from .histogram import create_histogram_plot
 from .line import create_line_plot
 from .scatter import create_scatter_plot
@@ -9,6 +10,7 @@ from .violin import create_violin_plot
 __all__ = [
     "create_bar_plot",
     "create_box_plot",
+    "create_clustermap_plot",
     "create_line_plot",
     "create_scatter_plot",
     "create_histogram_plot",
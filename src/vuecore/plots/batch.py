@@ -0,0 +1,323 @@
+import importlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Type, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from vuecore import EngineType, PlotType
+from vuecore.constants import OutputFileFormat
+from vuecore.engines import get_builder, get_saver
+
+# Characters allowed in the file names derived from group keys
+_UNSAFE_FILE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+# DataFrame shared by the tasks of a worker process, set by `_init_worker`
+_WORKER_DATA: Optional[pd.DataFrame] = None
+
+
+class PlotSpec(NamedTuple):
+    """
+    Specification of one figure of a batch.
+
+    Attributes
+    ----------
+    plot_type : PlotType
+        The plot type from the `PlotType` enum.
+    kwargs : dict
+        Keyword arguments for the plot configuration.
+    file_path : str, optional
+        If provided, the path where the figure will be saved.
+    rows : np.ndarray, optional
+        Positions of the rows of the DataFrame used by this figure. All rows
+        are used if None.
+    key : Any, optional
+        Identifier of the figure, e.g., the group key in group-by mode.
+    """
+
+    plot_type: PlotType
+    kwargs: dict
+    file_path: Optional[str] = None
+    rows: Optional[np.ndarray] = None
+    key: Any = None
+
+
+class PlotResult(NamedTuple):
+    """
+    Outcome of one figure of a batch.
+
+    Attributes
+    ----------
+    key : Any
+        Identifier of the figure: the group key in group-by mode, or the
+        position of the spec in the list of specs.
+    figure : Any
+        The plot object returned by the engine, or None if building failed.
+    file_path : str, optional
+        The path where the figure was saved, if any.
+    error : Exception, optional
+        The exception raised while validating, building or saving the
+        figure, or None on success.
+    """
+
+    key: Any
+    figure: Any = None
+    file_path: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+@lru_cache(maxsize=None)
+def get_plot_config(plot_type: PlotType) -> Type[BaseModel]:
+    """
+    Returns the Pydantic config class of a plot type.
+
+    The class is looked up in the schema module of the plot type, e.g.,
+    `ScatterConfig` in `vuecore.schemas.basic.scatter`, so new plot types
+    need no registration here.
+
+    Parameters
+    ----------
+    plot_type : PlotType
+        The plot type from the `PlotType` enum.
+
+    Returns
+    -------
+    Type[BaseModel]
+        The configuration model of the plot type.
+
+    Raises
+    ------
+    ValueError
+        If the plot type has no schema module or config class.
+    """
+    plot_type = PlotType(plot_type)
+    try:
+        module = importlib.import_module(f"vuecore.schemas.basic.{plot_type.value}")
+        return getattr(module, f"{plot_type.value.capitalize()}Config")
+    except (ImportError, AttributeError) as error:
+        raise ValueError(
+            f"No configuration schema found for plot type '{plot_type}'."
+        ) from error
+
+
+def _file_stem(key: Any) -> str:
+    """
+    Converts a group key into a file name without path separators.
+    """
+    name = "_".join(map(str, key)) if isinstance(key, tuple) else str(key)
+    # Dots are kept inside names only, so keys like '..' cannot leave the folder
+    return _UNSAFE_FILE_CHARS.sub("_", name).strip(".") or "_"
+
+
+def _init_worker(data: pd.DataFrame) -> None:
+    """
+    Stores the shared DataFrame in a worker process, so it is sent only once.
+    """
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+
+def _build_one(task: tuple, data: Optional[pd.DataFrame] = None) -> PlotResult:
+    """
+    Builds, and optionally saves, one validated figure of a batch.
+
+    The rows are taken from `data`, or from the DataFrame of the worker
+    process if None. Errors are returned in the result instead of raised, so
+    one failing figure does not abort the batch.
+    """
+    key, plot_type, config, engine, file_path, rows = task
+    if data is None:
+        data = _WORKER_DATA
+    if rows is not None:
+        data = data.iloc[rows]
+    try:
+        figure = get_builder(plot_type=plot_type, engine=engine)(data, config)
+        if file_path:
+            get_saver(engine=engine)(figure, file_path)
+    except Exception as error:
+        return PlotResult(key=key, file_path=file_path, error=error)
+    return PlotResult(key=key, figure=figure, file_path=file_path)
+
+
+def _as_spec(spec: Union[PlotSpec, tuple, dict]) -> PlotSpec:
+    """
+    Converts a (plot_type, kwargs[, file_path]) tuple or a dict into a `PlotSpec`.
+    """
+    if isinstance(spec, PlotSpec):
+        return spec
+    if isinstance(spec, dict):
+        return PlotSpec(**spec)
+    return PlotSpec(*spec)
+
+
+def _group_specs(
+    data: pd.DataFrame,
+    group_by: Union[str, List[str]],
+    plot_type: PlotType,
+    kwargs: Dict[str, Any],
+    save_dir: Optional[str],
+    file_format: str,
+) -> List[PlotSpec]:
+    """
+    Creates one spec per group of `group_by`, with the group rows and key.
+    """
+    specs = []
+    used_names = set()
+    groups = data.groupby(group_by, sort=True, dropna=False).indices
+    for key, rows in groups.items():
+        file_path = None
+        if save_dir is not None:
+            stem = name = _file_stem(key)
+            # Keys that differ only by unsafe characters get numbered names
+            suffix = 1
+            while name.lower() in used_names:
+                name = f"{stem}_{suffix}"
+                suffix += 1
+            used_names.add(name.lower())
+            file_path = str(Path(save_dir) / f"{name}.{file_format}")
+        specs.append(
+            PlotSpec(plot_type, dict(kwargs), file_path=file_path, rows=rows, key=key)
+        )
+    return specs
+
+
+def create_plots(
+    data: pd.DataFrame,
+    specs: Optional[Sequence[Union[PlotSpec, tuple, dict]]] = None,
+    plot_type: Optional[PlotType] = None,
+    group_by: Optional[Union[str, List[str]]] = None,
+    engine: EngineType = EngineType.PLOTLY,
+    n_jobs: Optional[int] = 1,
+    save_dir: Optional[str] = None,
+    file_format: str = OutputFileFormat.HTML,
+    raise_errors: bool = False,
+    **kwargs,
+) -> List[PlotResult]:
+    """
+    Creates, styles, and optionally saves many plots from one DataFrame.
+
+    The figures are either described by a list of specs, or created once per
+    group of the `group_by` column(s) with the same `plot_type` and `kwargs`.
+    All configurations are validated before any figure is built, then the
+    figures are built (and saved) in a pool of `n_jobs` worker processes. The
+    DataFrame is sent once to each worker, and each task only carries its
+    configuration and the positions of its rows.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the data to be plotted.
+    specs : Sequence of PlotSpec, tuple or dict, optional
+        The figures to create, as `PlotSpec` objects, (plot_type, kwargs) or
+        (plot_type, kwargs, file_path) tuples, or dicts with the `PlotSpec`
+        fields. Mutually exclusive with `group_by`.
+    plot_type : PlotType, optional
+        The plot type used for every group in group-by mode.
+    group_by : str or List[str], optional
+        Column(s) splitting the DataFrame into one figure per group.
+    engine : EngineType, optional
+        The plotting engine to use for rendering the plots.
+        Defaults to `EngineType.PLOTLY`.
+    n_jobs : int, optional
+        Number of worker processes. If 1, the figures are built sequentially
+        in the current process. If None, all CPUs are used. Defaults to 1.
+    save_dir : str, optional
+        In group-by mode, the directory where each figure is saved, named
+        after its group key. Characters other than letters, digits, '.', '_'
+        and '-' are replaced by '_' in the file names. Not allowed with
+        `specs`, whose figures are saved to their own `file_path`.
+    file_format : str, optional
+        In group-by mode, the extension of the saved files. Defaults to 'html'.
+    raise_errors : bool, optional
+        If True, the first error (in spec order) is raised after the batch
+        completes, instead of being reported in the results.
+    **kwargs
+        In group-by mode, keyword arguments for the plot configuration.
+
+    Returns
+    -------
+    List[PlotResult]
+        One result per spec or group, in the order of the specs (or of the
+        sorted group keys), with either the figure or the error.
+
+    Raises
+    ------
+    ValueError
+        If both or neither of `specs` and `group_by` are given, if
+        `plot_type` is missing in group-by mode, or if `save_dir` is given
+        with `specs`.
+
+    Notes
+    -----
+    Figures built in worker processes are sent back with Plotly's pickling,
+    which stores numeric arrays as base64-encoded typed arrays. They render
+    and save exactly like figures built in the current process.
+
+    Examples
+    --------
+    >>> results = create_plots(
+    ...     data,
+    ...     plot_type=PlotType.SCATTER,
+    ...     group_by="protein",
+    ...     x="log2FC",
+    ...     y="pvalue",
+    ...     n_jobs=4,
+    ... )
+    >>> figures = {r.key: r.figure for r in results if r.error is None}
+    """
+    if (specs is None) == (group_by is None):
+        raise ValueError("Provide either `specs` or `group_by`, but not both.")
+    if specs is not None and save_dir is not None:
+        raise ValueError(
+            "`save_dir` is only used in group-by mode. Set the `file_path` of "
+            "each spec instead."
+        )
+    if group_by is not None:
+        if plot_type is None:
+            raise ValueError("`plot_type` is required in group-by mode.")
+        specs = _group_specs(data, group_by, plot_type, kwargs, save_dir, file_format)
+    else:
+        specs = [_as_spec(spec) for spec in specs]
+
+    # Validate all configurations up front
+    results: List[Optional[PlotResult]] = [None] * len(specs)
+    tasks, task_positions = [], []
+    for i, spec in enumerate(specs):
+        key = i if spec.key is None else spec.key
+        try:
+            plot_type_i = PlotType(spec.plot_type)
+            config: BaseModel = get_plot_config(plot_type_i)(**spec.kwargs)
+        except Exception as error:
+            results[i] = PlotResult(key=key, file_path=spec.file_path, error=error)
+            continue
+        tasks.append((key, plot_type_i, config, engine, spec.file_path, spec.rows))
+        task_positions.append(i)
+
+    if save_dir is not None:
+        Path(save_dir).mkdir(parents=True, exist_ok=True)
+
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    if n_jobs <= 1 or len(tasks) <= 1:
+        # The DataFrame is passed directly, so concurrent calls (e.g. from
+        # threads of a web server) never share the worker global
+        built = [_build_one(task, data) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (4 * n_jobs))
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(data,)
+        ) as executor:
+            built = list(executor.map(_build_one, tasks, chunksize=chunksize))
+
+    for position, result in zip(task_positions, built):
+        results[position] = result
+
+    if raise_errors:
+        for result in results:
+            if result.error is not None:
+                raise result.error
+    return results
@@ -1,7 +1,8 @@
-from typing import Any, Type
+from typing import Any, Type, Union
 import pandas as pd
 from vuecore import EngineType, PlotType
 from vuecore.engines import get_builder, get_saver
+from vuecore.utils.cache import FigureCache, default_cache, fingerprint
 from pydantic import BaseModel
 
 
@@ -11,6 +12,7 @@ def create_plot(
     plot_type: PlotType,
     engine: EngineType = EngineType.PLOTLY,
     file_path: str = None,
+    cache: Union[bool, FigureCache] = False,
     **kwargs,
 ) -> Any:
     """
@@ -19,7 +21,7 @@ def create_plot(
     This function handles the common workflow for creating plots:
     1. Validate configuration using the provided Pydantic model
     2. Get the appropriate builder function from the engine registry
-    3. Build the figure using the builder
+    3. Build the figure using the builder, or reuse a cached figure
     4. Optionally save the plot if a file path is provided
 
     Parameters
@@ -35,6 +37,11 @@ def create_plot(
         Defaults to `EngineType.PLOTLY`.
     file_path : str, optional
         If provided, the path where the final plot will be saved.
+    cache : bool or FigureCache, optional
+        If True, figures are cached in `vuecore.utils.cache.default_cache`,
+        keyed by a fingerprint of the data, the validated configuration, the
+        plot type and the engine. A `FigureCache` instance can be passed to
+        control the memory budget and the disk tier. Defaults to False.
     **kwargs
         Keyword arguments for plot configuration.
 
@@ -49,8 +56,19 @@ def create_plot(
     # 2. Get the correct builder function from the registry
     builder_func = get_builder(plot_type=plot_type, engine=engine)
 
-    # 3. Build the figure object
-    figure = builder_func(data, config)
+    # 3. Build the figure object, unless an identical request is cached
+    if cache is True:
+        cache = default_cache
+    elif cache is False:
+        cache = None
+    figure = None
+    if cache is not None:
+        key = fingerprint(data, config, plot_type, engine)
+        figure = cache.get(key)
+    if figure is None:
+        figure = builder_func(data, config)
+        if cache is not None:
+            cache.put(key, figure)
 
     # 4. Save the plot using the correct saver function, if a file_path is provided
     if file_path:
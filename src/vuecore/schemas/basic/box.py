@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, model_validator
 from vuecore.schemas.plotly_base import PlotlyBaseConfig
 
 
@@ -32,5 +32,25 @@ class BoxConfig(PlotlyBaseConfig):
     notched: bool = Field(False, description="If True, boxes are drawn with notches.")
     points: str = Field(
         "outliers",
-        description="Method to display sample points ('outliers', 'all', 'suspectedoutliers', False).",
+        description="Method to display sample points ('outliers', 'all', 'suspectedoutliers', False). "
+        "Only 'outliers' and False are supported with precompute_stats.",
     )
+
+    # Special features
+    precompute_stats: bool = Field(
+        False,
+        description="If True, quartiles, fences, notches and outliers are computed per box "
+        "in Python, so the figure only carries the summary statistics and the outliers "
+        "instead of every observation.",
+    )
+
+    @model_validator(mode="after")
+    def validate_precomputed_points(self) -> "BoxConfig":
+        """Ensure precomputed boxes only show the points they carry, the outliers."""
+        if self.precompute_stats and self.points not in ("outliers", False):
+            raise ValueError(
+                f"points='{self.points}' requires every observation, but "
+                "precompute_stats only keeps the outliers. Use points='outliers' "
+                "or points=False."
+            )
+        return self
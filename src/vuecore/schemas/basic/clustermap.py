@@ -0,0 +1,117 @@
+# vuecore/schemas/basic/clustermap.py
+
+from typing import Literal, Optional
+from pydantic import Field, ConfigDict, model_validator
+from vuecore.schemas.plotly_base import PlotlyBaseConfig
+
+
+class ClustermapConfig(PlotlyBaseConfig):
+    """
+    Pydantic model for validating and managing clustered heatmap configurations,
+    which extends PlotlyBaseConfig.
+
+    A clustermap draws a matrix as a heatmap whose rows and columns are reordered
+    by hierarchical clustering, with the row and column dendrograms on its sides.
+    The matrix is either the numeric columns of a wide DataFrame (rows are
+    features, columns are samples) or is pivoted from a long DataFrame with the
+    `x`, `y` and `z` columns.
+
+    This model includes the most relevant parameters for the clustering, styling,
+    and layout. It ensures that user-provided configurations are type-safe and
+    adhere to the expected structure. Additional keyword arguments are forwarded
+    to the `plotly.graph_objects.Heatmap` trace.
+    """
+
+    # General Configuration
+    # Allow extra parameters to pass through to Plotly
+    model_config = ConfigDict(extra="allow")
+
+    # Data Mapping
+    z: Optional[str] = Field(
+        None,
+        description="Column with the cell values of a long DataFrame, pivoted with "
+        "`x` as columns and `y` as rows.",
+    )
+
+    # Clustering
+    cluster_rows: bool = Field(True, description="If True, rows are clustered.")
+    cluster_cols: bool = Field(True, description="If True, columns are clustered.")
+    distance_metric: str = Field(
+        "euclidean",
+        description="Distance metric of `scipy.spatial.distance.pdist` "
+        "(e.g., 'euclidean', 'correlation', 'cosine').",
+    )
+    linkage_method: Literal[
+        "single", "complete", "average", "weighted", "centroid", "median", "ward"
+    ] = Field(
+        "average",
+        description="Linkage method ('single', 'complete', 'average', 'weighted', "
+        "'centroid', 'median' or 'ward').",
+    )
+    optimal_leaf_ordering: bool = Field(
+        False,
+        description="If True, leaves are reordered so that adjacent leaves are as "
+        "similar as possible. Slower for thousands of rows.",
+    )
+    z_score: Optional[Literal["row", "col"]] = Field(
+        None,
+        description="Standardizes each 'row' or 'col' (zero mean, unit variance) "
+        "before clustering and drawing.",
+    )
+
+    # Styling and Layout
+    color_continuous_scale: Optional[str] = Field(
+        "RdBu_r", description="Colorscale of the heatmap."
+    )
+    zmid: Optional[float] = Field(
+        None, description="Value at the middle of the colorscale (e.g., 0)."
+    )
+    dendrogram_ratio: float = Field(
+        0.15,
+        description="Fraction of the width and height used by the dendrograms.",
+    )
+    show_row_labels: Optional[bool] = Field(
+        None,
+        description="If True, row labels are shown. Defaults to True for 100 rows or less.",
+    )
+    show_col_labels: Optional[bool] = Field(
+        None,
+        description="If True, column labels are shown. Defaults to True for 100 "
+        "columns or less.",
+    )
+    width: Optional[int] = Field(800, description="Width of the plot in pixels.")
+    height: Optional[int] = Field(800, description="Height of the plot in pixels.")
+
+    # Special features
+    max_rows: Optional[int] = Field(
+        500,
+        description="Maximum number of drawn heatmap rows. Larger matrices are "
+        "aggregated into blocks of consecutive (clustered) rows. None draws all rows.",
+    )
+    max_cols: Optional[int] = Field(
+        500, description="Maximum number of drawn heatmap columns, see `max_rows`."
+    )
+    aggregation: Literal["mean", "max", "absmax"] = Field(
+        "mean",
+        description="Statistic of the aggregated blocks ('mean', 'max', 'absmax').",
+    )
+
+    def validate_x_or_y_provided(self) -> "ClustermapConfig":
+        """
+        Replaces the base validator, since wide DataFrames need neither x nor y.
+
+        Defined without `model_validator`, so it is no longer run, see
+        `validate_long_format_columns`.
+        """
+        return self
+
+    @model_validator(mode="after")
+    def validate_long_format_columns(self) -> "ClustermapConfig":
+        """Ensure the long-format columns are given together, or not at all."""
+        long_format = [self.x, self.y, self.z]
+        if any(c is not None for c in long_format) and None in long_format:
+            raise ValueError(
+                "'x', 'y' and 'z' must be provided together for long-format data, "
+                "or omitted to cluster the numeric columns of a wide DataFrame."
+            )
+        return self
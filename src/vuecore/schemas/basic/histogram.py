@@ -61,3 +61,10 @@ class HistogramConfig(PlotlyBaseConfig):
     )
     nbins: Optional[int] = Field(None, description="Sets the number of bins.")
     text_auto: bool = Field(False, description="If True, displays text labels on bars.")
+
+    # Special features
+    precompute_bins: bool = Field(
+        False,
+        description="If True, bin counts are computed in Python and only the aggregated "
+        "values are sent to Plotly as bars. Marginal plots are not supported.",
+    )
@@ -49,3 +49,22 @@ class LineConfig(PlotlyBaseConfig):
     line_shape: Optional[str] = Field(
         "linear", description="Line shape (e.g., 'linear', 'spline')."
     )
+    render_mode: str = Field(
+        "auto",
+        description="Trace renderer ('auto', 'svg', 'webgl'). 'auto' switches to WebGL "
+        "once the number of points reaches `webgl_threshold`.",
+    )
+    webgl_threshold: int = Field(
+        1000, ge=0, description="Number of points from which 'auto' uses WebGL."
+    )
+
+    # Special features
+    max_points_per_trace: Optional[int] = Field(
+        None,
+        gt=2,
+        description="Maximum number of points per line. Longer lines are downsampled.",
+    )
+    downsample_method: str = Field(
+        "lttb",
+        description="Downsampling algorithm for long lines ('lttb', 'minmax', 'nth').",
+    )
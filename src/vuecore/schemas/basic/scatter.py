@@ -48,11 +48,35 @@ class ScatterConfig(PlotlyBaseConfig):
     marker_line_color: str = Field(
         "DarkSlateGrey", description="Color of marker border lines."
     )
+    render_mode: str = Field(
+        "auto",
+        description="Trace renderer ('auto', 'svg', 'webgl'). 'auto' switches to WebGL "
+        "once the number of points reaches `webgl_threshold`.",
+    )
+    webgl_threshold: int = Field(
+        1000, ge=0, description="Number of points from which 'auto' uses WebGL."
+    )
 
     # Special features
     color_by_density: bool = Field(
         False, description="Color points by density instead of category."
     )
+    density_method: str = Field(
+        "grid",
+        description="Density estimator used with `color_by_density` ('grid', 'kde', 'knn').",
+    )
+    density_grid_size: int = Field(
+        256, gt=1, description="Number of bins per axis for the 'grid' estimator."
+    )
+    density_bandwidth: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Kernel bandwidth in standard deviations for the 'grid' estimator. "
+        "Defaults to Scott's rule.",
+    )
+    density_neighbors: int = Field(
+        32, ge=1, description="Number of neighbours for the 'knn' estimator."
+    )
 
     @model_validator(mode="after")
     def validate_exclusive_color_options(self) -> "ScatterConfig":
@@ -36,3 +36,27 @@ class ViolinConfig(PlotlyBaseConfig):
         description="Method to display sample points ('outliers', 'all', 'suspectedoutliers', False).",
     )
     box: bool = Field(False, description="If True, boxes are drawn inside the violins.")
+
+    # Special features
+    precompute_kde: bool = Field(
+        False,
+        description="If True, the density of each violin is estimated in Python on a fixed "
+        "grid and drawn as a filled path, with precomputed quartiles and subsampled points, "
+        "so the figure size does not depend on the number of observations.",
+    )
+    kde_grid_size: int = Field(
+        128,
+        gt=1,
+        description="Number of grid points of each density estimate in precomputed mode.",
+    )
+    kde_bandwidth: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Kernel bandwidth in data units in precomputed mode. Defaults to "
+        "Silverman's rule of thumb for each violin.",
+    )
+    max_points: int = Field(
+        200,
+        ge=0,
+        description="Maximum number of sample points drawn per violin in precomputed mode.",
+    )
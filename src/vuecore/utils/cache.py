@@ -0,0 +1,386 @@
+import hashlib
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+
+def fingerprint(
+    data: pd.DataFrame, config: BaseModel, plot_type: str, engine: str
+) -> str:
+    """
+    Computes a content-based key for a plot request.
+
+    The key combines a hash of the DataFrame values, index, column names and
+    dtypes with the validated configuration, the plot type and the engine, so
+    equal requests map to the same key regardless of object identity.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame containing the plot data.
+    config : BaseModel
+        The validated Pydantic model with all plot configurations.
+    plot_type : str
+        The plot type (e.g., 'scatter').
+    engine : str
+        The plotting engine (e.g., 'plotly').
+
+    Returns
+    -------
+    str
+        A hexadecimal digest identifying the request.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        digest.update(row_hashes.tobytes())
+        digest.update(repr(list(data.columns)).encode())
+        digest.update(repr(list(data.dtypes.astype(str))).encode())
+    except TypeError:
+        # Unhashable cells (e.g., lists) fall back to the pickled frame
+        digest.update(pickle.dumps(data))
+    try:
+        digest.update(config.model_dump_json().encode())
+    except Exception:
+        digest.update(repr(config.model_dump()).encode())
+    digest.update(f"{plot_type}|{engine}".encode())
+    return digest.hexdigest()
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Estimates the memory size of the plain data of a figure, in bytes.
+
+    NumPy arrays count their buffer size, strings their length and other
+    scalars 8 bytes, so the estimate takes a fraction of the time of a JSON
+    serialization.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return sum(_estimate_size(item) for item in value.ravel().tolist())
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(k)) + _estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(item) for item in value)
+    return 8
+
+
+def figure_size(figure: Any) -> int:
+    """
+    Estimates the memory size of a Plotly figure, in bytes.
+
+    Parameters
+    ----------
+    figure : Any
+        A Plotly figure.
+
+    Returns
+    -------
+    int
+        The estimated size of the traces and the layout.
+    """
+    # The figure properties are read without the copy of `to_plotly_json`
+    return _estimate_size(figure._data) + _estimate_size(figure._layout)
+
+
+class FigureCache:
+    """
+    Two-tier cache of built figures, keyed by `fingerprint`.
+
+    The memory tier is a least-recently-used cache bounded by the total
+    size of its figures (see `figure_size`). The optional disk tier stores
+    every figure as a Plotly JSON file, so figures evicted from memory (or
+    built by another process) are loaded instead of rebuilt.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum total size of the figures kept in memory. If None, the memory
+        tier is unbounded and sizes are not computed. Defaults to 256 MB.
+    cache_dir : str or Path, optional
+        Directory of the disk tier. If None, only the memory tier is used.
+    copy : bool, optional
+        If True (default), a copy of the figure is stored and a copy of the
+        cached figure is returned on each hit, so callers can modify it
+        without changing later hits. If False, the cached figure itself is
+        returned, which takes microseconds but must not be modified.
+
+    Examples
+    --------
+    >>> cache = FigureCache(max_bytes=64 * 2**20, cache_dir="figure_cache")
+    >>> fig = create_scatter_plot(data, x="x", y="y", cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = 256 * 2**20,
+        cache_dir: Optional[Union[str, Path]] = None,
+        copy: bool = True,
+    ):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._figures or (
+            self.cache_dir is not None and self._disk_path(key).exists()
+        )
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the figures in the memory tier."""
+        return self._total_bytes
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _copy(self, figure: Any) -> Any:
+        return figure.__class__(figure) if self.copy else figure
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached figure for a key, or None on a miss.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by `fingerprint`.
+
+        Returns
+        -------
+        Any, optional
+            The cached figure, or None if it is not cached.
+        """
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+        if figure is not None:
+            return self._copy(figure)
+
+        if self.cache_dir is not None and self._disk_path(key).exists():
+            import plotly.io as pio
+
+            json_str = self._disk_path(key).read_text()
+            figure = pio.from_json(json_str)
+            self._store(key, self._copy(figure), len(json_str))
+            with self._lock:
+                self.hits += 1
+            return figure
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, figure: Any) -> None:
+        """
+        Caches a figure, evicting the least recently used ones if needed.
+
+        The figure is only serialized to JSON for the disk tier. The size of
+        the memory tier is otherwise estimated with `figure_size`, and only
+        when `max_bytes` is set.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by `fingerprint`.
+        figure : Any
+            The figure to cache. It must be serializable with `plotly.io.to_json`.
+        """
+        json_str = None
+        if self.cache_dir is not None:
+            # Plotly is imported on first use, so `import vuecore.plots` stays light
+            import plotly.io as pio
+
+            json_str = pio.to_json(figure)
+            self._disk_path(key).write_text(json_str)
+        if self.max_bytes is None:
+            size = 0
+        elif json_str is not None:
+            size = len(json_str)
+        else:
+            size = figure_size(figure)
+        self._store(key, self._copy(figure), size)
+
+    def _store(self, key: str, figure: Any, size: int) -> None:
+        """
+        Adds a figure to the memory tier and enforces `max_bytes`.
+        """
+        with self._lock:
+            if key in self._figures:
+                self._total_bytes -= self._sizes.pop(key)
+                del self._figures[key]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._figures[key] = figure
+            self._sizes[key] = size
+            self._total_bytes += size
+            while self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                evicted, _ = self._figures.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(evicted)
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Empties the memory tier and, optionally, the disk tier.
+
+        Parameters
+        ----------
+        disk : bool, optional
+            If True, the JSON files of the disk tier are deleted as well.
+        """
+        with self._lock:
+            self._figures.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink()
+
+
+# Cache used by `create_plot(..., cache=True)`
+default_cache = FigureCache()
+
+
+class ServerStore:
+    """
+    Bounded store of the server-side state of rendered Dash components.
+
+    Components that keep their data on the server (e.g., the pagers of
+    server-side tables and the tilers of zoomable heatmaps) are stored under
+    a random token created for each render, and the token is embedded in the
+    component id. Renders never share an entry, even when they use the same
+    identifier in different sessions, so a callback only serves the data of
+    its own render.
+
+    Entries are removed when they have not been used for `ttl` seconds, and
+    the least recently used entries are removed when there are more than
+    `max_entries`, so memory is bounded. The callback of a component whose
+    entry was removed leaves it unchanged, until the component is rendered
+    again. All operations are thread-safe.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of entries. Defaults to 64.
+    ttl : float, optional
+        Seconds after the last use when an entry expires. If None, entries
+        only expire by `max_entries`. Defaults to one hour.
+    """
+
+    def __init__(self, max_entries: int = 64, ttl: Optional[float] = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def __contains__(self, token: str) -> bool:
+        with self._lock:
+            self._expire()
+            return token in self._entries
+
+    def _expire(self) -> None:
+        """
+        Removes the entries unused for `ttl` seconds. The lock must be held.
+        """
+        if self.ttl is None:
+            return
+        deadline = time.monotonic() - self.ttl
+        while self._entries:
+            token, (last_used, _) = next(iter(self._entries.items()))
+            if last_used > deadline:
+                break
+            del self._entries[token]
+
+    def add(self, value: Any, prefix: str = "") -> str:
+        """
+        Stores a value under a new token, evicting the oldest entries if needed.
+
+        Parameters
+        ----------
+        value : Any
+            The server-side state of a component.
+        prefix : str, optional
+            Prefix of the token, e.g., the component identifier, to keep the
+            component ids readable.
+
+        Returns
+        -------
+        str
+            The token of the entry, unique for each call.
+        """
+        token = f"{prefix}{uuid.uuid4().hex}"
+        with self._lock:
+            self._expire()
+            self._entries[token] = (time.monotonic(), value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return token
+
+    def get(self, token: str) -> Optional[Any]:
+        """
+        Returns the value of a token, or None if it is unknown or expired.
+
+        Parameters
+        ----------
+        token : str
+            The token returned by `add`.
+
+        Returns
+        -------
+        Any, optional
+            The stored value, or None.
+        """
+        with self._lock:
+            self._expire()
+            entry = self._entries.pop(token, None)
+            if entry is None:
+                return None
+            self._entries[token] = (time.monotonic(), entry[1])
+            return entry[1]
+
+    def discard(self, token: str) -> None:
+        """
+        Removes the entry of a token, if any.
+
+        Parameters
+        ----------
+        token : str
+            The token returned by `add`.
+        """
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,327 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.cluster import hierarchy
+from scipy.spatial.distance import pdist
+
+# Maximum number of linkages and dendrograms kept by the clustering cache
+CLUSTERING_CACHE_SIZE = 16
+
+# Number of matrix rows read at a time from large (e.g., memory-mapped) matrices
+BLOCK_ROWS = 1024
+
+_clustering_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_clustering_cache_lock = threading.Lock()
+
+
+def matrix_fingerprint(matrix: Any) -> str:
+    """
+    Computes a content-based key for a matrix.
+
+    The key combines the values, the shape and the dtype of the matrix, so
+    equal matrices map to the same key regardless of object identity. The
+    index and column labels of DataFrames are not included, since they do
+    not change the clustering.
+
+    Parameters
+    ----------
+    matrix : Any
+        A DataFrame or an array-like matrix.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest identifying the matrix.
+    """
+    values = np.asarray(matrix)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{values.shape}|{values.dtype}".encode())
+    if values.dtype == object:
+        digest.update(repr(values.tolist()).encode())
+    elif values.ndim < 2:
+        digest.update(np.ascontiguousarray(values).data)
+    else:
+        # Blocks of rows, so memory-mapped matrices are never fully loaded
+        for start in range(0, len(values), BLOCK_ROWS):
+            digest.update(np.ascontiguousarray(values[start : start + BLOCK_ROWS]).data)
+    return digest.hexdigest()
+
+
+def condensed_distances(matrix: Any) -> np.ndarray:
+    """
+    Extracts the condensed distance vector of a square dissimilarity matrix.
+
+    The upper triangle is copied one block of rows at a time, so a float32 or
+    memory-mapped matrix (`numpy.memmap`, `numpy.load(..., mmap_mode='r')`)
+    is never fully converted to float64 in memory: peak memory is the
+    condensed vector (half a float64 matrix) plus one block.
+
+    Parameters
+    ----------
+    matrix : Any
+        A square DataFrame or array, or an already condensed 1-D vector.
+
+    Returns
+    -------
+    np.ndarray
+        The float64 condensed distances, as returned by
+        `scipy.spatial.distance.squareform`.
+
+    Raises
+    ------
+    ValueError
+        If `matrix` is neither square nor 1-D.
+    """
+    values = matrix.to_numpy() if isinstance(matrix, pd.DataFrame) else matrix
+    values = np.asarray(values)
+    if values.ndim == 1:
+        return np.asarray(values, dtype=float)
+    if values.ndim != 2 or values.shape[0] != values.shape[1]:
+        raise ValueError(
+            f"Expected a square dissimilarity matrix, got shape {values.shape}"
+        )
+
+    n = len(values)
+    condensed = np.empty(n * (n - 1) // 2, dtype=float)
+    columns = np.arange(n)
+    offset = 0
+    for start in range(0, n, BLOCK_ROWS):
+        rows = np.arange(start, min(start + BLOCK_ROWS, n))
+        block = np.asarray(values[rows[0] : rows[-1] + 1], dtype=float)
+        upper = block[columns[None, :] > rows[:, None]]
+        condensed[offset : offset + len(upper)] = upper
+        offset += len(upper)
+    return condensed
+
+
+def _cached(key: tuple, compute, cache: bool):
+    """
+    Returns the cached result of `key`, computing and storing it on a miss.
+    """
+    if not cache:
+        return compute()
+    with _clustering_cache_lock:
+        if key in _clustering_cache:
+            _clustering_cache.move_to_end(key)
+            return _clustering_cache[key]
+    result = compute()
+    with _clustering_cache_lock:
+        _clustering_cache[key] = result
+        while len(_clustering_cache) > CLUSTERING_CACHE_SIZE:
+            _clustering_cache.popitem(last=False)
+    return result
+
+
+def clear_clustering_cache() -> None:
+    """
+    Removes all cached linkages and dendrograms.
+    """
+    with _clustering_cache_lock:
+        _clustering_cache.clear()
+
+
+def compute_linkage(
+    matrix: Any,
+    distfun: Optional[str] = "euclidean",
+    method: str = "ward",
+    optimal_ordering: bool = False,
+    cache: bool = True,
+) -> np.ndarray:
+    """
+    Computes a hierarchical clustering, cached by matrix fingerprint.
+
+    Clustering is the most expensive step of the WGCNA and clustered heatmap
+    figures, and the same matrix is often clustered by several of them (e.g.,
+    both axes of a symmetric heatmap). The linkage is cached by the matrix
+    fingerprint, the distance function and the linkage method, so each
+    clustering is computed once.
+
+    Parameters
+    ----------
+    matrix : Any
+        A DataFrame or array with observations as rows. If `distfun` is None,
+        a square dissimilarity matrix (e.g., dissTOM, which may be float32 or
+        memory-mapped) or its condensed distance vector, see
+        `condensed_distances`.
+    distfun : str, optional
+        Distance metric of `scipy.spatial.distance.pdist` (e.g., 'euclidean',
+        'correlation'). If None, `matrix` holds the distances. Defaults to
+        'euclidean'.
+    method : str, optional
+        Linkage method ('single', 'complete', 'average', 'weighted',
+        'centroid', 'median' or 'ward'), by default 'ward'.
+    optimal_ordering : bool, optional
+        If True, the leaves are reordered so that the distance between
+        successive leaves is minimal (Bar-Joseph et al., 2001), by default
+        False.
+    cache : bool, optional
+        If True (default), the linkage is cached.
+
+    Returns
+    -------
+    np.ndarray
+        The linkage matrix, as returned by `scipy.cluster.hierarchy.linkage`.
+        Cached matrices are shared, so they are read-only.
+    """
+    key_fingerprint = matrix_fingerprint(matrix) if cache else None
+    return _linkage(matrix, key_fingerprint, distfun, method, cache, optimal_ordering)
+
+
+def _linkage(matrix, key_fingerprint, distfun, method, cache, optimal_ordering=False):
+    """
+    Computes or retrieves the linkage of a matrix with a known fingerprint.
+    """
+
+    def compute():
+        if distfun is None:
+            distances = condensed_distances(matrix)
+        else:
+            distances = pdist(np.asarray(matrix, dtype=float), metric=distfun)
+        linkage = hierarchy.linkage(
+            distances, method=method, optimal_ordering=optimal_ordering
+        )
+        linkage.flags.writeable = False
+        return linkage
+
+    key = ("linkage", key_fingerprint, distfun, method, optimal_ordering)
+    return _cached(key, compute, cache)
+
+
+def get_clusters_elements(
+    linkage: np.ndarray,
+    labels: Sequence[Hashable],
+    fcluster_method: str = "distance",
+    fcluster_cutoff: float = 15,
+) -> Dict[int, List[Hashable]]:
+    """
+    Cuts a hierarchical clustering into flat clusters.
+
+    Parameters
+    ----------
+    linkage : np.ndarray
+        The linkage matrix.
+    labels : Sequence[Hashable]
+        Label of each observation.
+    fcluster_method : str, optional
+        Criterion of `scipy.cluster.hierarchy.fcluster`, by default 'distance'.
+    fcluster_cutoff : float, optional
+        Threshold of `scipy.cluster.hierarchy.fcluster`, by default 15.
+
+    Returns
+    -------
+    Dict[int, List[Hashable]]
+        Labels of the observations of each cluster.
+    """
+    clusters = hierarchy.fcluster(linkage, fcluster_cutoff, criterion=fcluster_method)
+    members = pd.Series(list(labels)).groupby(clusters).agg(list)
+    return members.to_dict()
+
+
+def get_dendrogram(
+    df: Any,
+    labels: Optional[Sequence[Hashable]] = None,
+    distfun: Optional[str] = "euclidean",
+    linkagefun: str = "ward",
+    div_clusters: bool = False,
+    fcluster_method: str = "distance",
+    fcluster_cutoff: float = 15,
+    cache: bool = True,
+):
+    """
+    Computes the dendrogram of a hierarchical clustering, with cached linkage.
+
+    The linkage (see `compute_linkage`) and the dendrogram coordinates are
+    cached, so figures built from the same matrix share one clustering.
+
+    Parameters
+    ----------
+    df : Any
+        A DataFrame or array with observations as rows. If `distfun` is None,
+        a square (possibly memory-mapped) dissimilarity matrix or its
+        condensed distance vector.
+    labels : Sequence[Hashable], optional
+        Label of each observation. If None or empty, leaves are labeled by
+        their positions.
+    distfun : str, optional
+        Distance metric, see `compute_linkage`. Defaults to 'euclidean'.
+    linkagefun : str, optional
+        Linkage method, see `compute_linkage`. Defaults to 'ward'.
+    div_clusters : bool, optional
+        If True, also returns the flat clusters (see `get_clusters_elements`).
+    fcluster_method : str, optional
+        Criterion of the flat clusters, by default 'distance'.
+    fcluster_cutoff : float, optional
+        Threshold of the flat clusters, by default 15.
+    cache : bool, optional
+        If True (default), the linkage and the dendrogram are cached.
+
+    Returns
+    -------
+    dict or Tuple[dict, Dict[int, List[Hashable]]]
+        The dendrogram, as returned by `scipy.cluster.hierarchy.dendrogram`
+        (keys 'icoord', 'dcoord', 'ivl', 'leaves' and 'color_list'), and the
+        flat clusters if `div_clusters` is True. Cached dendrograms are
+        shared and must not be modified.
+    """
+    labels = list(labels) if labels is not None and len(labels) else None
+    # Large dissimilarity matrices are hashed once for both cache entries
+    key_fingerprint = matrix_fingerprint(df) if cache else None
+    linkage = _linkage(df, key_fingerprint, distfun, linkagefun, cache)
+
+    key = (
+        "dendrogram",
+        key_fingerprint,
+        distfun,
+        linkagefun,
+        (
+            None
+            if labels is None
+            else matrix_fingerprint(np.asarray(labels, dtype=object))
+        ),
+    )
+    Z_dendrogram = _cached(
+        key,
+        lambda: hierarchy.dendrogram(linkage, labels=labels, no_plot=True),
+        cache,
+    )
+    if div_clusters:
+        clusters = get_clusters_elements(
+            linkage,
+            labels if labels is not None else range(len(linkage) + 1),
+            fcluster_method,
+            fcluster_cutoff,
+        )
+        return Z_dendrogram, clusters
+
+    return Z_dendrogram
+
+
+def sample_leaves(leaves: Sequence[Hashable], max_leaves: Optional[int]) -> list:
+    """
+    Selects evenly spaced leaves of a dendrogram.
+
+    Heatmaps of large clusterings are drawn from this subset, in dendrogram
+    order, so their size is bounded by `max_leaves` instead of the number of
+    leaves.
+
+    Parameters
+    ----------
+    leaves : Sequence[Hashable]
+        The leaves, in dendrogram order (e.g., the 'ivl' of a dendrogram).
+    max_leaves : int, optional
+        Maximum number of leaves. If None, all leaves are kept.
+
+    Returns
+    -------
+    list
+        The selected leaves, in dendrogram order.
+    """
+    leaves = list(leaves)
+    if max_leaves is None or len(leaves) <= max_leaves:
+        return leaves
+    positions = np.unique(np.linspace(0, len(leaves) - 1, max_leaves).round())
+    return [leaves[i] for i in positions.astype(int)]
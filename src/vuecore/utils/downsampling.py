@@ -0,0 +1,386 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Algorithms supported by `downsample_indices`
+DOWNSAMPLE_METHODS = ("lttb", "minmax", "nth")
+
+# Block statistics supported by `aggregate_blocks`
+BLOCK_AGGREGATIONS = ("mean", "max", "absmax")
+
+
+def _as_numeric(values: np.ndarray) -> np.ndarray:
+    """
+    Converts x values to floats, using positions for non-numeric values.
+
+    Datetimes are converted to their integer representation, so distances
+    along the x-axis are preserved.
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64) or np.issubdtype(
+        values.dtype, np.timedelta64
+    ):
+        return values.astype("int64").astype(float)
+    if np.issubdtype(values.dtype, np.number) or values.dtype == bool:
+        return values.astype(float)
+    return np.arange(len(values), dtype=float)
+
+
+def nth_indices(n_points: int, n_out: int) -> np.ndarray:
+    """
+    Selects evenly spaced indices, always keeping the first and last point.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points in the series.
+    n_out : int
+        Number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+    """
+    if n_points <= n_out:
+        return np.arange(n_points)
+    return np.unique(np.linspace(0, n_points - 1, n_out).round().astype(int))
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selects the minimum and maximum of equally sized buckets of a series.
+
+    Keeping both extremes of every bucket preserves the visual envelope of
+    the series, including narrow peaks.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        The y values of the series.
+    n_out : int
+        Maximum number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+    """
+    y = np.asarray(y, dtype=float)
+    n_points = len(y)
+    if n_points <= n_out:
+        return np.arange(n_points)
+
+    # Two points per bucket, plus the first and last points of the series
+    n_buckets = max((n_out - 2) // 2, 1)
+    bucket = np.arange(n_points) * n_buckets // n_points
+    # Sort by bucket, then by value: each bucket starts with its minimum
+    # and ends with its maximum
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket, np.arange(n_buckets))
+    ends = np.append(starts[1:], n_points) - 1
+    selected = np.concatenate([[0, n_points - 1], order[starts], order[ends]])
+    return np.unique(selected)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selects points with the Largest-Triangle-Three-Buckets (LTTB) algorithm.
+
+    The series is split into `n_out - 2` buckets and, in each bucket, the
+    point that forms the largest triangle with the previously selected point
+    and the average of the next bucket is kept. The first and last points are
+    always kept.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The x values of the series. Non-numeric values are replaced by
+        their positions.
+    y : np.ndarray
+        The y values of the series.
+    n_out : int
+        Number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+    """
+    n_points = len(y)
+    if n_points <= n_out or n_out < 3:
+        return nth_indices(n_points, max(n_out, 2))
+
+    x = _as_numeric(x)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n_points - 1, n_out - 1).astype(int)
+
+    # Averages of all buckets are needed for the look-ahead point
+    counts = np.diff(edges)
+    x_means = np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts
+    y_means = np.add.reduceat(np.nan_to_num(y[1:-1]), edges[:-1] - 1) / counts
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n_points - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 1 < n_out - 2:
+            next_x, next_y = x_means[i + 1], y_means[i + 1]
+        else:
+            next_x, next_y = x[-1], y[-1]
+        # Twice the area of the triangle (previous, candidate, next average)
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        if np.isnan(areas).all():
+            previous = start
+        else:
+            previous = start + int(np.nanargmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+def downsample_indices(
+    x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb"
+) -> np.ndarray:
+    """
+    Selects at most `n_out` points of a series with the given algorithm.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The x values of the series.
+    y : np.ndarray
+        The y values of the series.
+    n_out : int
+        Maximum number of points to keep.
+    method : str, optional
+        Downsampling algorithm: 'lttb' (Largest-Triangle-Three-Buckets),
+        'minmax' (bucket minimum and maximum) or 'nth' (every n-th point).
+        Defaults to 'lttb'.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the supported algorithms.
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    if method == "nth":
+        return nth_indices(len(y), n_out)
+    raise ValueError(
+        f"Unsupported downsampling method: '{method}'. "
+        f"Supported methods: {', '.join(DOWNSAMPLE_METHODS)}"
+    )
+
+
+def downsample_groups(
+    data: pd.DataFrame,
+    x: Optional[str],
+    y: str,
+    group_cols: List[str],
+    max_points: int,
+    method: str = "lttb",
+) -> pd.DataFrame:
+    """
+    Downsamples each group of a long-format DataFrame to at most `max_points` rows.
+
+    Each group (e.g., one line of a line plot) is downsampled separately and
+    the original row order is preserved, so the result can be plotted like
+    the input.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame to downsample.
+    x : str, optional
+        Column with the x values. If None, the row positions are used.
+    y : str
+        Column with the y values.
+    group_cols : List[str]
+        Columns that identify the series. If empty, the whole DataFrame is
+        treated as a single series.
+    max_points : int
+        Maximum number of rows to keep per group.
+    method : str, optional
+        Downsampling algorithm, see `downsample_indices`. Defaults to 'lttb'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The selected rows of `data`.
+    """
+    x_values = data[x].to_numpy() if x is not None else np.arange(len(data))
+    y_values = data[y].to_numpy()
+
+    if group_cols:
+        groups = data.groupby(group_cols, sort=False, dropna=False).indices.values()
+    else:
+        groups = [np.arange(len(data))]
+
+    selected = []
+    for positions in groups:
+        if len(positions) <= max_points:
+            selected.append(positions)
+            continue
+        keep = downsample_indices(
+            x_values[positions], y_values[positions], max_points, method=method
+        )
+        selected.append(positions[keep])
+
+    if not selected:
+        return data
+    return data.iloc[np.sort(np.concatenate(selected))]
+
+
+def density_thin_indices(
+    x: np.ndarray, y: np.ndarray, n_out: int, grid_size: int = 64, seed: int = 0
+) -> np.ndarray:
+    """
+    Selects at most `n_out` points of a 2D point cloud, thinning dense regions first.
+
+    The points are binned on a `grid_size` x `grid_size` grid and each cell
+    keeps at most the same number of randomly chosen points. The cap is the
+    largest one that keeps `n_out` points or less, so sparse cells (e.g.,
+    outliers) are kept entirely while crowded cells are subsampled.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The x-coordinates of the points.
+    y : np.ndarray
+        The y-coordinates of the points.
+    n_out : int
+        Maximum number of points to keep.
+    grid_size : int, optional
+        Number of bins per axis, by default 64.
+    seed : int, optional
+        Seed of the random choice of points within crowded cells, by default 0.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted positional indices of the selected points.
+    """
+    n_points = len(x)
+    if n_points <= n_out:
+        return np.arange(n_points)
+    if n_out <= 0:
+        return np.arange(0)
+
+    cells = np.zeros(n_points, dtype=np.int64)
+    for values in (np.asarray(x, dtype=float), np.asarray(y, dtype=float)):
+        finite = np.isfinite(values)
+        low = values[finite].min() if finite.any() else 0.0
+        span = (values[finite].max() - low) if finite.any() else 0.0
+        scaled = (values - low) / span if span > 0 else np.zeros(n_points)
+        bins = np.clip(np.nan_to_num(scaled) * grid_size, 0, grid_size - 1)
+        cells = cells * grid_size + bins.astype(np.int64)
+
+    # Random rank of each point within its cell
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(n_points)
+    order = order[np.argsort(cells[order], kind="stable")]
+    sorted_cells = cells[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    counts = np.diff(np.append(starts, n_points))
+    ranks = np.arange(n_points) - np.repeat(starts, counts)
+
+    # Largest per-cell cap whose total stays within n_out
+    counts = np.sort(counts)
+    kept = np.cumsum(counts) + counts * np.arange(len(counts) - 1, -1, -1)
+    k = np.searchsorted(kept, n_out, side="right") - 1
+    if k >= 0:
+        cap = counts[k] + (n_out - kept[k]) // (len(counts) - 1 - k)
+    else:
+        cap = n_out // len(counts)
+    # The points left by the integer cap are filled with one more point of
+    # random crowded cells
+    selected = order[ranks < cap]
+    extra = order[ranks == cap]
+    n_extra = min(n_out - len(selected), len(extra))
+    selected = np.concatenate([selected, rng.choice(extra, n_extra, replace=False)])
+    return np.sort(selected)
+
+
+def aggregate_blocks(
+    values: np.ndarray,
+    max_rows: Optional[int],
+    max_cols: Optional[int],
+    method: str = "mean",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregates a matrix into blocks, so it has at most `max_rows` x `max_cols` cells.
+
+    Rows and columns are grouped into consecutive blocks of equal size (the
+    last block may be smaller), and each block is reduced with a NumPy
+    reshape, so heatmaps of large matrices can be drawn at screen resolution.
+    Missing values are ignored; blocks without values are missing.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 2D matrix.
+    max_rows : int, optional
+        Maximum number of rows. If None, rows are not aggregated.
+    max_cols : int, optional
+        Maximum number of columns. If None, columns are not aggregated.
+    method : str, optional
+        Statistic of each block: 'mean', 'max' or 'absmax' (the value with
+        the largest magnitude, keeping its sign, e.g., for correlations).
+        Defaults to 'mean'.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The aggregated float matrix, and the positions of the first row and
+        first column of each block.
+
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the supported statistics.
+    """
+    if method not in BLOCK_AGGREGATIONS:
+        raise ValueError(
+            f"Unsupported block aggregation: '{method}'. "
+            f"Supported aggregations: {', '.join(BLOCK_AGGREGATIONS)}"
+        )
+    values = np.asarray(values, dtype=float)
+    n_rows, n_cols = values.shape
+    row_size = max(1, -(-n_rows // max_rows)) if max_rows else 1
+    col_size = max(1, -(-n_cols // max_cols)) if max_cols else 1
+    row_starts = np.arange(0, n_rows, row_size)
+    col_starts = np.arange(0, n_cols, col_size)
+    if row_size == 1 and col_size == 1:
+        return values, row_starts, col_starts
+
+    # Pad with missing values up to whole blocks, then one axis per block
+    padded = np.full((len(row_starts) * row_size, len(col_starts) * col_size), np.nan)
+    padded[:n_rows, :n_cols] = values
+    blocks = padded.reshape(len(row_starts), row_size, len(col_starts), col_size)
+    blocks = blocks.transpose(0, 2, 1, 3).reshape(len(row_starts), len(col_starts), -1)
+
+    missing = np.isnan(blocks)
+    counts = (~missing).sum(axis=2)
+    if method == "mean":
+        result = np.where(missing, 0.0, blocks).sum(axis=2)
+        result /= np.maximum(counts, 1)
+    elif method == "max":
+        result = np.where(missing, -np.inf, blocks).max(axis=2)
+    else:
+        largest = np.where(missing, -1.0, np.abs(blocks)).argmax(axis=2)
+        result = np.take_along_axis(blocks, largest[..., None], axis=2)[..., 0]
+    result[counts == 0] = np.nan
+    return result, row_starts, col_starts
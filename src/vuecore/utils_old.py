@@ -112,13 +112,46 @@ def neo4j_schema_to_networkx(schema):
     return G
 
 
-def networkx_to_cytoscape(graph):
-    cy_graph = json_graph.cytoscape_data(graph)
-    cy_nodes = cy_graph["elements"]["nodes"]
-    cy_edges = cy_graph["elements"]["edges"]
-    cy_elements = cy_nodes
-    cy_elements.extend(cy_edges)
-    mouseover_node = dict(graph.nodes(data=True))
+def networkx_to_cytoscape(graph, node_attributes=None, edge_attributes=None):
+    """
+    Converts a networkx graph into cytoscape elements.
+
+    :param graph: networkx graph.
+    :param list node_attributes: node attributes included in the elements. If None, all
+                                 attributes are included.
+    :param list edge_attributes: edge attributes included in the elements. If None, all
+                                 attributes are included.
+    :return: tuple with the list of cytoscape elements (nodes, then edges) and a dictionary
+             with the attributes of each node.
+    """
+    if node_attributes is None and edge_attributes is None:
+        cy_graph = json_graph.cytoscape_data(graph)
+        cy_nodes = cy_graph["elements"]["nodes"]
+        cy_edges = cy_graph["elements"]["edges"]
+        cy_elements = cy_nodes
+        cy_elements.extend(cy_edges)
+        mouseover_node = dict(graph.nodes(data=True))
+
+        return cy_elements, mouseover_node
+
+    # Only the listed attributes are serialized, which bounds the payload size
+    def _select(attrs, keys):
+        if keys is None:
+            return dict(attrs)
+        return {k: attrs[k] for k in keys if k in attrs}
+
+    cy_elements = []
+    mouseover_node = {}
+    for n, attrs in graph.nodes(data=True):
+        node_data = _select(attrs, node_attributes)
+        mouseover_node[n] = node_data
+        cy_elements.append(
+            {"data": {**node_data, "id": str(n), "value": n, "name": str(n)}}
+        )
+    for u, v, attrs in graph.edges(data=True):
+        cy_elements.append(
+            {"data": {**_select(attrs, edge_attributes), "source": u, "target": v}}
+        )
 
     return cy_elements, mouseover_node
 
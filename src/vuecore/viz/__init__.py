@@ -0,0 +1,105 @@
+"""
+Legacy plotting functions, grouped by plot family.
+
+The functions are loaded lazily (PEP 562): `from vuecore.viz import run_volcano`
+or `vuecore.viz.get_heatmapplot` only imports the module of that plot family,
+so the heavy dependencies of other families (e.g., networkx, nltk, pyvis,
+wordcloud or webweb for networks and word clouds) are imported only when one
+of their functions is first used.
+"""
+
+from importlib import import_module
+
+# Functions provided by each plot family module
+PLOT_FAMILIES = {
+    "basic": [
+        "getPlotTraces",
+        "get_markdown",
+        "get_pieplot",
+        "get_distplot",
+        "get_boxplot_grid",
+        "get_barplot",
+        "get_histogram",
+        "get_facet_grid_plot",
+        "get_ranking_plot",
+        "get_scatterplot_matrix",
+        "get_simple_scatterplot",
+        "get_scatterplot",
+        "get_density",
+        "get_pca_plot",
+        "get_violinplot",
+        "create_violinplot",
+        "get_parallel_plot",
+        "get_parallel_coord_plot",
+        "get_polar_plot",
+        "get_enrichment_plots",
+    ],
+    "volcano": [
+        "get_volcanoplot",
+        "run_volcano",
+    ],
+    "heatmap": [
+        "get_heatmapplot",
+        "get_complex_heatmapplot",
+        "get_clustergrammer_plot",
+    ],
+    "network": [
+        "get_notebook_network_pyvis",
+        "get_notebook_network_web",
+        "network_to_tables",
+        "generate_configuration_tree",
+        "get_network",
+        "get_network_style",
+        "visualize_notebook_network",
+        "visualize_notebook_path",
+        "get_cytoscape_network",
+        "getMapperFigure",
+    ],
+    "tables": [
+        "get_table",
+        "get_multi_table",
+    ],
+    "sankey": [
+        "get_sankey_plot",
+    ],
+    "wgcna_plots": [
+        "get_WGCNAPlots",
+    ],
+    "venn": [
+        "get_2_venn_diagram",
+        "plot_2_venn_diagram",
+    ],
+    "text": [
+        "get_wordcloud",
+    ],
+    "survival": [
+        "get_km_plot_old",
+        "get_km_plot",
+        "get_cumulative_hazard_plot",
+    ],
+    "export": [
+        "save_DASH_plot",
+        "mpl_to_plotly",
+    ],
+}
+
+# Module of each function, for lazy attribute access
+_FUNCTION_MODULES = {
+    name: family for family, names in PLOT_FAMILIES.items() for name in names
+}
+
+__all__ = list(_FUNCTION_MODULES)
+
+
+def __getattr__(name: str):
+    family = _FUNCTION_MODULES.get(name)
+    if family is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{family}", __name__), name)
+    # Cache the function, so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
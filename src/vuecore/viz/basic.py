@@ -0,0 +1,1282 @@
+"""Basic statistical plots (bar, box, scatter, histogram, PCA, ...)."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.figure_factory as FF
+import plotly.graph_objs as go
+import plotly.subplots as tools
+from dash import dcc
+from scipy import stats
+from scipy.stats import zscore
+
+
+def getPlotTraces(
+    data, key="full", type="lines", div_factor=float(10 ^ 10000), horizontal=False
+):
+    """
+    This function returns traces for different kinds of plots.
+
+    :param data: Pandas DataFrame with one variable as data.index (i.e. 'x')
+                 and all others as columns (i.e. 'y').
+    :param str type: 'lines', 'scaled markers', 'bars'.
+    :param float div_factor: relative size of the markers.
+    :param bool horizontal: bar orientation.
+    :return: list of traces.
+
+    Example 1::
+
+        result = getPlotTraces(data, key='full', type = 'lines', horizontal=False)
+
+    Example 2::
+
+        result = getPlotTraces(data, key='full', type = 'scaled markers',
+                               div_factor=float(10^3000), horizontal=True)
+    """
+    if type == "lines":
+        traces = [
+            go.Scattergl(
+                x=data.index, y=data[col], name=col + " " + key, mode="markers+lines"
+            )
+            for col in data.columns
+        ]
+
+    elif type == "scaled markers":
+        traces = [
+            go.Scattergl(
+                x=data.index,
+                y=data[col],
+                name=col + " " + key,
+                mode="markers",
+                marker=dict(size=data[col].values / div_factor, sizemode="area"),
+            )
+            for col in data.columns
+        ]
+
+    elif type == "bars":
+        traces = [
+            go.Bar(x=data.index, y=data[col], orientation="v", name=col + " " + key)
+            for col in data.columns
+        ]
+        if horizontal:
+            traces = [
+                go.Bar(x=data[col], y=data.index, orientation="h", name=col + " " + key)
+                for col in data.columns
+            ]
+
+    else:
+        return "Option not found"
+
+    return traces
+
+
+def get_markdown(text, args={}):
+    """
+    Converts a given text into a Dash Markdown component. It includes a syntax for things
+    like bold text and italics, links, inline code snippets, lists, quotes, and more.
+
+    For more information visit https://dash.plot.ly/dash-core-components/markdown.
+
+    :param str text: markdown string (or array of strings) that adhreres to the CommonMark spec.
+    :param dict args: dictionary with items from https://dash.plot.ly/dash-core-components/markdown.
+    :return: dash Markdown component.
+    """
+    mkdown = dcc.Markdown(text)
+
+    return mkdown
+
+
+def get_pieplot(data, identifier, args):
+    """
+    This function plots a simple Pie plot.
+
+    :param data: pandas DataFrame with values to plot as columns and labels as index.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **valueCol** (str) -- name of the column with the values to be plotted.
+        * **textCol** (str) -- name of the column \
+            containing information for the hoverinfo parameter.
+        * **height** (str) -- height of the plot.
+        * **width** (str) -- width of the plot.
+    :return: Pieplot figure within the <div id="_dash-app-content">.
+    """
+    figure = {}
+    figure["data"] = []
+    figure["data"].append(
+        go.Pie(
+            labels=data.index,
+            values=data[args["valueCol"]],
+            hovertext=data[args["textCol"]],
+            hoverinfo="label+text+percent",
+        )
+    )
+    figure["layout"] = go.Layout(
+        height=args["height"],
+        width=args["width"],
+        annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+        template="plotly_white",
+    )
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+def get_distplot(data, identifier, args):
+    """
+
+    :param data:
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **group** (str) -- name of the column containing the group.
+
+    """
+    df = data.copy()
+    graphs = []
+
+    df = df.set_index(args["group"])
+    df = df.transpose()
+    df = df.dropna()
+
+    for i in df.index.unique():
+        hist_data = []
+        for c in df.columns.unique():
+            hist_data.append(df.loc[i, c].values.tolist())
+        group_labels = df.columns.unique().tolist()
+        # Create distplot with custom bin_size
+        fig = FF.create_distplot(
+            hist_data, group_labels, bin_size=0.5, curve_type="normal"
+        )
+        fig["layout"].update(
+            height=600,
+            width=1000,
+            title="Distribution plot " + i,
+            annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+            template="plotly_white",
+        )
+        graphs.append(dcc.Graph(id=identifier + "_" + i, figure=fig))
+
+    return graphs
+
+
+def get_boxplot_grid(data, identifier, args):
+    """
+    This function plots a boxplot in a grid based on column values.
+
+    :param data: pandas DataFrame with columns: 'x' values and 'y' values to plot,
+                 'color' and 'facet' (color and facet can be the same).
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **title** (str) -- plot title.
+        * **x** (str) -- name of column with x values.
+        * **y** (str) -- name of column with y values.
+        * **color** (str) -- name of column with colors
+        * **facet** (str) -- name of column specifying grouping
+        * **height** (str) -- plot height.
+        * **width** (str) -- plot width.
+    :return: boxplot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_boxplot_grid(data,
+                                  identifier='Boxplot',
+                                  args:{"title":"Boxplot",
+                                       'x':'sample',
+                                       'y':'identifier',
+                                       'color':'group',
+                                       'facet':'qc_class',
+                                       'axis':'cols'}
+                                )
+    """
+    fig = {}
+    if "x" in args and "y" in args and "color" in args:
+        if "axis" not in args:
+            args["axis"] = "cols"
+        if "facet" not in args:
+            args["facet"] = None
+        if "width" not in args:
+            args["width"] = 2500
+        if "title" not in args:
+            args["title"] = "Boxplot"
+        if "colors" in args:
+            color_map = args["colors"]
+        else:
+            color_map = {}
+
+        if args["axis"] == "rows":
+            fig = px.box(
+                data,
+                x=args["x"],
+                y=args["y"],
+                color=args["color"],
+                color_discrete_map=color_map,
+                points="all",
+                facet_row=args["facet"],
+                width=args["width"],
+            )
+        else:
+            fig = px.box(
+                data,
+                x=args["x"],
+                y=args["y"],
+                color=args["color"],
+                color_discrete_map=color_map,
+                points="all",
+                facet_col=args["facet"],
+                width=args["width"],
+            )
+        fig.update_xaxes(type="category")
+        fig.update_layout(
+            annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+            template="plotly_white",
+        )
+    else:
+        fig = get_markdown(text="Missing arguments. Please, provide: x, y, color")
+
+    return dcc.Graph(id=identifier, figure=fig)
+
+
+def get_barplot(data, identifier, args):
+    """
+    This function plots a simple barplot.
+
+    :param data: pandas DataFrame with three columns:
+                 'name' of the bars, 'x' values and 'y' values to plot.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **title** (str) -- plot title.
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **height** (str) -- plot height.
+        * **width** (str) -- plot width.
+    :return: barplot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_barplot(data, identifier='barplot', args={'title':'Figure with Barplot'})
+    """
+    figure = {}
+    figure["data"] = []
+    if "title" not in args:
+        args["title"] = "Barplot {} - {}".format(args["x"], args["y"])
+    if "x_title" not in args:
+        args["x_title"] = args["x"]
+    if "y_title" not in args:
+        args["y_title"] = args["y"]
+    if "height" not in args:
+        args["height"] = 600
+    if "width" not in args:
+        args["width"] = 600
+    if "group" in args:
+        for g in data[args["group"]].unique():
+            color = None
+            if "colors" in args:
+                if g in args["colors"]:
+                    color = args["colors"][g]
+            errors = []
+            if "errors" in args:
+                errors = data.loc[data[args["group"]] == g, args["errors"]]
+
+            if "orientation" in args:
+                trace = go.Bar(
+                    x=data.loc[data[args["group"]] == g, args["x"]],
+                    y=data.loc[data[args["group"]] == g, args["y"]],
+                    error_y=dict(type="data", array=errors),
+                    name=g,
+                    marker=dict(color=color),
+                    orientation=args["orientation"],
+                )
+            else:
+                trace = go.Bar(
+                    x=data.loc[
+                        data[args["group"]] == g, args["x"]
+                    ],  # assign x as the dataframe column 'x'
+                    y=data.loc[data[args["group"]] == g, args["y"]],
+                    error_y=dict(type="data", array=errors),
+                    name=g,
+                    marker=dict(color=color),
+                )
+            figure["data"].append(trace)
+    else:
+        if "orientation" in args:
+            figure["data"].append(
+                go.Bar(
+                    x=data[args["x"]],
+                    y=data[args["y"]],
+                    orientation=args["orientation"],
+                )
+            )
+        else:
+            figure["data"].append(
+                go.Bar(
+                    x=data[args["x"]],
+                    y=data[args["y"]],
+                )
+            )
+    figure["layout"] = go.Layout(
+        title=args["title"],
+        xaxis={"title": args["x_title"], "type": "category"},
+        yaxis={"title": args["y_title"]},
+        height=args["height"],
+        width=args["width"],
+        annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+        template="plotly_white",
+    )
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+def get_histogram(data, identifier, args):
+    """
+    Basic histogram figure allows facets cols and rows
+
+    :param data: pandas dataframe with at least values to be plotted.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **x** (str) -- name of the column containing values to plot in the x axis.
+        * **y** (str) -- name of the column containing values to plot in the y axis (if used).
+        * **color** (str) -- name of the column that defines how the histogram is colored (if used).
+        * **facet_row** (str) -- name of the column to be used as 'facet' row (if used).
+        * **facet_col** (str) -- name of the column to be used as 'facet' column (if used).
+        * **height** (int) -- height of the plot
+        * **width** (int) -- width of the plot
+        * **title** (str) -- plot title.
+    :return: dash componenet with histogram figure
+
+    Example::
+
+        result = get_histogram(data,
+                               identifier='histogram',
+                               args={'x':'a',
+                                     'color':'group',
+                                     'facet_row':'sample',
+                                     'title':'Facet Grid Plot'}
+                            )
+    """
+    figure = None
+    if "x" in args and args["x"] in data:
+        if "y" not in args:
+            args["y"] = None
+        elif args["y"] not in data:
+            args["y"] = None
+        if "color" not in args:
+            args["color"] = None
+        elif args["color"] not in data:
+            args["color"] = None
+        if "facet_row" not in args:
+            args["facet_row"] = None
+        elif args["facet_row"] not in data:
+            args["facet_row"] = None
+        if "facet_col" not in args:
+            args["facet_col"] = None
+        elif args["facet_col"] not in data:
+            args["facet_col"] = None
+        if "height" not in args:
+            args["height"] = 800
+        if "width" not in args:
+            args["width"] = None
+        if "title" not in args:
+            args["title"] = None
+
+        figure = px.histogram(
+            data,
+            x=args["x"],
+            y=args["y"],
+            color=args["color"],
+            facet_row=args["facet_row"],
+            facet_col=args["facet_col"],
+            height=args["height"],
+            width=args["width"],
+        )
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+# ToDo
+def get_facet_grid_plot(data, identifier, args):
+    """
+    This function plots a scatterplot matrix where we can plot one variable against another
+    to form a regular scatter plot, and we can pick a third faceting variable
+    to form panels along the columns to segment the data even further,
+    forming a bunch of vertical panels.
+
+    For more information visit https://plot.ly/python/facet-trellis/.
+
+    :param data: pandas dataframe with format:
+                 'group', 'name', 'type', and 'x' and 'y' values to be plotted.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **x** (str) -- name of the column containing values to plot in the x axis.
+        * **y** (str) -- name of the column containing values to plot in the y axis.
+        * **group** (str) -- name of the column containing the group.
+        * **class** (str) -- name of the column to be used as 'facet' column.
+        * **plot_type** (str) -- decides the type of plot to appear in the facet grid. \
+                The options are 'scatter', 'scattergl', 'histogram', 'bar', and 'box'.
+        * **title** (str) -- plot title.
+    :return: facet grid figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_facet_grid_plot(data,
+                                     identifier='facet_grid',
+                                     args={'x':'a',
+                                           'y':'b',
+                                           'group':'group',
+                                           'class':'type',
+                                           'plot_type':'bar',
+                                           'title':'Facet Grid Plot'}
+                                    )
+    """
+    figure = FF.create_facet_grid(
+        data,
+        x=args["x"],
+        y=args["y"],
+        marker={"opacity": 1.0},
+        facet_col=args["class"],
+        color_name=args["group"],
+        color_is_cat=True,
+        trace_type=args["plot_type"],
+    )
+    figure["layout"] = dict(
+        title=args["title"].title(),
+        paper_bgcolor=None,
+        legend=None,
+        annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+        template="plotly_white",
+    )
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+def get_ranking_plot(data, identifier, args):
+    """
+    Creates abundance multiplots (one per sample group).
+
+    :param data: long-format pandas dataframe with group as index,
+                 'name' (protein identifiers) and 'y' (LFQ intensities) as columns.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below
+    :Arguments:
+        * **group** (str) -- name of the column containing the group.
+        * **index** (bool) -- set to True when multi samples per group. \
+            Calculates the mean intensity for each protein in each group.
+        * **x_title** (str) -- title of plot x axis.
+        * **y_title** (str) -- title of plot y axis.
+        * **title** (str) -- plot title.
+        * **width** (int) -- plot width.
+        * **height** (int) -- plot height.
+        * **annotations** (dict, optional) -- dictionary where data points names are \
+            the keys and descriptions are the values.
+    :return: multi abundance plot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_ranking_plot(data,
+                                  identifier='ranking',
+                                  args={'group':'group',
+                                        'index':'',
+                                        'x_title':'x_axis',
+                                        'y_title':'y_axis',
+                                        'title':'Ranking Plot',
+                                        'width':100,
+                                        'height':150,
+                                        'annotations':{
+                                            'GPT~P24298': 'liver disease',
+                                            'CP~P00450': 'Wilson disease'}
+                                        }
+                                )
+    """
+    # data['y'] = data['y'].rpow(2)
+    # data['y'] = np.log10(data['y'])
+
+    num_cols = 3
+    fig = {}
+    layouts = []
+    if "index" in args and args["index"]:
+        num_groups = len(data.index.unique())
+        num_rows = math.ceil(num_groups / num_cols)
+        fig = tools.make_subplots(
+            rows=num_rows, cols=num_cols, shared_yaxes=True, print_grid=False
+        )
+        r = 1
+        c = 1
+        range_y = [data["y"].min(), data["y"].max() + 1]
+        i = 0
+        for index in data.index.unique():
+            gdata = (
+                data.loc[index, :]
+                .dropna()
+                .groupby("name", as_index=False)
+                .mean()
+                .sort_values(by="y", ascending=False)
+            )
+            gdata = gdata.reset_index().reset_index()
+            cols = ["x", "group", "name", "y"]
+            cols.extend(gdata.columns[4:])
+            gdata.columns = cols
+            if "colors" in args:
+                gdata["colors"] = args["colors"][index]
+
+            gfig = get_simple_scatterplot(gdata, identifier + "_" + str(index), args)
+            trace = gfig.figure["data"].pop()
+            glayout = gfig.figure["layout"]["annotations"]
+
+            for _l in glayout:
+                nlayout = dict(
+                    x=_l.x,
+                    y=_l.y,
+                    xref="x" + str(i + 1),
+                    yref="y" + str(i + 1),
+                    text=_l.text,
+                    showarrow=True,
+                    ax=_l.ax,
+                    ay=_l.ay,
+                    font=_l.font,
+                    align="center",
+                    arrowhead=1,
+                    arrowsize=1,
+                    arrowwidth=1,
+                    arrowcolor="#636363",
+                )
+                layouts.append(nlayout)
+            trace.name = index
+            fig.append_trace(trace, r, c)
+
+            if c >= num_cols:
+                r += 1
+                c = 1
+            else:
+                c += 1
+            i += 1
+        fig["layout"].update(
+            dict(
+                height=args["height"],
+                width=args["width"],
+                title=args["title"],
+                xaxis={"title": args["x_title"], "autorange": True},
+                yaxis={"title": args["y_title"], "range": range_y},
+                template="plotly_white",
+            )
+        )
+        [
+            fig["layout"][e].update(range=range_y)
+            for e in fig["layout"]
+            if e[0:5] == "yaxis"
+        ]
+        fig["layout"].annotations = [
+            dict(xref="paper", yref="paper", showarrow=False, text="")
+        ] + layouts
+    else:
+        if "group" in args:
+            identifier = identifier + f"_{args['group']}"
+        # ! get_simple_scatterplot does not use identifier...
+        fig = get_simple_scatterplot(data, identifier, args).figure
+
+    return dcc.Graph(id=identifier, figure=fig)
+
+
+def get_scatterplot_matrix(data, identifier, args):
+    """
+    This function pltos a multi scatterplot (one for each unique element in args['group']).
+
+    :param data: pandas dataframe with four columns: 'name' of the data points,
+                 'x' and 'y' values to plot, and 'group' they belong to.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below
+    :Arguments:
+        * **group** (str) -- name of the column containing the group.
+        * **title** (str) -- plot title.
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **height** (int) -- plot height.
+        * **width** (int) -- plot width.
+        * **annotations** (dict, optional) -- dictionary where data points names are \
+                                              the keys and descriptions are the values.
+    :return: multi scatterplot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_scatterplot_matrix(data,
+                                        identifier='scatter matrix',
+                                        args={'group':'group',
+                                              'title':'Scatter Plot Matrix',
+                                              'x_title':'x_axis',
+                                              'y_title':'y_axis',
+                                              'height':100,
+                                              'width':100,
+                                              'annotations':{
+                                                  'GPT~P24298': 'liver disease',
+                                                  'CP~P00450': 'Wilson disease'}
+                                                }
+                                        )
+    """
+    num_cols = 3
+    fig = {}
+    if "group" in args and args["group"] in data.columns:
+        group = args["group"]
+        num_groups = len(data[group].unique())
+        num_rows = math.ceil(num_groups / num_cols)
+        if "colors" not in data.columns:
+            if "colors" in args:
+                data["colors"] = [
+                    args["colors"][g] if g in args["colors"] else "#999999"
+                    for g in data[group]
+                ]
+
+        fig = tools.make_subplots(
+            rows=num_rows, cols=num_cols, shared_yaxes=True, print_grid=False
+        )
+        r = 1
+        c = 1
+        range_y = None
+        if pd.api.types.is_numeric_dtype(data["y"]):
+            range_y = [data["y"].min(), data["y"].max() + 1]
+
+        for g in data[group].unique():
+            gdata = data[data[group] == g].dropna()
+            gfig = get_simple_scatterplot(gdata, identifier + "_" + str(g), args)
+            trace = gfig["data"].pop()
+            trace.name = g
+            fig.append_trace(trace, r, c)
+
+            if c >= num_cols:
+                r += 1
+                c = 1
+            else:
+                c += 1
+
+        fig["layout"].update(
+            dict(
+                height=args["height"],
+                width=args["width"],
+                title=args["title"],
+                xaxis={"title": args["x_title"], "autorange": True},
+                yaxis={"title": args["y_title"], "range": range_y},
+                template="plotly_white",
+            )
+        )
+
+        fig["layout"].annotations = [
+            dict(xref="paper", yref="paper", showarrow=False, text="")
+        ]
+
+    return fig
+
+
+def get_simple_scatterplot(data, identifier, args):
+    """
+    Plots a simple scatterplot with the possibility of including in-plot annotations of data points.
+
+    :param data: long-format pandas dataframe with columns: 'x' (ranking position),
+                 'group' (original dataframe position), 'name' (protein identifier),
+                 'y' (LFQ intensity), 'symbol' (data point shape) and 'size' (data point size).
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **annotations** (dict) -- dictionary where data points names are \
+                                    the keys and descriptions are the values.
+        * **title** (str) -- plot title.
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **height** (int) -- plot height.
+        * **width** (int) -- plot width.
+    :return: annotated scatterplot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_simple_scatterplot(data,
+                                        identifier='scatter plot',
+                                        args={'annotations':{'GPT~P24298': 'liver disease',
+                                                             'CP~P00450': 'Wilson disease'}',
+                                              'title':'Scatter Plot',
+                                              'x_title':'x_axis',
+                                              'y_title':'y_axis',
+                                              'height':100,
+                                              'width':100}
+                                        )
+    """
+    figure = {}
+    m = {"size": 15, "line": {"width": 0.5, "color": "grey"}}
+    text = data.name
+    if "colors" in data.columns:
+        m.update({"color": data["colors"].tolist()})
+    elif "colors" in args:
+        m.update({"color": args["colors"]})
+    if "size" in data.columns:
+        m.update({"size": data["size"].tolist()})
+    if "symbol" in data.columns:
+        m.update({"symbol": data["symbol"].tolist()})
+
+    annots = []
+    if "annotations" in args:
+        for index, row in data.iterrows():
+            name = str(row["name"]).split(" ")[0]
+            if name in args["annotations"]:
+                annots.append(
+                    {
+                        "x": row["x"],
+                        "y": row["y"],
+                        "xref": "x",
+                        "yref": "y",
+                        "text": name,
+                        "showarrow": False,
+                        "ax": 55,
+                        "ay": -1,
+                        "font": dict(size=8),
+                    }
+                )
+    figure["data"] = [
+        go.Scattergl(
+            x=data.x,
+            y=data.y,
+            text=text,
+            mode="markers",
+            opacity=0.7,
+            marker=m,
+        )
+    ]
+
+    figure["layout"] = go.Layout(
+        title=args["title"],
+        xaxis={"title": args["x_title"]},
+        yaxis={"title": args["y_title"]},
+        # margin={'l': 40, 'b': 40, 't': 30, 'r': 10},
+        legend={"x": 0, "y": 1},
+        hovermode="closest",
+        height=args["height"],
+        width=args["width"],
+        annotations=annots
+        + [dict(xref="paper", yref="paper", showarrow=False, text="")],
+        showlegend=False,
+        template="plotly_white",
+    )
+
+    return figure
+
+
+def get_scatterplot(data, identifier, args):
+    """
+    This function plots a simple Scatterplot.
+
+    :param data: is a Pandas DataFrame with four columns: "name", x values and y values
+                 (provided as variables) to plot.
+    :param str identifier: is the id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **title** (str) -- title of the figure.
+        * **x** (str) -- column in dataframe with values for x
+        * **y** (str) -- column in dataframe with values for y
+        * **group** (str) -- column in dataframe with the groups - translates into colors \
+                             (default None)
+        * **hovering_cols** (list) -- list of columns in dataframe that will be shown when \
+                                      hovering over a dot
+        * **size**  (str) -- column in dataframe that contains the size of the dots (default None)
+        * **trendline** (bool) -- whether or not to draw a trendline
+        * **text** (str) -- column in dataframe that contains the values shown for each dot
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **height** (int) -- plot height.
+        * **width** (int) -- plot width.
+        * **colors** (dict) -- dictionary with colors to be used for each group
+    :return: scatterplot figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_scatterplot(data,
+                                 identifier='scatter plot',
+                                 args={'title':'Scatter Plot',
+                                        'x_title':'x_axis',
+                                        'y_title':'y_axis',
+                                        'height':100,
+                                        'width':100}
+                                )
+    """
+    annotation = []
+    title = "Scatter plot"
+    x_title = "x"
+    y_title = "y"
+    height = 800
+    width = 800
+    size = None
+    symbol = None
+    x = "x"
+    y = "y"
+    trendline = None
+    group = None
+    text = None
+    if "x" in args:
+        x = args["x"]
+    if "y" in args:
+        y = args["y"]
+    if "group" in args:
+        group = args["group"]
+    if "hovering_cols" in args:
+        annotation = args["hovering_cols"]
+    if "title" in args:
+        title = args["title"]
+    if "x_title" in args:
+        x_title = args["x_title"]
+    if "y_title" in args:
+        y_title = args["y_title"]
+    if "height" in args:
+        height = args["height"]
+    if "width" in args:
+        width = args["width"]
+    if "size" in args:
+        size = args["size"]
+    if "symbol" in args:
+        symbol = args["symbol"]
+    if "trendline" in args:
+        trendline = args["trendline"]
+    if "text" in args:
+        text = args["text"]
+
+    if "colors" in args and isinstance(args["colors"], dict):
+        figure = px.scatter(
+            data,
+            x=x,
+            y=y,
+            color=group,
+            color_discrete_map=args["colors"],
+            hover_data=annotation,
+            size=size,
+            symbol=symbol,
+            trendline=trendline,
+            text=text,
+        )
+    elif "density" in args and args["density"]:
+        color = get_density(data[x], data[y])
+        figure = px.scatter(
+            data,
+            x=x,
+            y=y,
+            color=color,
+            hover_data=annotation,
+            size=size,
+            symbol=symbol,
+            trendline=trendline,
+            text=text,
+        )
+    else:
+        figure = px.scatter(
+            data,
+            x=x,
+            y=y,
+            color=group,
+            hover_data=annotation,
+            size=size,
+            symbol=symbol,
+            trendline=trendline,
+            text=text,
+        )
+
+    figure.update_traces(
+        marker=dict(size=14, opacity=0.7, line=dict(width=0.5, color="DarkSlateGrey")),
+        selector=dict(mode="markers"),
+    )
+    figure["layout"] = go.Layout(
+        title=title,
+        xaxis={"title": x_title},
+        yaxis={"title": y_title},
+        legend=dict(orientation="h", yanchor="bottom", y=1.0, xanchor="right", x=1),
+        hovermode="closest",
+        height=height,
+        width=width,
+        annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+        template="plotly_white",
+    )
+
+    return figure
+
+
+def get_density(x: np.ndarray, y: np.ndarray):
+    """Get kernal density estimate for each (x, y) point."""
+    values = np.vstack([x, y])
+    kernel = stats.gaussian_kde(values)
+    density = kernel(values)
+
+    return density
+
+
+def get_pca_plot(data, identifier, args):
+    """
+    This function creates a pca plot with scores and top "args['loadings']" loadings.
+
+    :param tuple data: tuple with two pandas dataframes: scores and loadings.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below
+    :Arguments:
+        * **loadings** (int) -- number of features with highest loading values \
+                                to be displayed in the pca plot
+        * **title** (str) -- title of the figure
+        * **x_title** (str) -- plot x axis title
+        * **y_title** (str) -- plot y axis title
+        * **height** (int) -- plot height
+        * **width** (int) -- plot width
+    :return: PCA figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_pca_plot(data,
+                              identifier='pca',
+                              args={'loadings':15,
+                                    'title':'PCA Plot',
+                                    'x_title':'PC1',
+                                    'y_title':'PC2',
+                                    'height':100,
+                                    'width':100}
+                            )
+    """
+    pca_data, loadings, variance = data
+    figure = {}
+    traces = []
+    annotations = []
+    sct = get_scatterplot(pca_data, identifier, args)
+    traces.extend(sct["data"])
+    figure["layout"] = sct["layout"]
+    factor = 50
+    num_loadings = 15
+    if "factor" in args:
+        factor = args["factor"]
+    if "loadings" in args:
+        num_loadings = args["loadings"]
+
+    for index in list(loadings.index)[0:num_loadings]:
+        x = loadings.loc[index, "x"] * factor
+        y = loadings.loc[index, "y"] * factor
+        value = loadings.loc[index, "value"]
+
+        trace = go.Scattergl(
+            x=[0, x],
+            y=[0, y],
+            mode="markers+lines",
+            text=str(index) + " loading: {0:.2f}".format(value),
+            name=index,
+            marker=dict(
+                size=3,
+                symbol=1,
+                color="darkgrey",  # set color equal to a variable
+                showscale=False,
+                opacity=0.9,
+            ),
+            showlegend=False,
+        )
+        annotation = dict(
+            x=x * 1.15,
+            y=y * 1.15,
+            xref="x",
+            yref="y",
+            text=index,
+            showarrow=False,
+            font=dict(size=12, color="darkgrey"),
+            align="center",
+            ax=20,
+            ay=-30,
+        )
+        annotations.append(annotation)
+        traces.append(trace)
+
+    figure["data"] = traces
+    figure["layout"].annotations = annotations
+    figure["layout"]["template"] = "plotly_white"
+
+    return figure
+
+
+def get_violinplot(data, identifier, args):
+    """
+    This function creates a violin plot for all columns in the input dataframe.
+
+    :param data: pandas dataframe with samples as rows and dependent variables as columns.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below
+    :Arguments:
+        * **drop_cols** (list) -- column labels to be dropped from the dataframe.
+        * **group** (str) -- name of the column containing the group.
+    :return: list of violion plots within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_violinplot(data,
+                                identifier='violinplot,
+                                args={'drop_cols':['sample', 'subject'],
+                                      'group':'group'}
+                                )
+    """
+    df = data.copy()
+    graphs = []
+    color_map = {}
+    if "colors" in args:
+        color_map = args["colors"]
+    if "drop_cols" in args:
+        if len(list(set(args["drop_cols"]).intersection(df.columns))) == len(
+            args["drop_cols"]
+        ):
+            df = df.drop(args["drop_cols"], axis=1)
+
+    for c in df.columns.unique():
+        if c != args["group"]:
+            figure = create_violinplot(
+                df, x=args["group"], y=c, color=args["group"], color_map=color_map
+            )
+            figure.update_layout(
+                annotations=[
+                    dict(xref="paper", yref="paper", showarrow=False, text="")
+                ],
+                template="plotly_white",
+            )
+            graphs.append(dcc.Graph(id=identifier + "_" + c, figure=figure))
+
+    return graphs
+
+
+def create_violinplot(df, x, y, color, color_map={}):
+    """
+    This function creates traces for a simple violin plot.
+
+    :param df: pandas dataframe with samples as rows and dependent variables as columns.
+    :param (str) x: name of the column containing the group.
+    :param (str) y: name of the column with the dependent variable.
+    :param (str) color: name of the column used for coloring.
+    :param (dict) color_map: dictionary with custom colors
+    :return: plotly figure.
+
+    Example::
+
+        result = create_violinplot(df, x='group', y='protein a', color='group', color_map={})
+    """
+    # traces = [] # ! or is this some hack?
+    violin = px.violin(
+        df, x=x, y=y, color=color, color_discrete_map=color_map, box=True, points="all"
+    )
+
+    return violin
+
+
+def get_parallel_plot(data, identifier, args):
+    """
+    This function creates a parallel coordinates plot, with sample groups as the different
+    dimensions.
+
+    :param data: pandas dataframe with groups as rows and dependent variables as columns.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **group** (str) -- name of the column containing the groups.
+        * **zscore** (bool) -- if True, calculates the z score of each values in the row, \
+            relative to the row mean and standard deviation.
+        * **color** (str) -- line color.
+        * **title** (str) -- plot title.
+    :return: parallel plot figure within <div id="_dash-app-content"> .
+
+    Example::
+
+        result = get_parallel_plot(data,
+                                   identifier='parallel plot',
+                                   args={'group':'group',
+                                         'zscore':True,
+                                         'color':'blue',
+                                         'title':'Parallel Plot'}
+                                    )
+    """
+    fig = None
+    if "group" in args:
+        group = args["group"]
+        if "zscore" in args:
+            if args["zscore"]:
+                data = data.set_index(group).apply(zscore)
+                data = data.reset_index()
+        color = "#de77ae"
+        if "color" in args:
+            color = args["color"]
+        group_values = data.groupby(group).mean()
+        min_val = group_values._get_numeric_data().min().min()
+        max_val = group_values._get_numeric_data().max().max()
+        dims = []
+        for i in group_values.index:
+            values = group_values.loc[i].values.tolist()
+
+            dim = dict(label=i, range=[min_val, max_val], values=values)
+            dims.append(dim)
+
+        fig_data = [go.Parcoords(line=dict(color=color), dimensions=dims)]
+        layout = go.Layout(
+            title=args["title"],
+            annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+            template="plotly_white",
+        )
+
+        fig = dict(data=fig_data, layout=layout)
+
+    return dcc.Graph(id=identifier, figure=fig)
+
+
+def get_parallel_coord_plot(data, identifier, args):
+    color = args["color"]
+    labels = {c: c for c in data.columns if c != color}
+    fig = px.parallel_coordinates(data, color=color, labels=labels)
+    return fig
+
+
+def get_polar_plot(df, identifier, args):
+    """
+    This function creates a Polar plot with data aggregated for a given group.
+
+    :param pandas.DataFrame df: dataframe with the data to plot
+    :param str identifier: identifier to be used in the app
+    :param dict args: dictionary containing the arguments needed to plot the figure (
+                      value_col (value to aggregate), group_col (group by), color_col (color by))
+    :return: Dash Graph
+
+    Example::
+
+        figure = get_polar_plot(df,
+                                identifier='polar',
+                                args={'value_col':'intensity',
+                                      'group_col':'modifier',
+                                      'color_col':'group'}
+                                )
+    """
+    figure = {}
+    ptype = "bar"
+    width = 800
+    height = 700
+    value = "value"
+    group = None
+    colors = None
+    if not df.empty:
+        if "value_col" in args:
+            value = args["value_col"]
+        if "theta_col" in args:
+            group = args["theta_col"]
+        if "color_col" in args:
+            colors = args["color_col"]
+        if "width" in args:
+            width = args["width"]
+        if "height" in args:
+            height = args["height"]
+        if "type" in args:
+            ptype = args["type"]
+
+        figure = go.Figure()
+        if value is not None and group is not None and colors is not None:
+            if not df.empty:
+                min_value = df[value].min()
+                max_value = df[value].max()
+                if ptype == "line":
+                    for color in df[colors].unique():
+                        cdf = df[df[colors] == color]
+                        figure.add_trace(
+                            go.Scatterpolar(
+                                r=cdf[value],
+                                theta=cdf[group],
+                                mode="lines",
+                                name=color,
+                                fill="toself",
+                            )
+                        )
+                else:
+                    print(
+                        "Type {} not available. Try with 'line' or 'bar' types.".format(
+                            ptype
+                        )
+                    )
+
+                figure.update_layout(
+                    width=width,
+                    height=height,
+                    polar=dict(radialaxis=dict(range=[min_value, max_value])),
+                )
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+def get_enrichment_plots(enrichment_results, identifier, args):
+    """
+    This function generates a scatter plot with enriched terms (y-axis)
+    and their adjusted pvalues (x-axis)
+
+    :param pandas.DataFrame enrichment_results: dataframe with the enrichment data to plot
+                                         (see enrichment functions for format)
+    :param str identifier: identifier to be used in the app
+    :param dict args: dictionary containing the arguments needed to plot the figure
+                      (width, height, title)
+    :return list: list of scatter plots one for each enrichment table available
+                  (i.e pairwise comparisons)
+
+    Example::
+
+        figure = get_enrichment_plots(df,
+                                     identifier='enrichment',
+                                     args={'width':1500,
+                                           'height':800,
+                                           'title':'Enrichment'}
+                                    )
+    """
+    figures = []
+    width = 900
+    height = 800
+    colors = {
+        "upregulated": "#cb181d",
+        "downregulated": "#3288bd",
+        "regulated": "#ae017e",
+        "non-regulated": "#fcc5c0",
+    }
+    title = "Enrichment"
+    if "width" in args:
+        width = args["width"]
+    if "height" in args:
+        height = args["height"]
+    if "title" in args:
+        title = args["title"]
+
+    if not isinstance(enrichment_results, dict):
+        aux = enrichment_results.copy()
+        enrichment_results = {"regulated~non-regulated": aux}
+
+    for g in enrichment_results:
+        g1, g2 = g.split("~")
+        group = "direction"
+        nid = identifier + "_{}_{}".format(g1, g2)
+        if not enrichment_results[g].empty:
+            df = enrichment_results[g][enrichment_results[g].rejected]
+            if "direction" not in df:
+                group = None
+            if not df.empty:
+                df = df.sort_values(by=[group, "padj"], ascending=False)
+                df["x"] = -np.log10(df["padj"])
+                fig = get_scatterplot(
+                    df,
+                    identifier=nid,
+                    args={
+                        "x": "x",
+                        "y": "terms",
+                        "group": group,
+                        "title": "{} {} vs {}".format(title, g1, g2),
+                        "symbol": group,
+                        "colors": colors,
+                        "x_title": "-log10(padj)",
+                        "y_title": "Enriched terms",
+                        "width": width,
+                        "height": height,
+                        "hovering_cols": [
+                            "foreground",
+                            "foreground_pop",
+                            "background",
+                            "background_pop",
+                            "pvalue",
+                            "padj",
+                            "identifiers",
+                        ],
+                        "size": "foreground",
+                    },
+                )
+                figures.append(fig)
+
+    return figures
@@ -0,0 +1,72 @@
+"""Figure export and conversion helpers."""
+
+import json
+import os
+
+import plotly
+import plotly.graph_objs as go
+import plotly.io as pio
+import plotly.tools as tls
+
+
+def save_DASH_plot(plot, name, plot_format="svg", directory=".", width=800, height=700):
+    """
+    This function saves a plotly figure to a specified directory, in a determined format.
+
+    :param plot: plotly figure (dictionary with data and layout)
+    :param str name: name of the figure
+    :param str plot_format: suffix of the saved file ('svg', 'pdf', 'png', 'jpeg', 'jpg')
+    :param str directory: folder where figure is to be saved
+    :return: figure saved in directory
+
+    Example::
+
+        result = save_DASH_plot(plot, name='Plot example',
+                                plot_format='svg', directory='/data/plots')
+    """
+    try:
+        if not os.path.exists(directory):
+            os.mkdir(directory)
+        plot_file = os.path.join(directory, str(name) + "." + str(plot_format))
+        if plot_format in ["svg", "pdf", "png", "jpeg", "jpg"]:
+            if hasattr(plot, "figure"):
+                pio.write_image(plot.figure, plot_file, width=width, height=height)
+            else:
+                pio.write_image(plot, plot_file, width=width, height=height)
+        elif plot_format == "json":
+            figure_json = json.dumps(plot.figure, cls=plotly.utils.PlotlyJSONEncoder)
+            with open(plot_file, "w") as f:
+                f.write(figure_json)
+    except ValueError as err:
+        print("Plot could not be saved. Error: {}".format(err))
+
+
+def mpl_to_plotly(fig, ci=True, legend=True):
+    # ToDo Test how it works for multiple groups
+    # ToDo Allow visualization of CI
+    # Convert mpl fig obj to plotly fig obj, resize to plotly's default
+    py_fig = tls.mpl_to_plotly(fig, resize=True)
+    # Add fill property to lower limit line
+    if ci:
+        style1 = dict(fill="tonexty")
+        # apply style
+        py_fig["data"][2].update(style1)
+
+    # change the default line type to 'step'
+    # py_fig.update_traces(dict(line=go.layout.shape.Line({'dash':'solid'})))
+    py_fig["data"] = py_fig["data"][0:2]
+    # Delete misplaced legend annotations
+    py_fig["layout"].pop("annotations", None)
+
+    if legend:
+        # Add legend, place it at the top right corner of the plot
+        py_fig["layout"].update(
+            font=dict(size=14),
+            showlegend=True,
+            height=400,
+            width=1000,
+            template="plotly_white",
+            legend=go.layout.Legend(x=1.05, y=1),
+        )
+    # Send updated figure object to Plotly, show result in notebook
+    return py_fig
@@ -0,0 +1,408 @@
+"""Heatmaps and clustered heatmaps."""
+
+import math
+
+import numpy as np
+import plotly.figure_factory as FF
+import plotly.graph_objs as go
+from dash import MATCH, Input, Output, State, callback, dcc, html
+from dash.exceptions import PreventUpdate
+from scipy.spatial.distance import pdist, squareform
+
+from ..linkers import get_clustergrammer_link
+from ..utils import clustering
+from ..utils.cache import ServerStore
+from ..utils.downsampling import aggregate_blocks
+
+# Component type of the zoomable heatmaps, matched by their zoom callback
+ZOOM_HEATMAP_TYPE = "vuecore-zoom-heatmap"
+
+# Tilers of the zoomable heatmaps, by the token of each rendered graph. Each
+# tiler holds a float copy of its matrix, so only the 16 most recently used
+# ones are kept, and unused ones expire after one hour
+HEATMAP_TILERS = ServerStore(max_entries=16, ttl=3600)
+
+# Maximum number of labeled ticks per axis of aggregated heatmaps
+MAX_HEATMAP_TICKS = 20
+
+
+class HeatmapTiler(object):
+    """
+    Builds heatmap figures of a matrix at a bounded resolution.
+
+    Matrices larger than max_rows x max_cols are aggregated into blocks (see
+    vuecore.utils.downsampling.aggregate_blocks), so the figure size is bounded
+    by the screen resolution instead of the matrix size. The full matrix stays on
+    the server, and zooming into a region aggregates that region only, down to
+    single cells.
+
+    :param data: pandas dataframe with the heatmap rows and columns.
+    :param int max_rows: maximum number of drawn rows.
+    :param int max_cols: maximum number of drawn columns.
+    :param str aggregation: statistic of each block ('mean', 'max' or 'absmax').
+    :param dict layout: figure layout.
+    """
+
+    def __init__(
+        self, data, max_rows=500, max_cols=700, aggregation="mean", layout=None
+    ):
+        self.values = data.to_numpy(dtype=float)
+        self.row_labels = np.asarray(data.index.astype(str))
+        self.col_labels = np.asarray(data.columns.astype(str))
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.aggregation = aggregation
+        self.layout = dict(layout or {})
+
+    def is_aggregated(self):
+        """
+        Returns True if the full matrix does not fit in the maximum resolution.
+        """
+        n_rows, n_cols = self.values.shape
+        return n_rows > (self.max_rows or n_rows) or n_cols > (self.max_cols or n_cols)
+
+    def _ticks(self, labels, starts, size):
+        """
+        Returns at most MAX_HEATMAP_TICKS evenly spaced tick positions and labels.
+        """
+        step = max(1, int(math.ceil(len(starts) / MAX_HEATMAP_TICKS)))
+        positions = starts[::step] + (size - 1) / 2
+        return positions.tolist(), labels[starts[::step]].tolist()
+
+    def figure(self, row_range=None, col_range=None):
+        """
+        Returns the heatmap figure of a region of the matrix.
+
+        Heatmap cells are placed at the positions of the matrix rows and columns, so
+        axis ranges of zoom events select the region to draw.
+
+        :param tuple row_range: first and last row position of the region (all rows if None).
+        :param tuple col_range: first and last column position of the region (all columns if None).
+        :return: Plotly figure dictionary.
+        """
+        n_rows, n_cols = self.values.shape
+        bounds = []
+        for span, n in ((row_range, n_rows), (col_range, n_cols)):
+            if span is None:
+                bounds.append((0, n))
+            else:
+                low, high = sorted(span)
+                bounds.append(
+                    (
+                        max(0, int(math.floor(low + 0.5))),
+                        min(n, int(math.floor(high + 0.5)) + 1),
+                    )
+                )
+        (row_start, row_stop), (col_start, col_stop) = bounds
+        if row_start >= row_stop or col_start >= col_stop:
+            row_start, row_stop, col_start, col_stop = 0, n_rows, 0, n_cols
+
+        z, row_starts, col_starts = aggregate_blocks(
+            self.values[row_start:row_stop, col_start:col_stop],
+            self.max_rows,
+            self.max_cols,
+            self.aggregation,
+        )
+        row_size = row_starts[1] - row_starts[0] if len(row_starts) > 1 else 1
+        col_size = col_starts[1] - col_starts[0] if len(col_starts) > 1 else 1
+        row_starts = row_starts + row_start
+        col_starts = col_starts + col_start
+        y_ticks, y_text = self._ticks(self.row_labels, row_starts, row_size)
+        x_ticks, x_text = self._ticks(self.col_labels, col_starts, col_size)
+
+        layout = dict(self.layout)
+        layout["xaxis"] = dict(
+            tickmode="array", tickvals=x_ticks, ticktext=x_text, showgrid=False
+        )
+        layout["yaxis"] = dict(
+            tickmode="array", tickvals=y_ticks, ticktext=y_text, showgrid=False
+        )
+        heatmap = go.Heatmap(
+            z=z,
+            x0=col_starts[0] + (col_size - 1) / 2,
+            dx=col_size,
+            y0=row_starts[0] + (row_size - 1) / 2,
+            dy=row_size,
+            hovertemplate="x: %{x}<br>y: %{y}<br>z: %{z}<extra></extra>",
+        )
+        return {"data": [heatmap], "layout": layout}
+
+
+# Registered at import, so Dash copies it into every app of this process when
+# the app serves its first request, even if the heatmaps are rendered later
+@callback(
+    Output({"type": ZOOM_HEATMAP_TYPE, "index": MATCH}, "figure"),
+    Input({"type": ZOOM_HEATMAP_TYPE, "index": MATCH}, "relayoutData"),
+    State({"type": ZOOM_HEATMAP_TYPE, "index": MATCH}, "id"),
+    prevent_initial_call=True,
+)
+def update_heatmap_zoom(relayout_data, graph_id):
+    """
+    Redraws the zoomed region of a zoomable heatmap from its tiler.
+
+    :param dict relayout_data: Graph relayoutData property, with the zoomed axis ranges.
+    :param dict graph_id: graph id, whose index is the token of its tiler.
+    :return: heatmap figure of the zoomed region.
+    """
+    tiler = HEATMAP_TILERS.get(graph_id["index"])
+    if tiler is None or not relayout_data:
+        raise PreventUpdate
+    if "xaxis.autorange" in relayout_data or "yaxis.autorange" in relayout_data:
+        return tiler.figure()
+    ranges = {}
+    for axis in ["xaxis", "yaxis"]:
+        if axis + ".range[0]" in relayout_data:
+            ranges[axis] = (
+                relayout_data[axis + ".range[0]"],
+                relayout_data[axis + ".range[1]"],
+            )
+    if not ranges:
+        raise PreventUpdate
+    figure = tiler.figure(ranges.get("yaxis"), ranges.get("xaxis"))
+    # Keep the zoomed view, now drawn at a finer resolution
+    for axis, axis_range in ranges.items():
+        figure["layout"][axis]["range"] = list(axis_range)
+    return figure
+
+
+def get_heatmapplot(data, identifier, args):
+    """
+    This function plots a simple Heatmap.
+
+    :param data: is a Pandas DataFrame with the shape of the heatmap where index corresponds to rows
+        and column names corresponds to columns,
+        values in the heatmap corresponds to the row values.
+    :param str identifier: is the id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **format** (str) -- defines the format of the input dataframe.
+        * **source** (str) -- name of the column containing the source.
+        * **target** (str) -- name of the column containing the target.
+        * **values** (str) -- name of the column containing the values to be plotted.
+        * **title** (str) -- title of the figure.
+        * **max_rows** (int) -- maximum number of drawn rows (500 by default, None to draw all of them). \
+            Larger matrices are aggregated into blocks, see HeatmapTiler.
+        * **max_cols** (int) -- maximum number of drawn columns (700 by default, None to draw all of them).
+        * **aggregation** (str) -- statistic of each aggregated block: 'mean' (default), 'max' or 'absmax'.
+        * **zoom** (bool) -- if True, the full matrix stays on the server and zooming redraws the zoomed region \
+            at a finer resolution. The graph id becomes {'type': ZOOM_HEATMAP_TYPE, 'index': token}, where \
+            the token (identifier + a random suffix) is unique to this render and keys the tiler in \
+            HEATMAP_TILERS. The graph is matched by a callback registered with dash.callback \
+            when this module is imported, so it must be served by a Dash app of this process created, \
+            or serving its first request, after the import. Tilers unused for one hour, or beyond the 16 most recently used, are removed \
+            and their graphs stop redrawing on zoom until they are rendered again.
+    :return: heatmap figure within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_heatmapplot(data,
+                                identifier='heatmap',
+                                args={'format':'edgelist',
+                                      'source':'node1',
+                                      'target':'node2',
+                                      'values':'score',
+                                      'title':'Heatmap Plot'})
+    """
+    df = data.copy()
+    if args["format"] == "edgelist":
+        df = df.set_index(args["source"])
+        df = df.pivot_table(
+            values=args["values"],
+            index=df.index,
+            columns=args["target"],
+            aggfunc="first",
+        )
+        df = df.fillna(0)
+    figure = {}
+    figure["data"] = []
+    figure["layout"] = {
+        "title": args["title"],
+        "height": 500,
+        "width": 700,
+        "annotations": [dict(xref="paper", yref="paper", showarrow=False, text="")],
+        "template": "plotly_white",
+    }
+    max_rows = args["max_rows"] if "max_rows" in args else 500
+    max_cols = args["max_cols"] if "max_cols" in args else 700
+    zoom = "zoom" in args and args["zoom"]
+    n_rows, n_cols = df.shape
+    aggregated = n_rows > (max_rows or n_rows) or n_cols > (max_cols or n_cols)
+    graph_id = identifier
+    if aggregated or zoom:
+        tiler = HeatmapTiler(
+            df,
+            max_rows=max_rows,
+            max_cols=max_cols,
+            aggregation=args["aggregation"] if "aggregation" in args else "mean",
+            layout=figure["layout"],
+        )
+        figure = tiler.figure()
+        if zoom:
+            token = HEATMAP_TILERS.add(tiler, prefix=identifier + "_")
+            graph_id = {"type": ZOOM_HEATMAP_TYPE, "index": token}
+    else:
+        figure["data"].append(
+            go.Heatmap(z=df.values, x=list(df.columns), y=list(df.index))
+        )
+
+    return dcc.Graph(id=graph_id, figure=figure)
+
+
+def get_complex_heatmapplot(data, identifier, args):
+    df = data.copy()
+
+    figure = {"data": [], "layout": {}}
+    if args["format"] == "edgelist":
+        df = df.set_index(args["source"])
+        df = df.pivot_table(
+            values=args["values"],
+            index=df.index,
+            columns=args["target"],
+            aggfunc="first",
+        )
+        df = df.fillna(0)
+    # Both dendrograms cluster the same matrix: the linkage is computed once
+    dendro_kwargs = dict(
+        distfun=lambda values: values,
+        linkagefun=lambda values: clustering.compute_linkage(
+            values, distfun="euclidean", method="complete"
+        ),
+    )
+    dendro_up = FF.create_dendrogram(
+        df.values, orientation="bottom", labels=df.columns, **dendro_kwargs
+    )
+    for i in range(len(dendro_up["data"])):
+        dendro_up["data"][i]["yaxis"] = "y2"
+
+    dendro_side = FF.create_dendrogram(df.values, orientation="right", **dendro_kwargs)
+    for i in range(len(dendro_side["data"])):
+        dendro_side["data"][i]["xaxis"] = "x2"
+
+    figure["data"].extend(dendro_up["data"])
+    figure["data"].extend(dendro_side["data"])
+
+    if args["dist"]:
+        data_dist = pdist(df.values)
+        heat_data = squareform(data_dist)
+    else:
+        heat_data = df.values
+
+    dendro_leaves = dendro_side["layout"]["yaxis"]["ticktext"]
+    dendro_leaves = list(map(int, dendro_leaves))
+    heat_data = heat_data[dendro_leaves, :]
+    heat_data = heat_data[:, dendro_leaves]
+
+    heatmap = [
+        go.Heatmap(
+            x=dendro_leaves,
+            y=dendro_leaves,
+            z=heat_data,
+            colorscale="YlOrRd",
+            reversescale=True,
+        )
+    ]
+
+    heatmap[0]["x"] = dendro_up["layout"]["xaxis"]["tickvals"]
+    heatmap[0]["y"] = dendro_side["layout"]["yaxis"]["tickvals"]
+    figure["data"].extend(heatmap)
+
+    figure["layout"] = dendro_up["layout"]
+
+    figure["layout"].update(
+        {
+            "width": 800,
+            "height": 800,
+            "showlegend": False,
+            "hovermode": "closest",
+            "template": "plotly_white",
+        }
+    )
+    figure["layout"]["xaxis"].update(
+        {
+            "domain": [0.15, 1],
+            "mirror": False,
+            "showgrid": False,
+            "showline": False,
+            "zeroline": False,
+            "ticks": "",
+        }
+    )
+    figure["layout"].update(
+        {
+            "xaxis2": {
+                "domain": [0, 0.15],
+                "mirror": False,
+                "showgrid": False,
+                "showline": False,
+                "zeroline": False,
+                "showticklabels": False,
+                "ticks": "",
+            }
+        }
+    )
+
+    figure["layout"]["yaxis"].update(
+        {
+            "domain": [0, 0.85],
+            "mirror": False,
+            "showgrid": False,
+            "showline": False,
+            "zeroline": False,
+            "showticklabels": False,
+            "ticks": "",
+        }
+    )
+    figure["layout"].update(
+        {
+            "yaxis2": {
+                "domain": [0.825, 0.975],
+                "mirror": False,
+                "showgrid": False,
+                "showline": False,
+                "zeroline": False,
+                "showticklabels": False,
+                "ticks": "",
+            },
+            "annotations": [dict(xref="paper", yref="paper", showarrow=False, text="")],
+        }
+    )
+
+    return dcc.Graph(
+        id=identifier,
+        figure=figure,
+    )
+
+
+def get_clustergrammer_plot(data, identifier, args):
+    """
+    This function takes a pandas dataframe, calculates clustering,
+    and generates the visualization json.
+
+    For more information visit https://github.com/MaayanLab/clustergrammer-py.
+
+    :param data: long-format pandas dataframe with columns 'node1' (source), 'node2' (target)
+                 and 'weight'
+    :param str identifier: id used to identify the div where the figure will be generated
+    :param dict args: see below
+    :Arguments:
+        * **format** (str) -- defines if dataframe needs to be converted from 'edgelist' to matrix
+        * **title** (str) -- plot title
+    :return: Dash Div with heatmap plot from Clustergrammer web-based tool
+    """
+    from clustergrammer2 import net as clustergrammer_net
+
+    div = None
+    if not data.empty:
+        if "format" in args:
+            if args["format"] == "edgelist":
+                data = data[["node1", "node2", "weight"]].pivot(
+                    index="node1", columns="node2"
+                )
+        clustergrammer_net.load_df(data)
+
+        link = get_clustergrammer_link(clustergrammer_net, filename=None)
+
+        iframe = html.Iframe(src=link, width=1000, height=900)
+
+        div = html.Div([html.H2(args["title"]), iframe])
+    return div
@@ -0,0 +1,688 @@
+"""Network visualizations (Cytoscape, pyvis, webweb)."""
+
+import ast
+
+import dash_cytoscape as cyto
+import networkx as nx
+import numpy as np
+import pandas as pd
+from acore import network_analysis
+from cyjupyter import Cytoscape
+from dash import dcc, html
+from networkx.readwrite import json_graph
+from pyvis.network import Network as visnet
+from webweb import Web
+
+from .. import utils_old
+from ..network import (
+    COMMUNITY_METHODS,
+    apply_layout,
+    compute_centralities,
+    compute_layout,
+    detect_communities,
+    sparsify_graph,
+)
+from .tables import get_table
+
+# Attributes sent to the browser with each element of a Cytoscape network
+CYTOSCAPE_NODE_ATTRIBUTES = ["color", "cluster", "radius", "degree"]
+CYTOSCAPE_EDGE_ATTRIBUTES = ["width", "edgewidth", "label"]
+
+
+def get_notebook_network_pyvis(graph, args={}):
+    """
+    This function converts a Networkx graph into a PyVis graph supporting Jupyter notebook embedding.
+
+    :param graph graph: networkX graph.
+    :param dict args: see below.
+    :Arguments:
+        * **height** (int) -- network canvas height.
+        * **width** (int) -- network canvas width.
+    :return: PyVis graph.
+
+    Example::
+
+        result = get_notebook_network_pyvis(graph, args={'height':100, 'width':100})
+    """
+    if "width" not in args:
+        args["width"] = 800
+    if "height" not in args:
+        args["height"] = 850
+    notebook_net = visnet(args["width"], args["height"], notebook=True)
+    notebook_net.barnes_hut(overlap=0.8)
+    notebook_net.from_nx(graph)
+    notebook_net.show_buttons(["nodes", "edges", "physics"])
+    utils_old.generate_html(notebook_net)
+
+    return notebook_net
+
+
+def get_notebook_network_web(graph, args):
+    """
+    This function converts a networkX graph into a webweb interactive network in a browser.
+
+    :param graph graph: networkX graph.
+    :return: web network.
+    """
+    notebook_net = Web(nx.to_numpy_matrix(graph).tolist())
+    notebook_net.display.scaleLinkWidth = True
+
+    return notebook_net
+
+
+def network_to_tables(graph, source, target):
+    """
+    Creates the graph edge list and node list and returns them as separate Pandas DataFrames.
+
+    :param graph: networkX graph used to construct the Pandas DataFrame.
+    :return: two Pandas DataFrames.
+    """
+    edges_table = nx.to_pandas_edgelist(graph, source, target)
+    nodes_table = (
+        pd.DataFrame.from_dict(dict(graph.nodes(data=True))).transpose().reset_index()
+    )
+
+    return nodes_table, edges_table
+
+
+def generate_configuration_tree(report_pipeline, dataset_type):
+    """
+    This function retrieves the analysis pipeline from a dataset .yml file
+    and creates a Cytoscape network, organized hierarchically.
+
+    :param dict report_pipeline: dictionary with dataset type analysis and visualization pipeline
+                                (conversion of .yml files to python dictionary).
+    :param str dataset_type: type of dataset
+                            ('clinical', 'proteomics', 'DNAseq', 'RNAseq', 'multiomics').
+    :return: new Dash div with title and Cytoscape network, summarizing analysis pipeline.
+    """
+    nodes = []
+    edges = []
+    args = {}
+    conf_plot = None
+    if len(report_pipeline) >= 1:
+        root = dataset_type.title() + " default analysis pipeline"
+        nodes.append({"data": {"id": 0, "label": root}, "classes": "root"})
+        i = 0
+        for section in report_pipeline:
+            if section == "args":
+                continue
+            nodes.append(
+                {"data": {"id": i + 1, "label": section.title()}, "classes": "section"}
+            )
+            edges.append({"data": {"source": 0, "target": i + 1}})
+            i += 1
+            k = i
+            for subsection in report_pipeline[section]:
+                nodes.append(
+                    {
+                        "data": {"id": i + 1, "label": subsection.title()},
+                        "classes": "subsection",
+                    }
+                )
+                edges.append({"data": {"source": k, "target": i + 1}})
+                i += 1
+                j = i
+                conf = report_pipeline[section][subsection]
+                data_names = conf["data"]
+                analysis_types = conf["analyses"]
+                arguments = conf["args"]
+                if isinstance(data_names, dict):
+                    for d in data_names:
+                        nodes.append(
+                            {
+                                "data": {"id": i + 1, "label": d + ":" + data_names[d]},
+                                "classes": "data",
+                            }
+                        )
+                        edges.append({"data": {"source": j, "target": i + 1}})
+                        i += 1
+                else:
+                    nodes.append(
+                        {"data": {"id": i + 1, "label": data_names}, "classes": "data"}
+                    )
+                    edges.append({"data": {"source": j, "target": i + 1}})
+                    i += 1
+                for at in analysis_types:
+                    nodes.append(
+                        {"data": {"id": i + 1, "label": at}, "classes": "analysis"}
+                    )
+                    edges.append({"data": {"source": j, "target": i + 1}})
+                    i += 1
+                    f = i
+                if len(analysis_types):
+                    for a in arguments:
+                        nodes.append(
+                            {
+                                "data": {
+                                    "id": i + 1,
+                                    "label": a + ":" + str(arguments[a]),
+                                },
+                                "classes": "argument",
+                            }
+                        )
+                        edges.append({"data": {"source": f, "target": i + 1}})
+                        i += 1
+        config_stylesheet = [
+            # Group selectors
+            {"selector": "node", "style": {"content": "data(label)"}},
+            # Class selectors
+            {
+                "selector": ".root",
+                "style": {
+                    "background-color": "#66c2a5",
+                    "line-color": "black",
+                    "font-size": "14",
+                },
+            },
+            {
+                "selector": ".section",
+                "style": {
+                    "background-color": "#a6cee3",
+                    "line-color": "black",
+                    "font-size": "12",
+                },
+            },
+            {
+                "selector": ".subsection",
+                "style": {
+                    "background-color": "#1f78b4",
+                    "line-color": "black",
+                    "font-size": "12",
+                },
+            },
+            {
+                "selector": ".data",
+                "style": {
+                    "background-color": "#b2df8a",
+                    "line-color": "black",
+                    "font-size": "12",
+                },
+            },
+            {
+                "selector": ".analysis",
+                "style": {
+                    "background-color": "#33a02c",
+                    "line-color": "black",
+                    "font-size": "12",
+                },
+            },
+            {
+                "selector": ".argument",
+                "style": {
+                    "background-color": "#fb9a99",
+                    "line-color": "black",
+                    "font-size": "12",
+                },
+            },
+        ]
+        net = []
+        net.extend(nodes)
+        net.extend(edges)
+        args["stylesheet"] = config_stylesheet
+        args["title"] = "Analysis Pipeline"
+        args["layout"] = {"name": "breadthfirst", "roots": "#0"}
+        # args['mouseover_node'] = {}
+        conf_plot = get_cytoscape_network(net, dataset_type, args)
+
+    return conf_plot
+
+
+def get_network(data, identifier, args):
+    """
+    This function filters an input dataframe based on a threshold score and builds a cytoscape network. For more information on \
+    'node_size' parameter, visit https://networkx.github.io/documentation/networkx-1.10/reference/generated/networkx.algorithms.centrality.betweenness_centrality.html and \
+    https://networkx.github.io/documentation/networkx-1.10/reference/generated/networkx.algorithms.centrality.eigenvector_centrality_numpy.html.
+
+    :param data: long-format pandas dataframe with at least three columns: source node, target node and value (e.g. weight, score).
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **source** (str) -- name of the column containing the source.
+        * **target** (str) -- name of the column containing the target.
+        * **cutoff** (float) -- value threshold for network building.
+        * **cutoff_abs** (bool) -- if True will take both positive and negative sides of the cutoff value.
+        * **values** (str) -- name of the column containing the values to be plotted.
+        * **node_size** (str) -- method used to determine node radius ('betweenness', 'ev_centrality', 'degree').
+        * **title** (str) -- plot title.
+        * **color_weight** (bool) -- if True, edges in network are colored red if score > 0 and blue if score < 0.
+        * **time_budget** (float) -- time budget in seconds of the betweenness centrality and of the community \
+            detection (2 by default). Larger networks use pivot-sampled betweenness and fewer Louvain levels, \
+            see vuecore.network.
+        * **betweenness_k** (int) -- maximum number of betweenness pivots (all nodes by default).
+        * **limit** (int) -- maximum number of edges drawn (500 by default, None to draw all). Larger \
+            networks are sparsified, see vuecore.network.sparsify_graph.
+        * **max_nodes** (int) -- maximum number of nodes drawn. By default, networks within the edge limit are \
+            drawn whole, and larger ones are cut to 150 nodes.
+        * **sparsify_strategy** (str) -- 'topk' (default), 'backbone', 'kcore', 'mst' or any registered strategy.
+        * **communities_algorithm** (str) -- 'louvain' (default), 'label_propagation', 'greedy_modularity', or \
+            any other method of acore.network_analysis.get_network_communities.
+        * **node_layout** (str) -- layout computed on the server: 'spring' (default), 'forceatlas2' or 'spectral'. \
+            Nodes get static positions and Cytoscape uses the 'preset' layout. None lets the browser compute \
+            the layout, see vuecore.network.compute_layout.
+        * **layout_size** (float) -- size in pixels of the square canvas of the node positions (1000 by default).
+    :return: dictionary with the network in multiple formats: jupyetr-notebook compatible, web brower compatibles, data table, and json.
+
+    Example::
+
+        result = get_network(data, identifier='network', args={'source':'node1', 'target':'node2', 'cutoff':0.5, 'cutoff_abs':True, 'values':'weight', \
+                            'node_size':'degree', 'title':'Network Figure', 'color_weight': True})
+    """
+    net = None
+    if "cutoff_abs" not in args:
+        args["cutoff_abs"] = False
+
+    if "title" not in args:
+        args["title"] = identifier
+
+    if not data.empty:
+        if utils_old.check_columns(data, cols=[args["source"], args["target"]]):
+            if "values" not in args:
+                args["values"] = "width"
+                data[args["values"]] = 1
+
+            if "cutoff" in args:
+                if args["cutoff_abs"]:
+                    data = data[np.abs(data[args["values"]]) >= args["cutoff"]]
+                else:
+                    data = data[data[args["values"]] >= args["cutoff"]]
+
+            if not data.empty:
+                data[args["source"]] = [
+                    str(n).replace("'", "") for n in data[args["source"]]
+                ]
+                data[args["target"]] = [
+                    str(n).replace("'", "") for n in data[args["target"]]
+                ]
+
+                data = data.rename(index=str, columns={args["values"]: "width"})
+                data["width"] = data["width"].fillna(1.0)
+                data = data.fillna("null")
+                data.columns = [c.replace("_", "") for c in data.columns]
+                data["edgewidth"] = data["width"].apply(np.abs)
+                min_edge_value = data["edgewidth"].min()
+                max_edge_value = data["edgewidth"].max()
+                if min_edge_value == max_edge_value:
+                    min_edge_value = 0.0
+                graph = nx.from_pandas_edgelist(
+                    data, args["source"], args["target"], edge_attr=True
+                )
+
+                time_budget = args["time_budget"] if "time_budget" in args else 2.0
+                centralities = compute_centralities(
+                    graph,
+                    weight="edgewidth",
+                    betweenness_k=(
+                        args["betweenness_k"] if "betweenness_k" in args else None
+                    ),
+                    time_budget=time_budget,
+                )
+                degrees = centralities["degree"]
+                betweenness = centralities["betweenness"]
+                ev_centrality = centralities["eigenvector"]
+                nx.set_node_attributes(graph, degrees, "degree")
+                nx.set_node_attributes(graph, betweenness, "betweenness")
+                nx.set_node_attributes(
+                    graph,
+                    {k: "%.3f" % round(v, 3) for k, v in ev_centrality.items()},
+                    "eigenvector",
+                )
+
+                min_node_size = 0
+                max_node_size = 0
+                if "node_size" not in args:
+                    args["node_size"] = "degree"
+
+                if args["node_size"] == "betweenness":
+                    node_sizes = betweenness
+                elif args["node_size"] == "ev_centrality":
+                    node_sizes = ev_centrality
+                else:
+                    node_sizes = degrees
+                if len(node_sizes) > 0:
+                    min_node_size = min(node_sizes.values())
+                    max_node_size = max(node_sizes.values())
+                    nx.set_node_attributes(graph, node_sizes, "radius")
+
+                if "communities_algorithm" not in args:
+                    args["communities_algorithm"] = "louvain"
+                if args["communities_algorithm"] in COMMUNITY_METHODS:
+                    clusters = detect_communities(
+                        graph,
+                        method=args["communities_algorithm"],
+                        weight="edgewidth",
+                        time_budget=time_budget,
+                    )
+                else:
+                    clusters = network_analysis.get_network_communities(graph, args)
+                col = utils_old.get_hex_colors(len(set(clusters.values())))
+                colors = {n: col[clusters[n]] for n in clusters}
+                nx.set_node_attributes(graph, colors, "color")
+                nx.set_node_attributes(graph, clusters, "cluster")
+
+                vis_graph = graph
+                limit = 500
+                if "limit" in args:
+                    limit = args["limit"]
+                if "max_nodes" in args:
+                    max_nodes = args["max_nodes"]
+                elif limit is not None and graph.number_of_edges() > limit:
+                    max_nodes = 150
+                else:
+                    # Networks within the edge limit are drawn whole
+                    max_nodes = None
+                if limit is not None or max_nodes is not None:
+                    vis_graph = sparsify_graph(
+                        graph,
+                        strategy=(
+                            args["sparsify_strategy"]
+                            if "sparsify_strategy" in args
+                            else "topk"
+                        ),
+                        max_nodes=max_nodes,
+                        max_edges=limit,
+                        weight="edgewidth",
+                    )
+
+                nodes_table, edges_table = network_to_tables(
+                    graph, source=args["source"], target=args["target"]
+                )
+                nodes_fig_table = get_table(
+                    nodes_table,
+                    identifier=identifier + "_nodes_table",
+                    args={"title": args["title"] + " nodes table"},
+                )
+                edges_fig_table = get_table(
+                    edges_table,
+                    identifier=identifier + "_edges_table",
+                    args={"title": args["title"] + " edges table"},
+                )
+
+                stylesheet, layout = get_network_style(colors, args["color_weight"])
+                stylesheet.append(
+                    {
+                        "selector": "edge",
+                        "style": {
+                            "width": "mapData(edgewidth,"
+                            + str(min_edge_value)
+                            + ","
+                            + str(max_edge_value)
+                            + ", .5, 8)"
+                        },
+                    }
+                )
+                if min_node_size > 0 and max_node_size > 0:
+                    mapper = (
+                        "mapData(radius,"
+                        + str(min_node_size)
+                        + ","
+                        + str(max_node_size)
+                        + ", 15, 50)"
+                    )
+                    stylesheet.append(
+                        {
+                            "selector": "node",
+                            "style": {"width": mapper, "height": mapper},
+                        }
+                    )
+                cy_elements, mouseover_node = utils_old.networkx_to_cytoscape(
+                    vis_graph,
+                    node_attributes=CYTOSCAPE_NODE_ATTRIBUTES,
+                    edge_attributes=CYTOSCAPE_EDGE_ATTRIBUTES,
+                )
+
+                node_layout = args["node_layout"] if "node_layout" in args else "spring"
+                if node_layout is not None:
+                    # Positions are computed once (and cached), not on every render
+                    size = args["layout_size"] if "layout_size" in args else 1000
+                    positions = compute_layout(
+                        vis_graph, method=node_layout, weight="edgewidth"
+                    )
+                    apply_layout(cy_elements, positions, width=size, height=size)
+                    layout = {"name": "preset", "fit": True}
+
+                args["stylesheet"] = stylesheet
+                args["layout"] = layout
+
+                app_net = get_cytoscape_network(cy_elements, identifier, args)
+                # args['mouseover_node'] = mouseover_node
+
+                net = {
+                    "notebook": [cy_elements, stylesheet, layout],
+                    "app": app_net,
+                    "net_tables": (nodes_table, edges_table),
+                    "net_tables_viz": (nodes_fig_table, edges_fig_table),
+                    "net_json": json_graph.node_link_data(graph),
+                }
+    return net
+
+
+def get_network_style(node_colors, color_edges):
+    """
+    This function uses a dictionary of nodes and colors and creates a stylesheet and layout for a network.
+
+    :param dict node_colors: dictionary with node names as keys and colors as values.
+    :param bool color_edges: if True, add edge coloring to stylesheet (red for positive width, blue for negative).
+    :return: stylesheet (list of dictionaries specifying the style for a group of elements, a class of elements, or a single element) and \
+                layout (dictionary specifying how the nodes should be positioned on the canvas).
+    """
+
+    color_selector = (
+        "{'selector': '[name = \"KEY\"]', 'style': {'background-color': \"VALUE\"}}"
+    )
+    stylesheet = [
+        {
+            "selector": "node",
+            "style": {
+                "label": "data(name)",
+                "text-valign": "center",
+                "text-halign": "center",
+                "border-color": "gray",
+                "border-width": "1px",
+                "font-size": "12",
+                "opacity": 0.75,
+            },
+        },
+        {
+            "selector": "edge",
+            "style": {
+                "label": "data(label)",
+                "curve-style": "bezier",
+                "opacity": 0.7,
+                "font-size": "4",
+            },
+        },
+    ]
+
+    layout = {
+        "name": "cose",
+        "idealEdgeLength": 100,
+        "nodeOverlap": 20,
+        "refresh": 20,
+        "randomize": False,
+        "componentSpacing": 100,
+        "nodeRepulsion": 400000,
+        "edgeElasticity": 100,
+        "nestingFactor": 5,
+        "gravity": 80,
+        "numIter": 1000,
+        "initialTemp": 200,
+        "coolingFactor": 0.95,
+        "minTemp": 1.0,
+    }
+
+    if color_edges:
+        stylesheet.extend(
+            [
+                {"selector": "[width < 0]", "style": {"line-color": "#4dc3d6"}},
+                {"selector": "[width > 0]", "style": {"line-color": "#d6604d"}},
+            ]
+        )
+
+    for k, v in node_colors.items():
+        stylesheet.append(
+            ast.literal_eval(
+                color_selector.replace("KEY", k.replace("'", "")).replace("VALUE", v)
+            )
+        )
+
+    return stylesheet, layout
+
+
+def visualize_notebook_network(network, notebook_type="jupyter", layout={}):
+    """
+    This function returns a Cytoscape network visualization for Jupyter notebooks
+
+    :param tuple network: tuple with two dictionaries: network data and stylesheet (see get_network(data, identifier, args)).
+    :param str notebook_type: the type of notebook where the network will be visualized (currently only jupyter notebook is supported)
+    :param dict layout: specific layout properties (see https://dash.plot.ly/cytoscape/layout)
+    :return: cyjupyter.cytoscape.Cytoscape object
+
+    Example::
+
+        net = get_network(clincorr.dropna(), identifier='corr', args={'source':'node1', 'target':'node2',
+                                                            'cutoff':0, 'cutoff_abs':True,
+                                                            'values':'weight','node_size':'degree',
+                                                            'title':'Network Figure', 'color_weight': True})
+        visualize_notebook_network(net['notebook'], notebook_type='jupyter', layout={'width':'100%', 'height':'700px'})
+    """
+    net = None
+    if len(layout) == 0:
+        layout = {
+            "name": "cose",
+            "idealEdgeLength": 100,
+            "nodeOverlap": 20,
+            "refresh": 20,
+            "randomize": False,
+            "componentSpacing": 100,
+            "nodeRepulsion": 400000,
+            "edgeElasticity": 100,
+            "nestingFactor": 5,
+            "gravity": 80,
+            "numIter": 1000,
+            "initialTemp": 200,
+            "coolingFactor": 0.95,
+            "minTemp": 1.0,
+        }
+    if notebook_type == "jupyter":
+        net = Cytoscape(
+            data={"elements": network[0]}, visual_style=network[1], layout=layout
+        )
+    elif notebook_type == "jupyterlab":
+        pass
+
+    return net
+
+
+def visualize_notebook_path(path, notebook_type="jupyter"):
+    """
+    This function returns a Cytoscape network visualization for Jupyter notebooks
+
+    :param pathlib.Path object: dash_html_components object with the cytoscape network
+                        (returned by get_cytoscape_network())
+    :param str notebook_type: the type of notebook where the network will be visualized
+                              (currently only jupyter notebook is supported)
+    :param dict layout: specific layout properties (see https://dash.plot.ly/cytoscape/layout)
+    :return: cyjupyter.cytoscape.Cytoscape object
+
+    Example::
+
+        net = get_cytoscape_network(G, identifier='corr', args={'title':'Cytoscape path',
+                                                            'stylesheet':stylesheet,
+                                                            'layout': layout})
+        visualize_notebook_path(net, notebook_type='jupyter')
+    """
+    net = None
+    if notebook_type == "jupyter":
+        net = path.children[1]
+    elif notebook_type == "jupyterlab":
+        pass
+
+    return net
+
+
+def get_cytoscape_network(net, identifier, args):
+    """
+    This function creates a Cytoscpae network in dash.
+
+    For more information visit https://dash.plot.ly/cytoscape.
+
+    :param dict net: dictionary in which each element (key) is defined by a dictionary with 'id'
+                and 'label' (if it is a node) or 'source', 'target' and 'label' (if it is an edge).
+    :param str identifier: is the id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **title** (str) -- title of the figure.
+        * **stylesheet** (list[dict]) -- specifies the style for a group of elements, \
+            a class of elements, or a single element (accepts two keys 'selector' and 'style').
+        * **layout** (dict) -- specifies how the nodes should be positioned on the screen.
+    :return: network figure within <div id="_dash-app-content">.
+    """
+    height = "700px"
+    width = "100%"
+    if "height" in args:
+        height = args["height"]
+    if "width" in args:
+        width = args["width"]
+    cytonet = cyto.Cytoscape(
+        id=identifier,
+        stylesheet=args["stylesheet"],
+        elements=net,
+        layout=args["layout"],
+        minZoom=0.2,
+        maxZoom=1.5,
+        # mouseoverNodeData=args['mouseover_node'],
+        style={"width": width, "height": height},
+    )
+    net_div = html.Div([html.H2(args["title"]), cytonet])
+
+    return net_div
+
+
+def getMapperFigure(data, identifier, title):
+    """
+    This function uses the KeplerMapper python package to visualize high-dimensional data and generate a FigureWidget that can be shown or editted.
+    This method is suitable for use in Jupyter notebooks. For more information visit https://kepler-mapper.scikit-tda.org/reference/stubs/kmapper.plotlyviz.plotlyviz.html.
+
+    :param data: dictionary. Simplicial complex output from the KeplerMapper map method.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param str title: plot title.
+    :return: plotly FigureWidget within <div id="_dash-app-content"> .
+    """
+    from kmapper import plotlyviz
+
+    pl_brewer = [
+        [0.0, "#67001f"],
+        [0.1, "#b2182b"],
+        [0.2, "#d6604d"],
+        [0.3, "#f4a582"],
+        [0.4, "#fddbc7"],
+        [0.5, "#000000"],
+        [0.6, "#d1e5f0"],
+        [0.7, "#92c5de"],
+        [0.8, "#4393c3"],
+        [0.9, "#2166ac"],
+        [1.0, "#053061"],
+    ]
+    figure = plotlyviz.plotlyviz(
+        data,
+        title=title,
+        colorscale=pl_brewer,
+        color_function_name="Group",
+        factor_size=7,
+        edge_linewidth=2.5,
+        node_linecolor="rgb(200,200,200)",
+        width=1200,
+        height=1200,
+        bgcolor="rgba(240, 240, 240, 0.95)",
+        left=50,
+        bottom=50,
+        summary_height=300,
+        summary_width=400,
+        summary_left=20,
+        summary_right=20,
+        hist_left=25,
+        hist_right=25,
+        member_textbox_width=800,
+    )
+    return dcc.Graph(id=identifier, figure=figure)
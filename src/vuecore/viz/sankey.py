@@ -0,0 +1,177 @@
+"""Sankey diagrams."""
+
+import numpy as np
+import pandas as pd
+from dash import dcc
+
+from ..translate import hex2rgb
+
+
+def _to_rgba(colors):
+    """
+    Converts hex colors to plotly rgba strings, converting each distinct color once.
+
+    :param colors: pandas Series with hex colors or any other plotly color.
+    :return: pandas Series with the converted colors.
+    """
+    unique = pd.unique(colors)
+    converted = [
+        "rgba" + str(hex2rgb(c)) if str(c).startswith("#") else c for c in unique
+    ]
+    return pd.Series(colors).map(dict(zip(unique, converted)))
+
+
+def get_sankey_plot(
+    data,
+    identifier,
+    args={
+        "source": "source",
+        "target": "target",
+        "weight": "weight",
+        "source_colors": "source_colors",
+        "target_colors": "target_colors",
+        "orientation": "h",
+        "valueformat": ".0f",
+        "width": 800,
+        "height": 800,
+        "font": 12,
+        "title": "Sankey plot",
+    },
+):
+    """
+    This function generates a Sankey plot in Plotly.
+
+    :param data: Pandas DataFrame with the format: source  target  weight.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below
+    :Arguments:
+        * **source** (str) -- name of the column containing the source
+        * **target** (str) -- name of the column containing the target
+        * **weight** (str) -- name of the column containing the weight
+        * **source_colors** (str) -- name of the column in data that contains\
+            the colors of each source item
+        * **target_colors** (str) -- name of the column in data that contains\
+            the colors of each target item
+        * **title** (str) -- plot title
+        * **orientation** (str) -- whether to plot horizontal ('h') or vertical ('v')
+        * **valueformat** (str) -- how to show the value ('.0f')
+        * **width** (int) -- plot width
+        * **height** (int) -- plot height
+        * **font** (int) -- font size
+        * **hover** (str) -- optional, name of the column containing the link labels
+        * **aggregate** (bool) -- optional, sum the weights of duplicate source-target links
+        * **min_weight_quantile** (float) -- optional, drop links with a weight below this\
+            quantile of the link weights (e.g. 0.5 keeps the heaviest half)
+    :return: dcc.Graph
+
+    Nodes are indexed in order of first appearance, so building the plot is linear in\
+    the number of links.
+
+    Example::
+
+        result = get_sankey_plot(data,
+                                 identifier='sankeyplot',
+                                 args={'source':'source',
+                                       'target':'target',
+                                       'weight':'weight',
+                                       'source_colors':'source_colors',
+                                       'target_colors':'target_colors','
+                                       'orientation': 'h',
+                                       'valueformat': '.0f',
+                                       'width':800, 'height':800,
+                                       'font':12,
+                                       'title':'Sankey plot'}
+                                )
+    """
+    figure = {}
+    if data is not None and not data.empty:
+        source, target, weight = args["source"], args["target"], args["weight"]
+        links = pd.DataFrame(
+            {
+                "source": data[source].to_numpy(),
+                "target": data[target].to_numpy(),
+                "weight": data[weight].to_numpy(),
+                "source_color": (
+                    data[args["source_colors"]].to_numpy()
+                    if "source_colors" in args
+                    else "#045a8d"
+                ),
+                "target_color": (
+                    data[args["target_colors"]].to_numpy()
+                    if "target_colors" in args
+                    else "#a6bddb"
+                ),
+                "hover": (
+                    data[args["hover"]].astype(str).str.upper().to_numpy()
+                    if "hover" in args
+                    else ""
+                ),
+            }
+        )
+        if "aggregate" in args and args["aggregate"]:
+            links = links.groupby(["source", "target"], sort=False, as_index=False).agg(
+                weight=("weight", "sum"),
+                source_color=("source_color", "last"),
+                target_color=("target_color", "last"),
+                hover=("hover", "first"),
+            )
+        if "min_weight_quantile" in args and args["min_weight_quantile"]:
+            threshold = links["weight"].quantile(args["min_weight_quantile"])
+            links = links[links["weight"] >= threshold]
+
+        # Node indices in order of first appearance, sources first
+        codes, nodes = pd.factorize(
+            np.concatenate([links["source"].to_numpy(), links["target"].to_numpy()])
+        )
+        n_links = len(links)
+        # The last color of a node wins, and target colors override source colors
+        node_colors = (
+            pd.Series(
+                np.concatenate(
+                    [
+                        links["source_color"].to_numpy(),
+                        links["target_color"].to_numpy(),
+                    ]
+                ),
+                index=codes,
+            )
+            .groupby(level=0)
+            .last()
+            .sort_index()
+        )
+        hover_data = links["hover"].tolist() if "hover" in args else []
+
+        data_trace = dict(
+            type="sankey",
+            orientation="h" if "orientation" not in args else args["orientation"],
+            valueformat=".0f" if "valueformat" not in args else args["valueformat"],
+            arrangement="snap",
+            node=dict(
+                pad=10 if "pad" not in args else args["pad"],
+                thickness=10 if "thickness" not in args else args["thickness"],
+                line=dict(color="black", width=0.3),
+                label=nodes.tolist(),
+                color=_to_rgba(node_colors).tolist(),
+            ),
+            link=dict(
+                source=codes[:n_links],
+                target=codes[n_links:],
+                value=links["weight"].to_numpy(),
+                color=_to_rgba(links["source_color"]).tolist(),
+                label=hover_data,
+            ),
+        )
+        layout = dict(
+            width=800 if "width" not in args else args["width"],
+            height=800 if "height" not in args else args["height"],
+            title=args["title"],
+            annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+            font=dict(
+                size=12 if "font" not in args else args["font"],
+            ),
+            template="plotly_white",
+        )
+
+        figure = dict(data=[data_trace], layout=layout)
+
+    return dcc.Graph(id=identifier, figure=figure)
@@ -0,0 +1,102 @@
+"""Survival analysis plots."""
+
+import matplotlib.pyplot as plt
+from dash import dcc, html
+
+from ..translate import mpl_to_html_image
+from .export import mpl_to_plotly
+
+
+def get_km_plot_old(data, identifier, args):
+    figure = {}
+    if len(data) == 3:
+        kmfit, summary, plot = data
+        if kmfit is not None:
+            title = "Kaplan-meier plot" + summary
+            if "title" in args:
+                title = args["title"] + "--" + summary
+            plot.set_title(title)
+            # p = kmfit.plot(ci_force_lines=True, title=title, show_censors=True)
+            figure = mpl_to_plotly(plot.figure, legend=True)
+
+    return dcc.Graph(id=identifier, figure=figure)
+
+
+def get_km_plot(data, identifier, args):
+    figure = {}
+    plot = plt.subplot(111)
+    environment = "app"
+    colors = None
+    if "environment" in args:
+        environment = args["environment"]
+    if "colors" in args:
+        colors = args["colors"]
+    if len(data) == 2:
+        kmfit, summary = data
+        if kmfit is not None:
+            i = 0
+            for kmf in kmfit:
+                c = None
+                if colors is not None:
+                    c = colors[i]
+                plot = kmf.plot_survival_function(show_censors=True, ax=plot, c=c)
+                i += 1
+            title = "Kaplan-meier plot " + summary
+            xlabel = "Time"
+            ylabel = "Survival"
+            if "title" in args:
+                title = args["title"] + "--" + summary
+            if "xlabel" in args:
+                xlabel = args["xlabel"]
+            if "ylabel" in args:
+                ylabel = args["ylabel"]
+            plot.set_title(title)
+            plot.set_xlabel(xlabel)
+            plot.set_ylabel(ylabel)
+            if environment == "app":
+                figure = mpl_to_html_image(plot.figure, width=800)
+                result = html.Div(id=identifier, children=[figure])
+            else:
+                result = plot.figure
+
+    return result
+
+
+def get_cumulative_hazard_plot(data, identifier, args):
+    figure = {}
+    plot = plt.subplot(111)
+    environment = "app"
+    colors = None
+    if "environment" in args:
+        environment = args["environment"]
+    if "colors" in args:
+        colors = args["colors"]
+    if len(data) == 2:
+        hrfit = data
+        if hrfit is not None:
+            i = 0
+            for hrdf in hrfit:
+                c = None
+                if colors is not None:
+                    c = colors[i]
+                plot = hrdf.plot_cumulative_hazard(ax=plot, c=c)
+                i += 1
+            title = "Cumulative Hazard plot "
+            xlabel = "Time"
+            ylabel = "Nelson Aalen - Cumulative Hazard"
+            if "title" in args:
+                title = args["title"] + "--"
+            if "xlabel" in args:
+                xlabel = args["xlabel"]
+            if "ylabel" in args:
+                ylabel = args["ylabel"]
+            plot.set_title(title)
+            plot.set_xlabel(xlabel)
+            plot.set_ylabel(ylabel)
+            if environment == "app":
+                figure = mpl_to_html_image(plot.figure, width=800)
+                result = html.Div(id=identifier, children=[figure])
+            else:
+                result = plot.figure
+
+    return result
@@ -0,0 +1,376 @@
+"""Dash tables."""
+
+import math
+import threading
+
+import pandas as pd
+from dash import MATCH, Input, Output, State, callback, dash_table, dcc, html
+from dash.exceptions import PreventUpdate
+
+from ..utils.cache import ServerStore
+
+# Component type of the server-side tables, matched by their page callback
+SERVER_TABLE_TYPE = "vuecore-server-table"
+
+# Pagers of the server-side tables, by the token of each rendered table. The
+# least recently used pagers are removed beyond 64 tables, and unused pagers
+# after one hour (see vuecore.utils.cache.ServerStore)
+TABLE_PAGERS = ServerStore(max_entries=64, ttl=3600)
+
+# Dash filter operators, with their aliases
+FILTER_OPERATORS = [
+    ["ge ", ">="],
+    ["le ", "<="],
+    ["lt ", "<"],
+    ["gt ", ">"],
+    ["ne ", "!="],
+    ["eq ", "="],
+    ["contains "],
+    ["datestartswith "],
+]
+
+
+def _split_filter_part(filter_part):
+    """
+    Parses one clause of a Dash filter query, e.g. '{pvalue} lt 0.05'.
+
+    :param str filter_part: filter clause.
+    :return: tuple with the column name, the operator and the value, or Nones if
+             the clause cannot be parsed.
+    """
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find("{") + 1 : name_part.rfind("}")]
+                value_part = value_part.strip()
+                v0 = value_part[0] if value_part else ""
+                if v0 and v0 == value_part[-1] and v0 in ("'", '"', "`"):
+                    value = value_part[1:-1].replace("\\" + v0, v0)
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+
+def _format_cells(data):
+    """
+    Converts a dataframe into DataTable records, joining list cells with ';'.
+
+    :param data: pandas dataframe.
+    :return: list of records with string values.
+    """
+    data = data.copy()
+    for c in data.select_dtypes(include="object").columns:
+        if all(isinstance(x, list) for x in data[c]):
+            data[c] = data[c].apply(lambda x: ";".join([str(i) for i in x]))
+    return data.astype(str).to_dict("records")
+
+
+class TablePager(object):
+    """
+    Serves pages of a dataframe to a DataTable with page_action='custom'.
+
+    The dataframe stays on the server: each request filters and sorts it and only
+    the requested page is converted and sent. The last filtered and sorted view is
+    kept, so turning pages does not repeat the work. Concurrent requests are
+    served one at a time, so they never mix views.
+
+    :param data: pandas dataframe.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._view_key = None
+        self._view = data
+        self._lock = threading.Lock()
+
+    def filter(self, data, filter_query):
+        """
+        Returns the rows matching a Dash filter query.
+
+        :param data: pandas dataframe.
+        :param str filter_query: clauses joined by ' && ', e.g. '{padj} lt 0.05'.
+        :return: pandas dataframe.
+        """
+        for filter_part in (filter_query or "").split(" && "):
+            name, operator, value = _split_filter_part(filter_part)
+            if name not in data.columns:
+                continue
+            column = data[name]
+            if not (isinstance(value, float) and pd.api.types.is_numeric_dtype(column)):
+                column = column.astype(str)
+                value = str(value)
+            if operator == "eq":
+                mask = column == value
+            elif operator == "ne":
+                mask = column != value
+            elif operator == "lt":
+                mask = column < value
+            elif operator == "le":
+                mask = column <= value
+            elif operator == "gt":
+                mask = column > value
+            elif operator == "ge":
+                mask = column >= value
+            elif operator == "contains":
+                mask = column.astype(str).str.contains(value, regex=False)
+            else:
+                mask = column.astype(str).str.startswith(value)
+            data = data[mask]
+        return data
+
+    def view(self, sort_by=None, filter_query=""):
+        """
+        Returns the dataframe filtered and sorted as requested by the table.
+
+        :param list sort_by: DataTable sort_by property, e.g.
+                             [{'column_id': 'padj', 'direction': 'asc'}].
+        :param str filter_query: DataTable filter_query property.
+        :return: pandas dataframe.
+        """
+        sort_by = [s for s in (sort_by or []) if s["column_id"] in self.data.columns]
+        key = (
+            filter_query or "",
+            tuple((s["column_id"], s["direction"]) for s in sort_by),
+        )
+        with self._lock:
+            if key != self._view_key:
+                view = self.filter(self.data, filter_query)
+                if sort_by:
+                    view = view.sort_values(
+                        [s["column_id"] for s in sort_by],
+                        ascending=[s["direction"] == "asc" for s in sort_by],
+                        kind="stable",
+                    )
+                self._view_key, self._view = key, view
+            return self._view
+
+    def page(self, page_current=0, page_size=25, sort_by=None, filter_query=""):
+        """
+        Returns one page of the filtered and sorted dataframe.
+
+        :param int page_current: page number, starting at 0.
+        :param int page_size: number of rows per page.
+        :param list sort_by: DataTable sort_by property.
+        :param str filter_query: DataTable filter_query property.
+        :return: tuple with the page records and the number of pages.
+        """
+        view = self.view(sort_by, filter_query)
+        start = (page_current or 0) * page_size
+        records = _format_cells(view.iloc[start : start + page_size])
+        return records, max(1, math.ceil(len(view) / page_size))
+
+
+# Registered at import, so Dash copies it into every app of this process when
+# the app serves its first request, even if the tables are rendered later
+@callback(
+    Output({"type": SERVER_TABLE_TYPE, "index": MATCH}, "data"),
+    Output({"type": SERVER_TABLE_TYPE, "index": MATCH}, "page_count"),
+    Input({"type": SERVER_TABLE_TYPE, "index": MATCH}, "page_current"),
+    Input({"type": SERVER_TABLE_TYPE, "index": MATCH}, "page_size"),
+    Input({"type": SERVER_TABLE_TYPE, "index": MATCH}, "sort_by"),
+    Input({"type": SERVER_TABLE_TYPE, "index": MATCH}, "filter_query"),
+    State({"type": SERVER_TABLE_TYPE, "index": MATCH}, "id"),
+)
+def update_table_page(page_current, page_size, sort_by, filter_query, table_id):
+    """
+    Serves the requested page of a server-side table from its pager.
+
+    :param int page_current: page number, starting at 0.
+    :param int page_size: number of rows per page.
+    :param list sort_by: DataTable sort_by property.
+    :param str filter_query: DataTable filter_query property.
+    :param dict table_id: table id, whose index is the token of its pager.
+    :return: tuple with the page records and the number of pages.
+    """
+    pager = TABLE_PAGERS.get(table_id["index"])
+    if pager is None:
+        raise PreventUpdate
+    return pager.page(page_current, page_size, sort_by, filter_query)
+
+
+def get_table(data, identifier, args):
+    """
+    This function converts a pandas dataframe into an interactive table for viewing,
+    editing and exploring large datasets.
+
+    For more information visit https://dash.plot.ly/datatable.
+
+    :param data: pandas dataframe.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param str title: table title.
+    :param subset: selects columns from dataframe to be used. If None, the entire dataframe is used.
+    :type subest: str, list or None
+    :param dict args: optional table arguments, among which:
+    :Arguments:
+        * **page_size** (int) -- number of rows per page, 25 by default.
+        * **server_side** (bool) -- if True, the dataframe stays on the server and the \
+            table (page_action='custom') requests one page at a time, filtered and sorted \
+            by a TablePager. The table id becomes {'type': SERVER_TABLE_TYPE, \
+            'index': token}, where the token ('table_' + identifier + a random suffix) \
+            is unique to this render and keys the pager in TABLE_PAGERS. The table is \
+            matched by a callback registered with dash.callback when this module is \
+            imported, so it must be served by a Dash app of this process created, or \
+            serving its first request, after the import. Pagers unused for one hour, \
+            or beyond the 64 most recently used, are removed and their tables stop \
+            paging until they are rendered again.
+    :return: new Dash div containing title and interactive table.
+
+    Example::
+
+        result = get_table(data, identifier='table', title='Table Figure', subset = None)
+        result = get_table(data, identifier='table', args={'server_side': True})
+    """
+    table = []
+    if data is not None and isinstance(data, pd.DataFrame) and not data.empty:
+        cols = []
+        title = "Table"
+        if "title" in args:
+            title = args["title"]
+        if "index" in args:
+            if isinstance(args["index"], list):
+                cols = args["index"]
+            else:
+                cols.append(args["index"])
+        if "cols" in args:
+            if args["cols"] is not None and len(args["cols"]) > 0:
+                selected_cols = list(set(args["cols"]).intersection(data.columns))
+                if len(selected_cols) > 0:
+                    data = data[selected_cols + cols]
+                else:
+                    data = pd.DataFrame()
+                    table.append(
+                        html.Div(
+                            children=[
+                                dcc.Markdown(
+                                    "### Columns not found: {}".format(
+                                        ",".join(args["cols"])
+                                    )
+                                )
+                            ]
+                        )
+                    )
+        if "rows" in args:
+            if args["rows"] is not None and len(args["rows"]) > 0:
+                selected_rows = list(set(args["rows"]).intersection(data.index))
+                if len(selected_rows) > 0:
+                    data = data.loc[selected_rows]
+                else:
+                    data = pd.DataFrame()
+                    table.append(
+                        html.Div(
+                            children=[
+                                dcc.Markdown(
+                                    "### Rows not found: {}".format(
+                                        ",".join(args["rows"])
+                                    )
+                                )
+                            ]
+                        )
+                    )
+        if "head" in args:
+            if len(args["head"]) > 1:
+                data = data.iloc[: args["head"][0], : args["head"][1]]
+        page_size = args["page_size"] if "page_size" in args else 25
+        if "server_side" in args and args["server_side"]:
+            # Only the first page is embedded; the others are served on demand
+            pager = TablePager(data)
+            token = TABLE_PAGERS.add(pager, prefix="table_" + identifier + "_")
+            table_id = {"type": SERVER_TABLE_TYPE, "index": token}
+            records, page_count = pager.page(0, page_size)
+            paging = dict(
+                page_action="custom",
+                page_count=page_count,
+                filter_action="custom",
+                filter_query="",
+                sort_action="custom",
+                sort_mode="multi",
+                sort_by=[],
+            )
+        else:
+            table_id = "table_" + identifier
+            records = _format_cells(data)
+            paging = dict(
+                page_action="native", filter_action="native", sort_action="custom"
+            )
+
+        data_trace = dash_table.DataTable(
+            id=table_id,
+            data=records,
+            columns=[
+                {"name": str(i).replace("_", " ").title(), "id": i}
+                for i in data.columns
+            ],
+            # css=[{
+            #     'selector': '.dash-cell div.dash-cell-value',
+            #     'rule': 'display: inline; white-space: inherit;'
+            #             ' overflow: inherit; text-overflow: inherit;'
+            # }],
+            style_data={"whiteSpace": "normal", "height": "auto"},
+            style_cell={
+                "height": "fit-content",
+                "whiteSpace": "normal",
+                "minWidth": "130px",
+                "maxWidth": "200px",
+                "textAlign": "left",
+                "padding": "1px",
+                "vertical-align": "top",
+                "overflow": "hidden",
+                "textOverflow": "ellipsis",
+            },
+            style_cell_conditional=[
+                {"if": {"column_id": i}, "width": str(20 + round(len(i) * 20)) + "px"}
+                for i in data.columns
+            ],
+            style_table={
+                "height": "fit-content",
+                #    "max-height": "500px",
+                # "width": "fit-content",
+                #    "max-width": "1500px",
+                #    'overflowY': 'scroll',
+                "overflowX": "scroll",
+            },
+            style_header={
+                "backgroundColor": "#2b8cbe",
+                "fontWeight": "bold",
+                "position": "sticky",
+            },
+            style_data_conditional=[
+                {
+                    "if": {
+                        "column_id": "rejected",
+                        "filter_query": '{rejected} eq "True"',
+                    },
+                    "backgroundColor": "#3B8861",
+                    "color": "white",
+                },
+            ],
+            fixed_rows={"headers": True, "data": 0},
+            row_selectable="multi",
+            page_current=0,
+            page_size=page_size,
+            **paging,
+        )
+        table.extend([html.H2(title), data_trace])
+
+    return html.Div(id=identifier, children=table)
+
+
+def get_multi_table(data, identifier, title):
+    tables = [html.H2(title)]
+    if data is not None and isinstance(data, dict):
+        for subtitle in data:
+            df = data[subtitle]
+            if len(df.columns) > 10:
+                df = df.transpose()
+            table = get_table(
+                df, identifier=identifier + "_" + subtitle, args={"title": subtitle}
+            )
+            if table is not None:
+                tables.append(table)
+
+    return html.Div(tables)
@@ -0,0 +1,277 @@
+"""Word clouds."""
+
+import nltk
+import pandas as pd
+import plotly.graph_objs as go
+from dash import dcc
+from nltk.corpus import stopwords
+from wordcloud import STOPWORDS, WordCloud
+
+
+def get_wordcloud(
+    data,
+    identifier,
+    args={
+        "stopwords": [],
+        "max_words": 400,
+        "max_font_size": 100,
+        "width": 700,
+        "height": 700,
+        "margin": 1,
+    },
+):
+    """
+    This function generates a Wordcloud based on the natural text in a pandas dataframe column.
+
+    :param data: pandas dataframe with columns: 'PMID', 'abstract', 'authors', 'date', 'journal',
+                 'keywords', 'title', 'url', 'Proteins', 'Diseases'.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **text_col** (str) -- name of column containing the natural text used to \
+                                generate the wordcloud.
+        * **stopwords** (list) -- list of words that will be eliminated.
+        * **max_words** (int) -- maximum number of words.
+        * **max_font_size** (int) -- maximum font size for the largest word.
+        * **margin** (int) -- plot margin size.
+        * **width** (int) -- width of the plot.
+        * **height** (int) -- height of the plot.
+        * **title** (str) -- plot title.
+    :return: wordcloud figure within <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_wordcloud(data,
+                               identifier='wordcloud',
+                               args={'stopwords':['BACKGROUND',
+                                                  'CONCLUSION',
+                                                  'RESULT',
+                                                  'METHOD',
+                                                  'CONCLUSIONS',
+                                                  'RESULTS',
+                                                  'METHODS'],
+                                    'max_words': 400,
+                                    'max_font_size': 100,
+                                    'width':700,
+                                    'height':700,
+                                    'margin': 1}
+                                )
+    """
+    figure = None
+    if data is not None:
+        nltk.download("stopwords")
+        sw = set(stopwords.words("english")).union(set(STOPWORDS))
+        sw.update(
+            [
+                "patient",
+                "protein",
+                "gene",
+                "proteins",
+                "genes",
+                "using",
+                "review",
+                "identified",
+                "identify",
+                "expression",
+                "role",
+                "functions",
+                "factors",
+                "cell",
+                "function",
+                "human",
+                "may",
+                "found",
+                "well",
+                "analysis",
+                "recent",
+                "data",
+                "include",
+                "including",
+                "specific",
+                "involve",
+                "study",
+                "information",
+                "studies",
+                "demonstrate",
+                "demonstrated",
+                "associated",
+                "show",
+                "Changes",
+                "showed",
+                "high",
+                "low",
+                "level",
+                "system",
+                "change",
+                "different",
+                "pathways",
+                "similar",
+                "several",
+                "many",
+                "factor",
+                "peptide",
+                "based",
+                "lead",
+                "processes",
+                "finding",
+                "pathway",
+                "process",
+                "disease",
+                "performed",
+                "p",
+                "p-value",
+                "model",
+                "value",
+                "line",
+                "mechanism",
+                "patients",
+                "mechanisms",
+                "known",
+                "increased",
+                "cells",
+                "decreased",
+                "involved",
+                "complex",
+                "levels",
+                "type",
+                "activity",
+                "new",
+                "contribute",
+                "approach",
+                "significant",
+                "significantly",
+                "propose",
+                "suggests",
+                "biological",
+                "suggest",
+                "lines",
+                "clinical",
+                "provide",
+                "tissue",
+                "number",
+                "via",
+                "important",
+                "co",
+                "profile",
+                "vitro",
+                "complexes",
+                "domain",
+                "signaling",
+                "induced",
+                "regulation",
+                "signature",
+                "dependent",
+                "diseases",
+                "vivo",
+                "promote",
+                "Thus",
+                "used",
+                "related",
+                "key",
+                "shown",
+                "first",
+                "one",
+                "two",
+                "research",
+                "pattern",
+                "major",
+                "novel",
+                "effect",
+                "affect",
+                "multiple",
+                "present",
+                "normal",
+                "Finally",
+                "signalling",
+                "Although",
+                "play",
+                "discuss",
+                "risk",
+                "association",
+                "underlying",
+            ]
+        )
+        if "stopwords" in args:
+            sw = sw.union(args["stopwords"])
+
+        if isinstance(data, pd.DataFrame):
+            if not data.empty:
+                if "text_col" in args:
+                    text = "".join(
+                        str(a) for a in data[args["text_col"]].unique().tolist()
+                    )
+                else:
+                    return None
+            else:
+                return None
+        else:
+            text = data
+
+        wc = WordCloud(
+            stopwords=sw,
+            max_words=args["max_words"],
+            max_font_size=args["max_font_size"],
+            background_color="white",
+            margin=args["margin"],
+        )
+        wc.generate(text)
+
+        word_list = []
+        freq_list = []
+        fontsize_list = []
+        position_list = []
+        orientation_list = []
+        color_list = []
+
+        for (word, freq), fontsize, position, orientation, color in wc.layout_:
+            word_list.append(word)
+            freq_list.append(freq)
+            fontsize_list.append(fontsize)
+            position_list.append(position)
+            orientation_list.append(orientation)
+            color_list.append(color)
+
+        # get the positions
+        x = []
+        y = []
+        j = 0
+        for i in position_list:
+            x.append(i[1] + fontsize_list[j] + 10)
+            y.append(i[0] + 5)
+            j += 1
+
+        # get the relative occurence frequencies
+        new_freq_list = []
+        for i in freq_list:
+            new_freq_list.append(i * 70)
+        new_freq_list
+
+        trace = go.Scattergl(
+            x=x,
+            y=y,
+            textfont=dict(size=new_freq_list, color=color_list),
+            hoverinfo="text",
+            hovertext=[
+                "{0} freq: {1}".format(w, f) for w, f in zip(word_list, freq_list)
+            ],
+            mode="text",
+            text=word_list,
+        )
+
+        layout = go.Layout(
+            xaxis=dict(
+                showgrid=False, showticklabels=False, zeroline=False, automargin=True
+            ),
+            yaxis=dict(
+                showgrid=False, showticklabels=False, zeroline=False, automargin=True
+            ),
+            width=args["width"],
+            height=args["height"],
+            title=args["title"],
+            annotations=[dict(xref="paper", yref="paper", showarrow=False, text="")],
+            template="plotly_white",
+        )
+
+        figure = dict(data=[trace], layout=layout)
+
+    return dcc.Graph(id=identifier, figure=figure)
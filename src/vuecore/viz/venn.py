@@ -0,0 +1,147 @@
+"""Venn diagrams."""
+
+import plotly.graph_objs as go
+from dash import dcc
+
+
+def get_2_venn_diagram(data, identifier, cond1, cond2, args):
+    """
+    This function extracts the exlusive features in cond1 and cond2 and their common features,
+    and build a two-circle venn diagram.
+
+    :param data: pandas dataframe with features as rows and group identifiers as columns.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param str cond1: identifier of first group.
+    :param str cond2: identifier of second group.
+    :param dict args: see below.
+    :Arguments:
+        * **colors** (dict) -- dictionary with cond1 and cond2 as keys, and color codes as values.
+        * **title** (str) -- plot title.
+    :return: two-circle venn diagram figure within <div id="_dash-app-content">.
+
+    Example::
+
+        result = get_2_venn_diagram(data,
+                                    identifier='venn2',
+                                    cond1='group1',
+                                    cond2='group2',
+                                    args={'color':{'group1':'blue', 'group2':'red'},
+                                          'title':'Two-circle Venn diagram'}
+                                )
+
+    """
+    figure = {}
+    figure["data"] = []
+    unique1 = len(
+        set(data[cond1].dropna().index).difference(data[cond2].dropna().index)
+    )  # /total
+    unique2 = len(
+        set(data[cond2].dropna().index).difference(data[cond1].dropna().index)
+    )  # /total
+    intersection = len(
+        set(data[cond1].dropna().index).intersection(data[cond2].dropna().index)
+    )  # /total
+
+    return plot_2_venn_diagram(
+        cond1, cond2, unique1, unique2, intersection, identifier, args
+    )
+
+
+def plot_2_venn_diagram(cond1, cond2, unique1, unique2, intersection, identifier, args):
+    """
+    This function creates a simple non area-weighted two-circle venn diagram.
+
+    :param str cond1: label of the first circle.
+    :param str cond2: label of the second circle.
+    :param int unique1: number of features exclusive to cond1.
+    :param int unique2: number of features exclusive to cond2.
+    :parm int intersection: number of features common to cond1 and cond2.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **colors** (dict) -- dictionary with cond1 and cond2 as keys, and color codes as values.
+        * **title** (str) -- plot title.
+    :return: two-circle venn diagram figure within <div id="_dash-app-content">.
+
+    Example::
+
+        result = plot_2_venn_diagram(cond1='group1',
+                                     cond2='group2',
+                                     unique1=10,
+                                     unique2=15,
+                                     intersection=8,
+                                     identifier='vennplot',
+                                     args={'color':{'group1':'blue', 'group2':'red'},
+                                           'title':'Two-circle Venn diagram'}
+                                    )
+
+    """
+    figure = {}
+    figure["data"] = []
+
+    figure["data"] = [
+        go.Scattergl(
+            x=[1, 1.75, 2.5],
+            y=[1, 1, 1],
+            text=[str(unique1), str(intersection), str(unique2)],
+            mode="text",
+            textfont=dict(
+                color="black",
+                size=14,
+                family="Arial",
+            ),
+        )
+    ]
+
+    if "colors" not in args:
+        args["colors"] = {cond1: "#a6bddb", cond2: "#045a8d"}
+
+    figure["layout"] = {
+        "xaxis": {
+            "showticklabels": False,
+            "showgrid": False,
+            "zeroline": False,
+        },
+        "yaxis": {
+            "showticklabels": False,
+            "showgrid": False,
+            "zeroline": False,
+        },
+        "shapes": [
+            {
+                "opacity": 0.3,
+                "xref": "x",
+                "yref": "y",
+                "fillcolor": args["colors"][cond1],
+                "x0": 0,
+                "y0": 0,
+                "x1": 2,
+                "y1": 2,
+                "type": "circle",
+                "line": {
+                    "color": args["colors"][cond1],
+                },
+            },
+            {
+                "opacity": 0.3,
+                "xref": "x",
+                "yref": "y",
+                "fillcolor": args["colors"][cond2],
+                "x0": 1.5,
+                "y0": 0,
+                "x1": 3.5,
+                "y1": 2,
+                "type": "circle",
+                "line": {
+                    "color": args["colors"][cond2],
+                },
+            },
+        ],
+        "margin": {"l": 20, "r": 20, "b": 100},
+        "height": 600,
+        "width": 800,
+        "title": args["title"],
+        "template": "plotly_white",
+    }
+
+    return dcc.Graph(id=identifier, figure=figure)
@@ -0,0 +1,452 @@
+"""Volcano plots."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import plotly.io as pio
+from dash import dcc
+
+from ..utils.downsampling import density_thin_indices
+
+# Marker and line colors of each class of hits
+VOLCANO_COLORS = {
+    "down": ("rgba(44, 123, 182, 0.7)", "#2c7bb6"),
+    "up": ("rgba(215, 25, 28, 0.7)", "#d7191c"),
+    "down_below_fc": ("rgba(171, 217, 233, 0.5)", "#abd9e9"),
+    "up_below_fc": ("rgba(253, 174, 97, 0.5)", "#fdae61"),
+    "not_significant": ("rgba(153, 153, 153, 0.3)", "#999999"),
+}
+
+
+def _hover_text(data, pval_col="pvalue", padj_col="padj"):
+    """
+    Builds the hover text of every hit with vectorized string operations.
+
+    :param data: pandas dataframe with the regulation results (see run_volcano).
+    :param str pval_col: column with the p-values.
+    :param str padj_col: column with the adjusted p-values.
+    :return: numpy array with one hover text per row.
+    """
+    text = (
+        "<b>"
+        + data["identifier"].astype(str)
+        + ": "
+        + data.index.astype(str).to_series(index=data.index)
+        + "<br>Comparison: "
+        + data["group1"].astype(str)
+        + " vs "
+        + data["group2"].astype(str)
+        + "<br>log2FC = "
+        + data["log2FC"].map(lambda v: str(round(v, ndigits=2)))
+        + "<br>p = "
+        + data[pval_col].map("{:.2e}".format)
+        + "<br>FDR = "
+        + data[padj_col].map("{:.2e}".format)
+    )
+    return text.to_numpy()
+
+
+def _colors(data, alpha=0.05, fc=2, padj_col="padj"):
+    """
+    Classifies every hit by significance and fold change.
+
+    :param data: pandas dataframe with the regulation results (see run_volcano).
+    :param float alpha: adjusted p-value threshold for significant hits.
+    :param float fc: fold change threshold.
+    :param str padj_col: column with the adjusted p-values.
+    :return: tuple with the significance mask, the marker colors and the line colors
+             (numpy arrays with one value per row).
+    """
+    log2fc = data["log2FC"].to_numpy(dtype=float)
+    significant = (data[padj_col] < alpha).to_numpy()
+    conditions = [
+        significant & (log2fc <= -np.log2(fc)),
+        significant & (log2fc >= np.log2(fc)),
+        significant & (log2fc < 0.0),
+        significant & (log2fc > 0.0),
+    ]
+    classes = ["down", "up", "down_below_fc", "up_below_fc"]
+    default_color, default_line = VOLCANO_COLORS["not_significant"]
+    color = np.select(
+        conditions, [VOLCANO_COLORS[c][0] for c in classes], default_color
+    ).astype(object)
+    line_colors = np.select(
+        conditions, [VOLCANO_COLORS[c][1] for c in classes], default_line
+    ).astype(object)
+    return significant, color, line_colors
+
+
+def _annotation(x, y, text, color, size):
+    """
+    Returns the layout annotation labelling one hit.
+    """
+    return {
+        "x": x,
+        "y": y,
+        "xref": "x",
+        "yref": "y",
+        "text": text,
+        "showarrow": False,
+        "ax": 0,
+        "ay": -10,
+        "font": dict(color=color, size=size),
+    }
+
+
+def _background_mask(result):
+    """
+    Returns the mask of the non-significant hits of a volcano result, or None
+    if the hits are not colored by class (see run_volcano).
+    """
+    color = result["color"]
+    if isinstance(color, str) or len(color) != len(result["x"]):
+        return None
+    return np.asarray(color, dtype=object) == VOLCANO_COLORS["not_significant"][0]
+
+
+def _volcano_traces(result, args, max_points=None):
+    """
+    Builds the WebGL traces of a volcano plot.
+
+    Non-significant hits are drawn as a single-color background trace, without
+    per-point style arrays, and density-thinned to at most `max_points` points.
+    The remaining hits keep their per-point colors in a second trace.
+
+    :param dict result: volcano result (see get_volcanoplot).
+    :param dict args: plot arguments (see get_volcanoplot).
+    :param int max_points: maximum number of non-significant hits drawn.
+    :return: list of Scattergl traces.
+    """
+    x = np.asarray(result["x"])
+    y = np.asarray(result["y"])
+    text = np.asarray(result["text"], dtype=object)
+    background = _background_mask(result)
+    if background is None:
+        background = np.zeros(len(x), dtype=bool)
+    foreground = ~background
+
+    traces = []
+    if background.any():
+        positions = np.flatnonzero(background)
+        if max_points is not None:
+            positions = positions[
+                density_thin_indices(x[positions], y[positions], max_points)
+            ]
+        color, line_color = VOLCANO_COLORS["not_significant"]
+        traces.append(
+            go.Scattergl(
+                x=x[positions],
+                y=y[positions],
+                mode="markers",
+                text=text[positions].tolist(),
+                hoverinfo="text",
+                marker={
+                    "color": color,
+                    "size": args["marker_size"],
+                    "line": {"color": color, "width": 2},
+                },
+            )
+        )
+    if foreground.any():
+        color = result["color"]
+        if not isinstance(color, str):
+            color = np.asarray(color, dtype=object)[foreground].tolist()
+        traces.append(
+            go.Scattergl(
+                x=x[foreground],
+                y=y[foreground],
+                mode="markers",
+                text=text[foreground].tolist(),
+                hoverinfo="text",
+                marker={
+                    "color": color,
+                    "colorscale": args["colorscale"],
+                    "showscale": args["showscale"],
+                    "size": args["marker_size"],
+                    "line": {"color": color, "width": 2},
+                },
+            )
+        )
+    return traces
+
+
+def _fit_byte_budget(result, args, traces, layout, max_bytes):
+    """
+    Thins the non-significant hits until the figure JSON fits in `max_bytes`.
+
+    The number of background points is estimated from the average JSON size of
+    one point, then reduced further until the figure fits or no background
+    point is left.
+
+    :param dict result: volcano result (see get_volcanoplot).
+    :param dict args: plot arguments (see get_volcanoplot).
+    :param list traces: traces returned by _volcano_traces.
+    :param layout: plotly layout of the figure.
+    :param int max_bytes: maximum size of the figure JSON, in bytes.
+    :return: list of Scattergl traces.
+    """
+    background = _background_mask(result)
+    if background is None or not background.any():
+        return traces
+    layout_size = len(pio.to_json(layout, validate=False))
+    while True:
+        sizes = [len(pio.to_json(trace, validate=False)) for trace in traces]
+        size = layout_size + sum(sizes)
+        n_background = len(traces[0].x)
+        if size <= max_bytes or n_background == 0:
+            return traces
+        per_point = sizes[0] / n_background
+        target = int(n_background - (size - max_bytes) / per_point)
+        target = max(min(target, n_background - 1), 0)
+        traces = _volcano_traces(result, args, target)
+        if target == 0:
+            return traces
+
+
+def get_volcanoplot(results, args):
+    """
+    This function plots volcano plots for each internal dictionary in a nested dictionary.
+
+    :param dict[dict] results: nested dictionary with pairwise group comparisons as keys and
+                                internal dictionaries containing 'x' (log2FC values),
+                                'y' (-log10 p-values), 'text', 'color',
+                                'pvalue' and 'annotations' (number of hits to be highlighted).
+    :param dict args: see below.
+    :Arguments:
+        * **fc** (float) -- fold change threshold.
+        * **range_x** (list) -- list with minimum and maximum values for x axis.
+        * **range_y** (list) -- list with minimum and maximum values for y axis.
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **colorscale** (str) -- string for predefined plotly colorscales or dict containing \
+                                    one or more of the keys listed in \
+                                    https://plot.ly/python/reference/#layout-colorscale.
+        * **showscale** (bool) -- determines whether or not a colorbar is displayed for a trace.
+        * **marker_size** (int) -- sets the marker size (in px).
+        * **width** (int) -- figure width (in px), 950 by default.
+        * **height** (int) -- figure height (in px), 1050 by default.
+        * **max_points** (int) -- maximum number of non-significant hits drawn. Denser \
+                                    regions of the non-significant cloud are thinned first.
+        * **max_bytes** (int) -- maximum size of each figure JSON, in bytes. Non-significant \
+                                    hits are thinned further until the figure fits.
+    :return: list of volcano plot figures within the <div id="_dash-app-content">.
+
+    The hits are drawn with WebGL (Scattergl). Non-significant hits are collapsed into a \
+    single-color trace, drawn below the colored trace of the remaining hits.
+
+    Example::
+
+        result = get_volcanoplot(results,
+                                 args={'fc':2.0,
+                                       'range_x':[0, 1],
+                                       'range_y':[-1, 1],
+                                       'x_title':'x_axis',
+                                       'y_title':'y_title',
+                                       'colorscale':'Blues',
+                                       'showscale':True, 'marker_size':7}
+                                )
+    """
+    figures = []
+    for identifier, title in results:
+        result = results[(identifier, title)]
+        figure = {"data": [], "layout": None}
+        if "range_x" not in args:
+            range_x = [
+                -max(abs(result["x"])) - 0.1,
+                max(abs(result["x"])) + 0.1,
+            ]  # if symmetric_x else []
+        else:
+            range_x = args["range_x"]
+        if "range_y" not in args:
+            range_y = [0, max(abs(result["y"])) + 1.0]
+        else:
+            range_y = args["range_y"]
+        shapes = []
+        if ("is_samr" in result and not result["is_samr"]) or "is_samr" not in result:
+            shapes = [
+                {
+                    "type": "line",
+                    "x0": np.log2(args["fc"]),
+                    "y0": 0,
+                    "x1": np.log2(args["fc"]),
+                    "y1": range_y[1],
+                    "line": {"color": "grey", "width": 2, "dash": "dashdot"},
+                },
+                {
+                    "type": "line",
+                    "x0": -np.log2(args["fc"]),
+                    "y0": 0,
+                    "x1": -np.log2(args["fc"]),
+                    "y1": range_y[1],
+                    "line": {"color": "grey", "width": 2, "dash": "dashdot"},
+                },
+                {
+                    "type": "line",
+                    "x0": -max(abs(result["x"])) - 0.1,
+                    "y0": result["pvalue"],
+                    "x1": max(abs(result["x"])) + 0.1,
+                    "y1": result["pvalue"],
+                    "line": {"color": "grey", "width": 1, "dash": "dashdot"},
+                },
+            ]
+            # traces.append(go.Scattergl(x=result['upfc'][0], y=result['upfc'][1]))
+            # traces.append(go.Scattergl(x=result['downfc'][0], y=result['downfc'][1]))
+
+        figure["layout"] = go.Layout(
+            title=title,
+            xaxis={"title": args["x_title"], "range": range_x},
+            yaxis={"title": args["y_title"], "range": range_y},
+            hovermode="closest",
+            shapes=shapes,
+            width=args["width"] if "width" in args else 950,
+            height=args["height"] if "height" in args else 1050,
+            annotations=result["annotations"]
+            + [dict(xref="paper", yref="paper", showarrow=False, text="")],
+            template="plotly_white",
+            showlegend=False,
+        )
+        max_points = args["max_points"] if "max_points" in args else None
+        figure["data"] = _volcano_traces(result, args, max_points)
+        if "max_bytes" in args and args["max_bytes"] is not None:
+            figure["data"] = _fit_byte_budget(
+                result, args, figure["data"], figure["layout"], args["max_bytes"]
+            )
+
+        figures.append(dcc.Graph(id=identifier, figure=figure))
+    return figures
+
+
+def run_volcano(
+    data,
+    identifier,
+    args={
+        "alpha": 0.05,
+        "fc": 2,
+        "colorscale": "Blues",
+        "showscale": False,
+        "marker_size": 8,
+        "x_title": "log2FC",
+        "y_title": "-log10(pvalue)",
+        "num_annotations": 10,
+        "annotate_list": [],
+    },
+):
+    """
+    This function parsers the regulation data from statistical tests and
+    creates volcano plots for all distinct group comparisons.
+    Significant hits with lowest adjusted p-values are highlighed.
+
+    :param data: pandas dataframe with format:
+                    'identifier', 'group1', 'group2', 'mean(group1',
+                    'mean(group2)', 'log2FC', 'std_error', 'tail',
+                    't-statistics', 'padj_THSD',
+                    'effsize', 'efftype', 'FC', 'rejected',
+                    'F-statistics', 'pvalue', 'padj', 'correction', '-log10 pvalue' and 'Method'.
+    :param str identifier: id used to identify the div where the figure will be generated.
+    :param dict args: see below.
+    :Arguments:
+        * **alpha** (float) -- adjusted p-value threshold for significant hits.
+        * **fc** (float) -- fold change threshold.
+        * **colorscale** (str or dict) -- name of predefined plotly colorscale or dictionary \
+            containing one or more of the keys listed in \
+            https://plot.ly/python/reference/#layout-colorscale.
+        * **showscale** (bool) -- determines whether or not a colorbar is displayed for a trace.
+        * **marker_size** (int) -- sets the marker size (in px).
+        * **x_title** (str) -- plot x axis title.
+        * **y_title** (str) -- plot y axis title.
+        * **num_annotations** (int) -- number of hits to be highlighted (if num_annotations = 10,\
+            highlights 10 hits with lowest significant adjusted p-value).
+        * **width**, **height**, **max_points** and **max_bytes** -- optional, see \
+            get_volcanoplot.
+    :return: list of volcano plot figures within the <div id="_dash-app-content">.
+
+    Example::
+
+        result = run_volcano(data,
+                             identifier='volvano data',
+                             args={'alpha':0.05,
+                                   'fc':2.0,
+                                   'colorscale':'Blues',
+                                   'showscale':False,
+                                   'marker_size':6,
+                                   'x_title':'log2FC',
+                                   'y_title':'-log10(pvalue)',
+                                   'num_annotations':10}
+                            )
+    """
+    num_annotations = args["num_annotations"] if "num_annotations" in args else 10
+    annotate_list = args["annotate_list"] if "annotate_list" in args else []
+    padj_col = "padj"
+    pval_col = "pvalue"
+    sort_col = "padj" if "padj" in data else None
+    if "posthoc padj" in data:
+        padj_col = "posthoc padj"
+        pval_col = "posthoc pvalue"
+        sort_col = "posthoc padj"
+    is_samr = "s0" in data
+
+    # Hover text, colors and significance of all comparisons in one pass
+    text = _hover_text(data, pval_col=pval_col, padj_col=padj_col)
+    significant, color, line_colors = _colors(
+        data, alpha=args["alpha"], fc=args["fc"], padj_col=padj_col
+    )
+    log2fc = data["log2FC"].to_numpy()
+    log10pval = data["-log10 pvalue"].to_numpy()
+    labels = data["identifier"].astype(str).to_numpy()
+    is_hit = np.isin(line_colors, (VOLCANO_COLORS["down"][1], VOLCANO_COLORS["up"][1]))
+    sort_keys = pd.DataFrame(
+        {"log2FC": data["log2FC"], "position": np.arange(len(data))}, index=data.index
+    )
+    if sort_col is not None:
+        sort_keys[sort_col] = data[sort_col]
+    if len(annotate_list) > 0:
+        in_list = data["identifier"].isin(annotate_list).to_numpy()
+
+    volcano_plot_results = {}
+    for group, positions in data.groupby(["group1", "group2"]).indices.items():
+        gidentifier = identifier + "_".join(map(str, group))
+        title = "Comparison: " + str(group[0]) + " vs " + str(group[1])
+
+        # Hits are ordered by absolute log2FC, ties by adjusted p-value
+        signature = sort_keys.iloc[positions]
+        if sort_col is not None:
+            signature = signature.sort_values(by=sort_col, ascending=True)
+        signature = signature.reindex(
+            signature["log2FC"].abs().sort_values(ascending=False).index
+        )
+        order = signature["position"].to_numpy()
+
+        if len(annotate_list) > 0:
+            selected = order[in_list[order]]
+            font_size = 12
+        else:
+            selected = order[is_hit[order]]
+            font_size = 13
+        annotations = [
+            _annotation(
+                log2fc[i].item(),
+                log10pval[i].item(),
+                labels[i],
+                line_colors[i],
+                font_size,
+            )
+            for i in selected[:num_annotations]
+        ]
+
+        sig_pvals = log10pval[order][significant[order]]
+        min_pval_sign = sig_pvals.min() if len(sig_pvals) > 0 else 0
+
+        volcano_plot_results[(gidentifier, title)] = {
+            "x": log2fc[order],
+            "y": log10pval[order],
+            "text": text[order].tolist(),
+            "color": color[order].tolist(),
+            "line_color": line_colors[order].tolist(),
+            "pvalue": min_pval_sign,
+            "is_samr": is_samr,
+            "annotations": annotations,
+        }
+
+    figures = get_volcanoplot(volcano_plot_results, args)
+
+    return figures
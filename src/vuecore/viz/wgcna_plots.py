@@ -0,0 +1,187 @@
+"""WGCNA report plots."""
+
+import numpy as np
+import plotly.graph_objs as go
+import plotly.subplots as tools
+from acore import wgcna_analysis
+from dash import dcc, html
+
+from .. import dendrogram, wgcna
+from ..utils import clustering
+from .tables import get_table
+
+
+def get_WGCNAPlots(data, identifier):
+    """
+    Takes data from runWGCNA function and builds WGCNA plots.
+
+    :param data: tuple with multiple pandas dataframes.
+    :param str identifier: is the id used to identify the div where the figure will be generated.
+    :return: list of dcc.Graph.
+    """
+    graphs = [html.H2("Weighted Gene Co-expression Network Analysis")]
+    data = tuple(data[k] for k in data)
+
+    if data is not None:
+        (
+            dissTOM,
+            moduleColors,
+            Features_per_Module,
+            MEs,
+            moduleTraitCor,
+            textMatrix,
+            METDiss,
+            METcor,
+        ) = data
+        plots = []
+        plots.append(
+            wgcna.plot_complex_dendrogram(
+                dissTOM,
+                moduleColors,
+                title="Co-expression: dendrogram and module colors",
+                dendro_labels=dissTOM.columns,
+                distfun=None,
+                linkagefun="ward",
+                hang=0.1,
+                subplot="module colors",
+                col_annotation=True,
+                width=1000,
+                height=800,
+            )
+        )
+        plots.append(
+            get_table(
+                Features_per_Module,
+                identifier="",
+                args={
+                    "title": "Proteins/Genes module color",
+                    "colors": ("#C2D4FF", "#F5F8FF"),
+                    "cols": None,
+                    "rows": None,
+                },
+            )
+        )
+        plots.append(
+            wgcna.plot_labeled_heatmap(
+                moduleTraitCor,
+                textMatrix,
+                title="Module-Clinical variable relationships",
+                colorscale=[[0, "#67a9cf"], [0.5, "#f7f7f7"], [1, "#ef8a62"]],
+                row_annotation=True,
+                width=1000,
+                height=800,
+            )
+        )
+        dendro_tree = clustering.get_dendrogram(
+            METDiss, METDiss.index, distfun=None, linkagefun="ward", div_clusters=False
+        )
+        if dendro_tree is not None:
+            dendrogram_ = dendrogram.plot_dendrogram(
+                dendro_tree, hang=0.9, cutoff_line=False
+            )
+
+            layout = go.Layout(
+                width=900,
+                height=900,
+                showlegend=False,
+                title="",
+                xaxis=dict(
+                    domain=[0, 1],
+                    range=[
+                        np.min(dendrogram_["layout"]["xaxis"]["tickvals"]) - 6,
+                        np.max(dendrogram_["layout"]["xaxis"]["tickvals"]) + 4,
+                    ],
+                    showgrid=False,
+                    zeroline=True,
+                    ticks="",
+                    automargin=True,
+                    anchor="y",
+                ),
+                yaxis=dict(
+                    domain=[0.7, 1],
+                    autorange=True,
+                    showgrid=False,
+                    zeroline=False,
+                    ticks="outside",
+                    title="Height",
+                    automargin=True,
+                    anchor="x",
+                ),
+                xaxis2=dict(
+                    domain=[0, 1],
+                    autorange=True,
+                    showgrid=True,
+                    zeroline=False,
+                    ticks="",
+                    showticklabels=False,
+                    automargin=True,
+                    anchor="y2",
+                ),
+                yaxis2=dict(
+                    domain=[0, 0.64],
+                    autorange=True,
+                    showgrid=False,
+                    zeroline=False,
+                    automargin=True,
+                    anchor="x2",
+                ),
+            )
+
+            if not (
+                all(
+                    list(
+                        METcor.columns.map(
+                            lambda x: METcor[x].between(-1, 1, inclusive=True).all()
+                        )
+                    )
+                )
+            ):
+                df = wgcna_analysis.get_percentiles_heatmap(
+                    METcor, dendro_tree, bydendro=True, bycols=False
+                ).T
+            else:
+                df = wgcna_analysis.df_sort_by_dendrogram(
+                    wgcna_analysis.df_sort_by_dendrogram(METcor, dendro_tree).T,
+                    dendro_tree,
+                )
+
+            heatmap = wgcna.get_heatmap(
+                df,
+                colorscale=[[0, "#67a9cf"], [0.5, "#f7f7f7"], [1, "#ef8a62"]],
+                color_missing=False,
+            )
+
+            figure = tools.make_subplots(rows=2, cols=1, print_grid=False)
+
+            for i in list(dendrogram_["data"]):
+                figure.append_trace(i, 1, 1)
+            for j in list(heatmap["data"]):
+                figure.append_trace(j, 2, 1)
+
+            figure["layout"] = layout
+            figure["layout"]["template"] = "plotly_white"
+            figure["layout"].update(
+                {
+                    "xaxis": dict(
+                        domain=[0, 1], ticks="", showticklabels=False, anchor="y"
+                    ),
+                    "xaxis2": dict(
+                        domain=[0, 1], ticks="", showticklabels=True, anchor="y2"
+                    ),
+                    "yaxis": dict(domain=[0.635, 1], anchor="x"),
+                    "yaxis2": dict(
+                        domain=[0.0, 0.635], ticks="", showticklabels=True, anchor="x2"
+                    ),
+                }
+            )
+
+            plots.append(figure)
+
+            graphs = []
+            for i, j in enumerate(plots):
+                if isinstance(j, html.Div):
+                    graphs.append(j)
+                else:
+                    graphs.append(dcc.Graph(id=identifier + "_" + str(i), figure=j))
+
+    return graphs
@@ -6,6 +6,7 @@ import scipy as scp
 from acore import wgcna_analysis
 
 from . import color_list, dendrogram
+from .utils import clustering
 
 
 def get_module_color_annotation(
@@ -145,7 +146,7 @@ def get_heatmap(df, colorscale=None, color_missing=True):
         figure["layout"]["template"] = "plotly_white"
         figure["data"].append(
             go.Heatmap(
-                z=df.values.tolist(),
+                z=df.values,
                 y=list(df.index),
                 x=list(df.columns),
                 colorscale=colors,
@@ -159,7 +160,7 @@ def get_heatmap(df, colorscale=None, color_missing=True):
             df_missing = wgcna_analysis.get_miss_values_df(df)
             figure["data"].append(
                 go.Heatmap(
-                    z=df_missing.values.tolist(),
+                    z=df_missing.values,
                     y=list(df.index),
                     x=list(df.columns),
                     colorscale=[[0, "rgb(201,201,201)"], [1, "rgb(201,201,201)"]],
@@ -170,6 +171,42 @@ def get_heatmap(df, colorscale=None, color_missing=True):
     return figure
 
 
+def get_heatmap_labels(df, textmatrix, label_threshold=None, max_labels=None):
+    """
+    This function builds the cell labels of a heatmap as a text matrix, only keeping the labels of the strongest cells.
+
+    :param df: pandas dataframe containing data to be plotted in the heatmap.
+    :param textmatrix: pandas dataframe with heatmap annotations as values, matched to the cells of df by row and \
+        column labels, or by position if it has the same shape but other labels (e.g. a default RangeIndex).
+    :param float label_threshold: if set, only cells with an absolute value of at least label_threshold are labeled.
+    :param int max_labels: if set, only the max_labels cells with the largest absolute values are labeled.
+    :return: numpy array of strings with the same shape as df (empty strings for unlabeled cells).
+    """
+    same_labels = (
+        df.index.isin(textmatrix.index).all()
+        and df.columns.isin(textmatrix.columns).all()
+    )
+    if textmatrix.shape == df.shape and not same_labels:
+        text = pd.DataFrame(textmatrix.values, index=df.index, columns=df.columns)
+    else:
+        text = textmatrix.reindex(index=df.index, columns=df.columns)
+    text = text.fillna("")
+    # Plotly breaks text lines with <br>, not with newlines
+    text = text.astype(str).replace("\n", "<br>", regex=True).values
+    strength = np.abs(df.values.astype(float))
+    strength[np.isnan(strength)] = -np.inf
+    labeled = np.ones(strength.shape, dtype=bool)
+    if label_threshold is not None:
+        labeled &= strength >= label_threshold
+    if max_labels is not None and labeled.sum() > max_labels:
+        ranks = np.argsort(np.where(labeled, -strength, np.inf), axis=None)
+        labeled = np.zeros(strength.size, dtype=bool)
+        labeled[ranks[:max_labels]] = True
+        labeled = labeled.reshape(strength.shape)
+
+    return np.where(labeled, text, "")
+
+
 def plot_labeled_heatmap(
     df,
     textmatrix,
@@ -179,9 +216,13 @@ def plot_labeled_heatmap(
     height=800,
     row_annotation=False,
     col_annotation=False,
+    label_threshold=None,
+    max_labels=None,
 ):
     """
     This function plots a simple Plotly heatmap with column and/or row annotations and heatmap annotations.
+    Cell labels are drawn by the heatmap trace itself (text and texttemplate), and large matrices only label \
+    their strongest cells (see get_heatmap_labels).
 
     :param df: pandas dataframe containing data to be plotted in the heatmap.
     :param textmatrix: pandas dataframe with heatmap annotations as values.
@@ -191,6 +232,10 @@ def plot_labeled_heatmap(
     :param int height: the height of the figure.
     :param bool row_annotation: if True, adds a color-coded column at the left of the heatmap.
     :param bool col_annotation: if True, adds a color-coded row at the bottom of the heatmap.
+    :param float label_threshold: if set, only cells with an absolute value of at least label_threshold are labeled \
+        (e.g. significant correlations).
+    :param int max_labels: maximum number of labeled cells, the cells with the largest absolute values are labeled first \
+        (None by default, to label all cells). Large matrices draw faster with a limit, e.g. 2000.
     :return: Plotly object figure.
     """
     figure = {}
@@ -205,20 +250,13 @@ def plot_labeled_heatmap(
             )
         )
 
-        annotations = []
-        for n, row in enumerate(textmatrix.values):
-            for m, val in enumerate(row):
-                annotations.append(
-                    go.layout.Annotation(
-                        text=str(textmatrix.values[n][m]),
-                        font=dict(size=8),
-                        x=df.columns[m],
-                        y=df.index[n],
-                        xref="x",
-                        yref="y",
-                        showarrow=False,
-                    )
-                )
+        figure["data"][0].update(
+            text=get_heatmap_labels(
+                df, textmatrix, label_threshold=label_threshold, max_labels=max_labels
+            ),
+            texttemplate="%{text}",
+            textfont=dict(size=8),
+        )
 
         layout = go.Layout(
             width=width,
@@ -270,7 +308,6 @@ def plot_labeled_heatmap(
 
         figure["layout"] = layout
         figure["layout"]["template"] = "plotly_white"
-        figure["layout"].update(annotations=annotations)
 
     return figure
 
@@ -440,11 +477,15 @@ def plot_complex_dendrogram(
     col_annotation=False,
     width=1000,
     height=800,
+    max_heatmap_size=500,
 ):
     """
     This function plots a dendrogram with a subplot below that can be a heatmap (annotated or not) or module colors.
 
-    :param dendro_df: pandas dataframe containing data used to generate dendrogram, columns will result in dendrogram leaves.
+    :param dendro_df: pandas dataframe containing data used to generate dendrogram, columns will result in dendrogram leaves. \
+        With distfun=None, a square dissimilarity matrix (e.g. dissTOM) given as a dataframe, a float32 or memory-mapped \
+        numpy array (numpy.load(..., mmap_mode='r')), or its condensed distance vector (see \
+        vuecore.utils.clustering.condensed_distances), so large matrices are clustered without dense float64 copies.
     :param subplot_df: pandas dataframe containing data used to generate plot below dendrogram.
     :param str title: the title of the figure.
     :param list dendro_labels: list of strings for dendrogram leaf nodes labels.
@@ -458,10 +499,12 @@ def plot_complex_dendrogram(
     :param bool col_annotation: if `True`, adds a color-coded row at the bottom of the heatmap.
     :param int width: the width of the figure.
     :param int height: the height of the figure.
+    :param int max_heatmap_size: maximum number of rows and columns of the heatmap subplot, evenly sampled along \
+        the dendrogram (500 by default, None to draw all of them).
     :return: Plotly object figure.
     """
     figure = {}
-    dendro_tree = wgcna_analysis.get_dendrogram(
+    dendro_tree = clustering.get_dendrogram(
         dendro_df,
         dendro_labels,
         distfun=distfun,
@@ -552,21 +595,16 @@ def plot_complex_dendrogram(
             )
 
         elif subplot == "heatmap":
-            if not all(
-                list(
-                    subplot_df.columns.map(
-                        lambda x: subplot_df[x].between(-1, 1, inclusive=True).all()
-                    )
-                )
-            ):
+            values = subplot_df.values
+            # Missing values fail the check, as with pandas between
+            if not (values.min() >= -1 and values.max() <= 1):
                 df = wgcna_analysis.get_percentiles_heatmap(
                     subplot_df, dendro_tree, bydendro=True, bycols=False
                 ).T
             else:
-                df = wgcna_analysis.df_sort_by_dendrogram(
-                    wgcna_analysis.df_sort_by_dendrogram(subplot_df, dendro_tree).T,
-                    dendro_tree,
-                )
+                # Only the sampled rows and columns are copied, in dendrogram order
+                leaves = clustering.sample_leaves(dendro_tree["ivl"], max_heatmap_size)
+                df = subplot_df.loc[leaves, leaves].T
 
             heatmap = get_heatmap(
                 df, colorscale=subplot_colorscale, color_missing=color_missingvals
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from vuecore import PlotType
+from vuecore.plots import PlotSpec, create_plots
+from vuecore.plots import batch
+from vuecore.plots.batch import get_plot_config
+
+
+@pytest.fixture
+def sample_batch_data() -> pd.DataFrame:
+    """
+    Fixture for generating synthetic long-format data with several proteins.
+    """
+    rng = np.random.default_rng(42)
+    n_rows = 600
+    return pd.DataFrame(
+        {
+            "Protein": rng.choice(["P1", "P2", "P3"], size=n_rows),
+            "Cohort": rng.choice(["A", "B"], size=n_rows),
+            "Abundance": rng.normal(20, 2, size=n_rows),
+            "Fold_Change": rng.normal(0, 1, size=n_rows),
+        }
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_group_by_batch(sample_batch_data: pd.DataFrame, tmp_path: Path, n_jobs: int):
+    """
+    Test one figure per group, ensuring results follow the sorted group keys
+    and the figures are saved in the output directory.
+    """
+    results = create_plots(
+        sample_batch_data,
+        plot_type=PlotType.BOX,
+        group_by="Protein",
+        x="Cohort",
+        y="Abundance",
+        n_jobs=n_jobs,
+        save_dir=str(tmp_path),
+    )
+
+    assert [result.key for result in results] == ["P1", "P2", "P3"]
+    for result in results:
+        assert result.error is None, f"Unexpected error: {result.error}"
+        assert result.figure is not None
+        assert Path(result.file_path).exists()
+        assert Path(result.file_path).name == f"{result.key}.html"
+
+
+def test_spec_batch_reports_errors(sample_batch_data: pd.DataFrame):
+    """
+    Test a list of specs, ensuring invalid specs are reported in place
+    without aborting the rest of the batch.
+    """
+    specs = [
+        (PlotType.SCATTER, {"x": "Fold_Change", "y": "Abundance"}),
+        (PlotType.BAR, {"color": "Cohort"}),
+        PlotSpec(PlotType.HISTOGRAM, {"x": "Missing_Column"}),
+        {"plot_type": "violin", "kwargs": {"x": "Cohort", "y": "Abundance"}},
+    ]
+
+    results = create_plots(sample_batch_data, specs=specs, n_jobs=2)
+
+    assert [result.key for result in results] == [0, 1, 2, 3]
+    assert results[0].error is None and results[0].figure is not None
+    assert results[1].error is not None and results[1].figure is None
+    assert results[2].error is not None and results[2].figure is None
+    assert results[3].error is None and results[3].figure is not None
+
+    with pytest.raises(Exception):
+        create_plots(sample_batch_data, specs=specs, raise_errors=True)
+
+
+def test_group_keys_are_safe_file_names(sample_batch_data: pd.DataFrame, tmp_path):
+    """
+    Test that group keys with path separators are saved inside the output
+    directory, with distinct names for keys that map to the same file name.
+    """
+    data = sample_batch_data.assign(
+        Protein=sample_batch_data["Protein"].map(
+            {"P1": "../P1", "P2": "a/b", "P3": "a:b"}
+        )
+    )
+    results = create_plots(
+        data,
+        plot_type=PlotType.BOX,
+        group_by="Protein",
+        x="Cohort",
+        y="Abundance",
+        save_dir=str(tmp_path / "out"),
+    )
+
+    names = sorted(Path(result.file_path).name for result in results)
+    assert names == ["_P1.html", "a_b.html", "a_b_1.html"]
+    for result in results:
+        assert result.error is None, f"Unexpected error: {result.error}"
+        assert Path(result.file_path).parent == tmp_path / "out"
+        assert Path(result.file_path).exists()
+
+
+def test_plot_configs_follow_schema_modules():
+    """
+    Test that every plot type resolves to the config class of its schema module.
+    """
+    for plot_type in PlotType:
+        config = get_plot_config(plot_type)
+        assert config.__module__ == f"vuecore.schemas.basic.{plot_type.value}"
+
+
+def test_concurrent_sequential_batches(sample_batch_data: pd.DataFrame):
+    """
+    Test that sequential batches run from several threads each use their own
+    DataFrame.
+    """
+    datasets = [sample_batch_data.assign(Abundance=float(i)) for i in range(8)]
+    specs = [(PlotType.SCATTER, {"x": "Fold_Change", "y": "Abundance"})] * 20
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = list(
+            executor.map(lambda data: create_plots(data, specs=specs), datasets)
+        )
+
+    for i, results in enumerate(batches):
+        for result in results:
+            assert result.error is None, f"Unexpected error: {result.error}"
+            assert set(result.figure.data[0].y) == {float(i)}
+    assert batch._WORKER_DATA is None
+
+
+def test_save_dir_requires_group_by(sample_batch_data: pd.DataFrame, tmp_path):
+    """Test that `save_dir` is rejected with specs, which have their own paths."""
+    specs = [(PlotType.SCATTER, {"x": "Fold_Change", "y": "Abundance"})]
+    with pytest.raises(ValueError, match="save_dir"):
+        create_plots(sample_batch_data, specs=specs, save_dir=str(tmp_path))
@@ -2,8 +2,11 @@ import pandas as pd
 import numpy as np
 import pytest
 from pathlib import Path
+from pydantic import ValidationError
 
+from vuecore.engines.plotly.box import box_preprocess, precomputed_box
 from vuecore.plots.basic.box import create_box_plot
+from vuecore.schemas.basic.box import BoxConfig
 
 
 @pytest.fixture
@@ -123,3 +126,80 @@ def test_advanced_box_plot(sample_box_data: pd.DataFrame, tmp_path: Path, ext: s
     assert (
         output_path.stat().st_size > 0
     ), f"Output file should not be empty: {output_path}"
+
+
+def test_precomputed_box_plot(sample_box_data: pd.DataFrame, tmp_path: Path):
+    """
+    Test box plot creation with precomputed statistics, ensuring the boxes
+    match the ones computed by Plotly and only the outliers are carried.
+    """
+    output_path = tmp_path / "precomputed_box_test.html"
+
+    fig = create_box_plot(
+        data=sample_box_data,
+        x="Treatment",
+        y="Expression",
+        color="Sample_ID",
+        notched=True,
+        precompute_stats=True,
+        file_path=str(output_path),
+    )
+
+    assert output_path.exists(), f"Output file should exist: {output_path}"
+    assert len(fig.data) == sample_box_data["Sample_ID"].nunique()
+
+    for trace in fig.data:
+        for treatment, q1, median, q3, lowerfence, upperfence, outliers in zip(
+            trace.x,
+            trace.q1,
+            trace.median,
+            trace.q3,
+            trace.lowerfence,
+            trace.upperfence,
+            trace.y,
+        ):
+            values = sample_box_data.loc[
+                (sample_box_data["Sample_ID"] == trace.name)
+                & (sample_box_data["Treatment"] == treatment),
+                "Expression",
+            ].to_numpy()
+            expected_q1, expected_median, expected_q3 = np.percentile(
+                values, [25, 50, 75]
+            )
+            assert np.isclose(q1, expected_q1)
+            assert np.isclose(median, expected_median)
+            assert np.isclose(q3, expected_q3)
+            assert all(v < lowerfence or v > upperfence for v in outliers)
+            assert len(outliers) == np.sum(
+                (values < lowerfence) | (values > upperfence)
+            )
+
+
+def test_precomputed_box_hover(sample_box_data: pd.DataFrame):
+    """
+    Test that precomputed boxes drop the Plotly Express hover template, whose
+    custom data fields no longer exist, for the default box statistics hover.
+    """
+    stats, plot_args = box_preprocess(
+        sample_box_data,
+        {"x": "Treatment", "y": "Expression", "color": "Sample_ID"},
+        BoxConfig(x="Treatment", y="Expression", precompute_stats=True),
+    )
+    fig = precomputed_box(stats, hover_data=["q1"], **plot_args)
+
+    for trace in fig.data:
+        assert trace.customdata is None
+        assert trace.hovertemplate is None
+
+
+@pytest.mark.parametrize("points", ["all", "suspectedoutliers"])
+def test_precomputed_box_rejects_all_points(sample_box_data: pd.DataFrame, points: str):
+    """Test that precomputed boxes reject point modes that need every value."""
+    with pytest.raises(ValidationError, match="precompute_stats"):
+        create_box_plot(
+            data=sample_box_data,
+            x="Treatment",
+            y="Expression",
+            points=points,
+            precompute_stats=True,
+        )
@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from vuecore.plots.basic.scatter import create_scatter_plot
+from vuecore.utils.cache import FigureCache, ServerStore
+
+
+@pytest.fixture
+def sample_cache_data() -> pd.DataFrame:
+    """
+    Fixture for generating a small synthetic DataFrame for cached plots.
+    """
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=200),
+            "y": rng.normal(size=200),
+            "group": rng.choice(["A", "B"], size=200),
+        }
+    )
+
+
+def test_cache_hits_and_misses(sample_cache_data: pd.DataFrame):
+    """
+    Test that identical requests reuse the cached figure, while changes in
+    the data or the configuration build a new one.
+    """
+    cache = FigureCache(copy=False)
+
+    fig = create_scatter_plot(sample_cache_data, x="x", y="y", cache=cache)
+    assert create_scatter_plot(sample_cache_data, x="x", y="y", cache=cache) is fig
+    assert (
+        create_scatter_plot(sample_cache_data.copy(), x="x", y="y", cache=cache) is fig
+    )
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    other_config = create_scatter_plot(
+        sample_cache_data, x="x", y="y", title="Other", cache=cache
+    )
+    changed_data = sample_cache_data.assign(y=sample_cache_data["y"] + 1)
+    other_data = create_scatter_plot(changed_data, x="x", y="y", cache=cache)
+    assert other_config is not fig and other_data is not fig
+    assert cache.misses == 3
+
+
+def test_cache_hits_are_copies(sample_cache_data: pd.DataFrame):
+    """
+    Test that, by default, changes to a returned figure do not reach later hits.
+    """
+    cache = FigureCache()
+
+    fig = create_scatter_plot(sample_cache_data, x="x", y="y", title="A", cache=cache)
+    fig.update_layout(title_text="Changed")
+    fig.data[0].x[0] = 1e6
+    hit = create_scatter_plot(sample_cache_data, x="x", y="y", title="A", cache=cache)
+
+    assert hit is not fig and cache.hits == 1
+    assert hit.layout.title.text == "A"
+    assert hit.data[0].x[0] == sample_cache_data["x"].iloc[0]
+    assert 0 < cache.total_bytes < 64 * 2**10
+
+
+def test_cache_size_eviction_and_disk_tier(
+    sample_cache_data: pd.DataFrame, tmp_path: Path
+):
+    """
+    Test that the memory tier stays within its budget by evicting the least
+    recently used figures, and that the disk tier serves evicted figures.
+    """
+    cache = FigureCache(cache_dir=tmp_path)
+    create_scatter_plot(sample_cache_data, x="x", y="y", cache=cache)
+    cache.max_bytes = int(cache.total_bytes * 1.5)
+
+    for title in ["First", "Second", "Third"]:
+        create_scatter_plot(sample_cache_data, x="x", y="y", title=title, cache=cache)
+        assert cache.total_bytes <= cache.max_bytes
+    assert len(cache) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+    cold_cache = FigureCache(cache_dir=tmp_path)
+    fig = create_scatter_plot(
+        sample_cache_data, x="x", y="y", title="First", cache=cold_cache
+    )
+    assert (cold_cache.hits, cold_cache.misses) == (1, 0)
+    assert fig.layout.title.text is not None
+
+
+def test_server_store_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the server store gives each value its own token, and evicts the
+    least recently used and the expired entries.
+    """
+    store = ServerStore(max_entries=2, ttl=60)
+    first = store.add("first", prefix="table_")
+    second = store.add("second", prefix="table_")
+    assert first != second and first.startswith("table_")
+
+    assert store.get(first) == "first"
+    third = store.add("third")
+    assert second not in store and len(store) == 2
+
+    clock = time.monotonic() + 61
+    monkeypatch.setattr(time, "monotonic", lambda: clock)
+    assert store.get(first) is None and store.get(third) is None
+    assert len(store) == 0
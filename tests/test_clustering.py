@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.cluster import hierarchy
+from scipy.spatial.distance import pdist, squareform
+
+from vuecore.utils import clustering
+
+
+@pytest.fixture
+def observations() -> pd.DataFrame:
+    """Fixture with 40 random observations of 5 features."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(40, 5)))
+
+
+def test_linkage_cache(observations: pd.DataFrame):
+    """Test that equal matrices share one linkage and other settings do not."""
+    linkage = clustering.compute_linkage(observations, method="average")
+
+    assert clustering.compute_linkage(observations.copy(), method="average") is linkage
+    assert clustering.compute_linkage(observations, method="ward") is not linkage
+    np.testing.assert_array_equal(
+        linkage, hierarchy.linkage(pdist(observations.values), "average")
+    )
+    with pytest.raises(ValueError):
+        linkage[0, 0] = 0
+
+
+def test_dendrogram_from_dissimilarity_matrix(observations: pd.DataFrame):
+    """Test that a square dissimilarity matrix is clustered as distances."""
+    dissimilarity = pd.DataFrame(squareform(pdist(observations.values)))
+    labels = [f"gene{i}" for i in range(40)]
+    tree, clusters = clustering.get_dendrogram(
+        dissimilarity, labels, distfun=None, div_clusters=True, fcluster_cutoff=5
+    )
+    expected = hierarchy.dendrogram(
+        hierarchy.linkage(pdist(observations.values), "ward"),
+        labels=labels,
+        no_plot=True,
+    )
+
+    assert tree["ivl"] == expected["ivl"]
+    assert sorted(sum(clusters.values(), [])) == sorted(labels)
+    assert clustering.get_dendrogram(dissimilarity, labels, distfun=None) is tree
+
+
+def test_complex_heatmap_clusters_once(monkeypatch, observations: pd.DataFrame):
+    """Test that both dendrograms of the clustered heatmap share one linkage."""
+    from vuecore.viz.heatmap import get_complex_heatmapplot
+
+    calls = []
+    linkage = hierarchy.linkage
+    monkeypatch.setattr(
+        hierarchy,
+        "linkage",
+        lambda *args, **kwargs: calls.append(1) or linkage(*args, **kwargs),
+    )
+    clustering.clear_clustering_cache()
+    correlations = observations.T.corr()
+    get_complex_heatmapplot(correlations, "heatmap", {"format": "matrix", "dist": True})
+
+    assert len(calls) == 1
+
+
+def test_linkage_from_memmap_and_condensed(tmp_path, observations: pd.DataFrame):
+    """Test that memory-mapped float32 and condensed inputs match dense ones."""
+    distances = pdist(observations.values)
+    path = tmp_path / "dissimilarity.npy"
+    np.save(path, squareform(distances).astype(np.float32))
+    memmap = np.load(path, mmap_mode="r")
+
+    np.testing.assert_allclose(
+        clustering.condensed_distances(memmap), distances, rtol=1e-6
+    )
+    expected = hierarchy.linkage(distances, "average")
+    for matrix in [memmap, distances]:
+        linkage = clustering.compute_linkage(
+            matrix, distfun=None, method="average", cache=False
+        )
+        np.testing.assert_allclose(linkage, expected, rtol=1e-5)
+
+
+def test_complex_dendrogram_heatmap_is_sampled(observations: pd.DataFrame):
+    """Test that the heatmap subplot is drawn from sampled leaves."""
+    from vuecore.wgcna import plot_complex_dendrogram
+
+    correlations = observations.T.corr()
+    figure = plot_complex_dendrogram(
+        pdist(observations.values),
+        correlations,
+        title="TOM",
+        dendro_labels=list(correlations.index),
+        distfun=None,
+        subplot="heatmap",
+        color_missingvals=False,
+        max_heatmap_size=10,
+    )
+
+    heatmap = [trace for trace in figure.data if trace.type == "heatmap"][0]
+    assert np.shape(heatmap.z) == (10, 10)
+    assert clustering.sample_leaves(range(40), 10)[::9] == [0, 39]
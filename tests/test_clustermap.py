@@ -0,0 +1,131 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from scipy.cluster import hierarchy
+from scipy.spatial.distance import pdist
+
+from vuecore.engines.plotly.clustermap import dendrogram_lines
+from vuecore.plots.basic.clustermap import create_clustermap_plot
+from vuecore.utils import clustering
+
+
+@pytest.fixture
+def expression() -> pd.DataFrame:
+    """Fixture with 40 genes in two groups measured in 12 samples."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(40, 12))
+    values[::2, :6] += 4
+    return pd.DataFrame(
+        values,
+        index=[f"gene{i}" for i in range(40)],
+        columns=[f"sample{i}" for i in range(12)],
+    )
+
+
+def test_dendrogram_lines_match_scipy(expression: pd.DataFrame):
+    """Test that the links and leaf order match scipy's dendrogram."""
+    linkage = hierarchy.linkage(pdist(expression.values), "average")
+    tree = hierarchy.dendrogram(linkage, no_plot=True)
+    leaves, positions, heights = dendrogram_lines(linkage)
+
+    assert leaves.tolist() == tree["leaves"]
+    links = sorted(
+        zip(map(tuple, (np.array(tree["icoord"]) - 5) / 10), map(tuple, tree["dcoord"]))
+    )
+    expected = sorted(
+        zip(
+            map(tuple, positions.reshape(-1, 5)[:, :4]),
+            map(tuple, heights.reshape(-1, 5)[:, :4]),
+        )
+    )
+    np.testing.assert_allclose(links, expected)
+
+
+def test_clustermap_structure(expression: pd.DataFrame):
+    """Test the heatmap is reordered by the dendrograms, one trace each."""
+    fig = create_clustermap_plot(
+        expression, title="Expression", optimal_leaf_ordering=True
+    )
+
+    assert [trace.type for trace in fig.data] == ["heatmap", "scatter", "scatter"]
+    linkage = hierarchy.linkage(
+        pdist(expression.values), "average", optimal_ordering=True
+    )
+    rows = hierarchy.leaves_list(linkage)
+    assert list(fig.layout.yaxis3.ticktext) == list(expression.index[rows])
+    heatmap = np.asarray(fig.data[0].z)
+    np.testing.assert_allclose(
+        heatmap[:, 0],
+        expression.values[rows][
+            :, expression.columns.get_loc(fig.layout.xaxis3.ticktext[0])
+        ],
+    )
+    # Each dendrogram has 4 points and a gap per merge
+    assert len(fig.data[1].x) == 5 * (expression.shape[1] - 1)
+    assert len(fig.data[2].y) == 5 * (expression.shape[0] - 1)
+
+
+def test_clustermap_linkages_computed_once(expression: pd.DataFrame):
+    """Test that each axis is clustered once and cached across figures."""
+    clustering.clear_clustering_cache()
+    with mock.patch.object(
+        clustering.hierarchy, "linkage", wraps=hierarchy.linkage
+    ) as linkage:
+        create_clustermap_plot(expression, linkage_method="ward")
+        create_clustermap_plot(expression, linkage_method="ward", title="Again")
+
+    assert linkage.call_count == 2
+
+
+def test_clustermap_long_format(expression: pd.DataFrame):
+    """Test that long data is pivoted, and rows can be kept in order."""
+    long = expression.rename_axis("gene").reset_index()
+    long = long.melt(id_vars="gene", var_name="sample", value_name="intensity")
+    fig = create_clustermap_plot(
+        long, x="sample", y="gene", z="intensity", cluster_rows=False
+    )
+
+    assert len(fig.data) == 2
+    assert list(fig.layout.yaxis3.ticktext) == sorted(expression.index)
+    assert fig.layout.xaxis3.title.text == "Sample"
+
+
+def test_clustermap_large_matrix_is_aggregated():
+    """Test that large matrices are drawn in blocks without labels."""
+    rng = np.random.default_rng(1)
+    values = pd.DataFrame(rng.normal(size=(2000, 30)))
+    fig = create_clustermap_plot(values, max_rows=200, z_score="col")
+
+    assert np.asarray(fig.data[0].z).shape == (200, 30)
+    assert fig.data[0].dy == 10
+    assert fig.layout.yaxis3.ticktext is None
+    assert fig.layout.yaxis3.range == (1999.5, -0.5)
+
+
+def test_clustermap_heatmap_arguments_override_defaults(expression: pd.DataFrame):
+    """Test that additional Heatmap arguments replace the builder defaults."""
+    fig = create_clustermap_plot(
+        expression, colorscale="Viridis", colorbar=dict(title="Intensity")
+    )
+
+    assert fig.data[0].colorscale[0][1] == "#440154"
+    assert fig.data[0].colorbar.title.text == "Intensity"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"x": "sample", "y": "gene"},
+        {"z_score": "both"},
+        {"z": "intensity"},
+        {"linkage_method": "nearest"},
+        {"aggregation": "median"},
+    ],
+)
+def test_clustermap_invalid_config(expression: pd.DataFrame, kwargs: dict):
+    """Test that incomplete long-format columns and unknown options are rejected."""
+    with pytest.raises(ValidationError):
+        create_clustermap_plot(expression, **kwargs)
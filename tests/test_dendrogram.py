@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy.cluster import hierarchy
+
+from vuecore.dendrogram import plot_dendrogram
+
+
+@pytest.fixture
+def dendro_tree() -> dict:
+    """Fixture with the dendrogram of 50 random observations."""
+    rng = np.random.default_rng(0)
+    linkage = hierarchy.linkage(rng.normal(size=(50, 3)), "ward")
+    return hierarchy.dendrogram(linkage, no_plot=True, color_threshold=5)
+
+
+def test_single_trace_matches_merge_traces(dendro_tree: dict):
+    """Test that the single trace joins the per-link traces with NaN separators."""
+    merged = plot_dendrogram(
+        dendro_tree, hang=0.5, cutoff_line=False, trace_mode="merge"
+    )
+    single = plot_dendrogram(dendro_tree, hang=0.5, cutoff_line=False)
+
+    assert len(merged["data"]) == 49
+    assert len(single["data"]) == 1
+    for axis in ["x", "y"]:
+        expected = np.concatenate([np.append(t[axis], np.nan) for t in merged["data"]])
+        np.testing.assert_array_equal(single["data"][0][axis], expected)
+    assert single["layout"]["xaxis"]["tickvals"] == list(np.arange(5.0, 500.0, 10))
+
+
+def test_hang_shortens_leaf_lines(dendro_tree: dict):
+    """Test that leaf lines hang `hang` below their link, without going below 0."""
+    figure = plot_dendrogram(dendro_tree, hang=0.5, cutoff_line=False)
+    y = figure["data"][0]["y"].reshape(-1, 5)[:, :4]
+    dcoord = np.asarray(dendro_tree["dcoord"])
+    leaf = dcoord == 0
+    top = dcoord[:, [1, 1, 2, 2]]
+
+    np.testing.assert_allclose(y[leaf], np.maximum(top[leaf] - 0.5, 0))
+    np.testing.assert_array_equal(y[~leaf], dcoord[~leaf])
+
+
+def test_color_traces(dendro_tree: dict):
+    """Test that the color mode draws one trace per cluster color."""
+    figure = plot_dendrogram(dendro_tree, cutoff_line=False, trace_mode="color")
+
+    assert len(figure["data"]) == len(set(dendro_tree["color_list"]))
+    assert len({trace["line"]["color"] for trace in figure["data"]}) > 1
+    n_links = sum(np.isnan(trace["x"]).sum() for trace in figure["data"])
+    assert n_links == len(dendro_tree["icoord"])
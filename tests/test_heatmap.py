@@ -0,0 +1,132 @@
+import dash
+import numpy as np
+import pandas as pd
+import pytest
+from dash import _callback as dash_callback
+from dash import html
+
+from vuecore.utils.downsampling import aggregate_blocks
+from vuecore.viz.heatmap import HEATMAP_TILERS, ZOOM_HEATMAP_TYPE, get_heatmapplot
+
+# Callbacks registered with dash.callback when the module was imported. Dash
+# moves them into the first app that serves a request, so each test app gets
+# its own copy
+_CALLBACK_MAP = {
+    key: value
+    for key, value in dash_callback.GLOBAL_CALLBACK_MAP.items()
+    if ZOOM_HEATMAP_TYPE in key
+}
+_CALLBACK_LIST = [
+    value
+    for value in dash_callback.GLOBAL_CALLBACK_LIST
+    if ZOOM_HEATMAP_TYPE in value["output"]
+]
+
+
+@pytest.fixture
+def dash_app(monkeypatch: pytest.MonkeyPatch) -> dash.Dash:
+    """Fixture with a Dash app that has served its first request."""
+    monkeypatch.setattr(dash_callback, "GLOBAL_CALLBACK_MAP", dict(_CALLBACK_MAP))
+    monkeypatch.setattr(dash_callback, "GLOBAL_CALLBACK_LIST", list(_CALLBACK_LIST))
+    app = dash.Dash(__name__)
+    app.layout = html.Div(id="page")
+    app.server.test_client().get("/")
+    return app
+
+
+@pytest.fixture
+def expression() -> pd.DataFrame:
+    """Fixture with a 1000 x 60 expression matrix."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.normal(size=(1000, 60)),
+        index=[f"gene{i}" for i in range(1000)],
+        columns=[f"sample{i}" for i in range(60)],
+    )
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [("mean", [[-4.2, -6.0]]), ("max", [[-1.0, -3.0]]), ("absmax", [[-7.0, -9.0]])],
+)
+def test_aggregate_blocks(method: str, expected: list):
+    """Test the block statistics, ignoring missing values and partial blocks."""
+    values = -np.arange(10.0).reshape(2, 5)
+    values[0, 0] = np.nan
+    aggregated, row_starts, col_starts = aggregate_blocks(values, 1, 2, method)
+
+    np.testing.assert_allclose(aggregated, expected)
+    assert row_starts.tolist() == [0] and col_starts.tolist() == [0, 3]
+
+
+def test_heatmap_is_aggregated_to_resolution(expression: pd.DataFrame):
+    """Test that large matrices are drawn at the maximum resolution."""
+    graph = get_heatmapplot(
+        expression,
+        "heatmap",
+        {"format": "matrix", "title": "Expression", "max_rows": 100},
+    )
+    heatmap = graph.figure["data"][0]
+
+    assert np.shape(heatmap.z) == (100, 60)
+    np.testing.assert_allclose(heatmap.z[0], expression.values[:10].mean(axis=0))
+    assert len(graph.figure["layout"]["yaxis"]["ticktext"]) <= 20
+
+
+def test_heatmap_zoom_draws_full_resolution_region(expression: pd.DataFrame):
+    """Test that zoomed regions are drawn from the full matrix."""
+    graph = get_heatmapplot(
+        expression,
+        "zoom_heatmap",
+        {"format": "matrix", "title": "Expression", "max_rows": 100, "zoom": True},
+    )
+    token = graph.id["index"]
+    figure = HEATMAP_TILERS.get(token).figure(row_range=(99.6, 120.2))
+    HEATMAP_TILERS.discard(token)
+
+    assert graph.id["type"] == ZOOM_HEATMAP_TYPE and token.startswith("zoom_heatmap_")
+    np.testing.assert_array_equal(figure["data"][0].z, expression.values[100:121])
+    assert figure["layout"]["yaxis"]["ticktext"][0] == "gene100"
+
+
+def test_small_heatmap_keeps_its_values():
+    """Test that small matrices are drawn as they are, without a tiler."""
+    data = pd.DataFrame([["a", "b"], ["c", "d"]], columns=["x", "y"])
+    n_tilers = len(HEATMAP_TILERS)
+    graph = get_heatmapplot(data, "labels", {"format": "matrix", "title": "Labels"})
+
+    assert graph.id == "labels"
+    assert graph.figure["data"][0].z.tolist() == [["a", "b"], ["c", "d"]]
+    assert len(HEATMAP_TILERS) == n_tilers
+
+
+def test_heatmap_zooms_after_first_request(
+    expression: pd.DataFrame, dash_app: dash.Dash
+):
+    """Test that a heatmap rendered after the app's first request still zooms."""
+    client = dash_app.server.test_client()
+    graph = get_heatmapplot(
+        expression,
+        "late_heatmap",
+        {"format": "matrix", "title": "Expression", "max_rows": 100, "zoom": True},
+    )
+
+    outputs = [key for key in dash_app.callback_map if ZOOM_HEATMAP_TYPE in key]
+    assert len(outputs) == 1
+    relayout = {"yaxis.range[0]": 99.6, "yaxis.range[1]": 120.2}
+    response = client.post(
+        "/_dash-update-component",
+        json={
+            "output": outputs[0],
+            "outputs": {"id": graph.id, "property": "figure"},
+            "inputs": [{"id": graph.id, "property": "relayoutData", "value": relayout}],
+            "state": [{"id": graph.id, "property": "id", "value": graph.id}],
+            "changedPropIds": [],
+        },
+    )
+    HEATMAP_TILERS.discard(graph.id["index"])
+
+    assert response.status_code == 200
+    (figure,) = response.get_json()["response"].values()
+    assert figure["figure"]["layout"]["yaxis"]["ticktext"][0] == "gene100"
+    assert figure["figure"]["layout"]["yaxis"]["range"] == [99.6, 120.2]
@@ -100,3 +100,27 @@ def test_advanced_histogram_plot(
     assert (
         output_path.stat().st_size > 0
     ), f"Output file should not be empty: {output_path}"
+
+
+@pytest.mark.parametrize("histnorm", [None, "percent", "probability density"])
+def test_precomputed_histogram_plot(sample_histogram_data: pd.DataFrame, histnorm):
+    """
+    Test histogram creation with precomputed bins, ensuring only the
+    aggregated values are embedded in the figure.
+    """
+    fig = create_histogram_plot(
+        data=sample_histogram_data,
+        x="Expression",
+        color="Condition",
+        nbins=20,
+        histnorm=histnorm,
+        hover_data=["Gene_ID"],
+        precompute_bins=True,
+    )
+
+    assert [trace.type for trace in fig.data] == ["bar", "bar"]
+    assert all(len(trace.x) == 20 for trace in fig.data)
+    if histnorm is None:
+        assert sum(sum(trace.y) for trace in fig.data) == len(sample_histogram_data)
+    elif histnorm == "percent":
+        assert all(np.isclose(sum(trace.y), 100) for trace in fig.data)
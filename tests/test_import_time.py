@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous budget for `import vuecore.plots.basic` in a fresh interpreter,
+# which should only pay for pandas and pydantic
+IMPORT_BUDGET_SECONDS = 3.0
+
+# Modules that must only be imported when a plot is built or saved
+HEAVY_MODULES = ["matplotlib", "plotly.express", "kaleido", "scipy"]
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_engines():
+    """
+    Test that importing the user API does not import matplotlib, the
+    Plotly builders or Kaleido.
+    """
+    loaded = _run(
+        "import sys, vuecore, vuecore.plots.basic; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == "", f"Heavy modules imported at import time: {loaded}"
+
+
+def test_import_time_budget():
+    """
+    Test that importing the user API stays within the import-time budget.
+    """
+    elapsed = float(
+        _run(
+            "import time; start = time.perf_counter(); "
+            "import vuecore.plots.basic; print(time.perf_counter() - start)"
+        )
+    )
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"Import took {elapsed:.2f}s"
+
+
+def test_lazy_builders_resolve_on_first_use():
+    """
+    Test that lazily registered builders and savers are imported on first use.
+    """
+    from vuecore import EngineType, PlotType
+    from vuecore.engines import get_builder, get_saver
+
+    assert callable(get_builder(PlotType.SCATTER, EngineType.PLOTLY))
+    assert callable(get_saver(EngineType.PLOTLY))
+    with pytest.raises(ValueError):
+        get_builder("unknown", EngineType.PLOTLY)
+
+
+def test_matplotlib_helpers_remain_available():
+    """
+    Test that the matplotlib helpers are still reachable from the package root.
+    """
+    import vuecore
+
+    assert callable(vuecore.savefig)
+    assert vuecore.figsize_a4 == (8.3, 11.7)
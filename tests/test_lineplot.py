@@ -124,3 +124,51 @@ def test_advanced_line_plot(sample_line_df: pd.DataFrame, tmp_path: Path, ext: s
     assert (
         output_path.stat().st_size > 0
     ), f"Output file should not be empty: {output_path}"
+
+
+def test_webgl_spline_line_plot(sample_line_df: pd.DataFrame):
+    """
+    Test that a line plot switches to WebGL traces above the threshold and
+    that the unsupported 'spline' shape falls back to straight lines.
+    """
+    fig = create_line_plot(
+        data=sample_line_df,
+        x="day",
+        y="value",
+        color="experiment",
+        line_shape="spline",
+        render_mode="auto",
+        webgl_threshold=10,
+    )
+
+    assert all(trace.type == "scattergl" for trace in fig.data)
+    assert all(trace.line.shape == "linear" for trace in fig.data)
+
+
+@pytest.mark.parametrize("downsample_method", ["lttb", "minmax", "nth"])
+def test_downsampled_line_plot(downsample_method: str):
+    """
+    Test that long lines are downsampled per trace and keep their endpoints.
+    """
+    n_points = 5000
+    data = pd.DataFrame(
+        {
+            "time": list(range(n_points)) * 2,
+            "signal": [float(i % 97) for i in range(2 * n_points)],
+            "sample": ["S1"] * n_points + ["S2"] * n_points,
+        }
+    )
+
+    fig = create_line_plot(
+        data=data,
+        x="time",
+        y="signal",
+        color="sample",
+        max_points_per_trace=200,
+        downsample_method=downsample_method,
+    )
+
+    assert len(fig.data) == 2
+    for trace in fig.data:
+        assert len(trace.x) <= 200
+        assert trace.x[0] == 0 and trace.x[-1] == n_points - 1
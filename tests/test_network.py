@@ -0,0 +1,274 @@
+import time
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from vuecore.network import (
+    LAYOUT_METHODS,
+    SPARSIFY_STRATEGIES,
+    apply_layout,
+    betweenness_centrality,
+    compute_layout,
+    detect_communities,
+    eigenvector_centrality,
+    register_sparsifier,
+    sparsify_graph,
+)
+from vuecore.utils_old import networkx_to_cytoscape
+from vuecore.viz.network import get_network
+
+
+@pytest.fixture
+def weighted_graph() -> nx.Graph:
+    """Fixture with a small weighted social network."""
+    graph = nx.les_miserables_graph()
+    for _, _, attrs in graph.edges(data=True):
+        attrs["edgewidth"] = float(attrs["weight"])
+    return graph
+
+
+def test_eigenvector_centrality_matches_networkx(weighted_graph: nx.Graph):
+    """Test that the sparse eigensolver matches networkx's dense solver."""
+    expected = nx.eigenvector_centrality_numpy(weighted_graph, weight="edgewidth")
+    result = eigenvector_centrality(weighted_graph, weight="edgewidth")
+
+    assert result.keys() == expected.keys()
+    assert np.allclose([result[n] for n in expected], list(expected.values()))
+
+
+def test_eigenvector_centrality_signed_weights():
+    """Test that negative weights (e.g., correlations) use their absolute value."""
+    graph = nx.path_graph(4)
+    nx.set_edge_attributes(graph, -1.0, "width")
+    result = eigenvector_centrality(graph, weight="width")
+    expected = nx.eigenvector_centrality_numpy(graph)
+
+    assert np.allclose([result[n] for n in graph], [expected[n] for n in graph])
+
+
+def test_betweenness_all_pivots_is_exact(weighted_graph: nx.Graph):
+    """Test that using every node as pivot gives the exact betweenness."""
+    expected = nx.betweenness_centrality(weighted_graph, weight="edgewidth")
+    result = betweenness_centrality(
+        weighted_graph, weight="edgewidth", time_budget=60.0
+    )
+
+    assert np.allclose([result[n] for n in expected], list(expected.values()))
+
+
+def test_sampled_betweenness_within_time_budget():
+    """Test that pivot sampling ranks nodes like the exact betweenness, in budget."""
+    graph = nx.powerlaw_cluster_graph(600, 3, 0.3, seed=1)
+    expected = nx.betweenness_centrality(graph)
+    start = time.perf_counter()
+    result = betweenness_centrality(graph, k=150, time_budget=1.0)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0
+    correlation = np.corrcoef([result[n] for n in graph], [expected[n] for n in graph])
+    assert correlation[0, 1] > 0.9
+
+
+@pytest.mark.parametrize(
+    "method", ["louvain", "label_propagation", "greedy_modularity"]
+)
+def test_detect_communities(method: str):
+    """Test that communities are numbered by decreasing size."""
+    graph = nx.ring_of_cliques(4, 6)
+    graph.add_edges_from([(0, 100), (100, 101)])
+    communities = detect_communities(graph, method=method)
+
+    sizes = np.bincount(list(communities.values()))
+    assert set(communities) == set(graph)
+    assert list(sizes) == sorted(sizes, reverse=True)
+    assert communities[1] == communities[2]
+
+
+def test_label_propagation_without_fast_variant(monkeypatch: pytest.MonkeyPatch):
+    """Test the fallback for networkx versions without fast label propagation."""
+    monkeypatch.delattr(nx.community, "fast_label_propagation_communities")
+    communities = detect_communities(
+        nx.ring_of_cliques(3, 5), method="label_propagation"
+    )
+
+    assert len(set(communities.values())) == 3
+    assert communities[0] == communities[1]
+
+
+def test_detect_communities_unsupported_method():
+    """Test that an unknown method raises a ValueError."""
+    with pytest.raises(ValueError, match="Unsupported community detection method"):
+        detect_communities(nx.path_graph(3), method="unknown")
+
+
+@pytest.fixture
+def large_graph() -> nx.Graph:
+    """Fixture with a scale-free network with hubs and random edge weights."""
+    graph = nx.powerlaw_cluster_graph(2000, 4, 0.3, seed=1)
+    rng = np.random.default_rng(0)
+    for _, _, attrs in graph.edges(data=True):
+        attrs["edgewidth"] = rng.uniform(0, 1)
+    return graph
+
+
+@pytest.mark.parametrize("strategy", ["topk", "backbone", "kcore", "mst"])
+def test_sparsify_within_budgets(large_graph: nx.Graph, strategy: str):
+    """Test that sparsified graphs respect both budgets and keep the hubs."""
+    subgraph = sparsify_graph(large_graph, strategy, max_nodes=100, max_edges=300)
+    degrees = dict(large_graph.degree())
+    hubs = sorted(degrees, key=degrees.get, reverse=True)[:5]
+
+    assert subgraph.number_of_nodes() == 100
+    assert subgraph.number_of_edges() == 300
+    assert all(hub in subgraph for hub in hubs)
+    u, v = next(iter(subgraph.edges()))
+    assert subgraph.edges[u, v] == large_graph.edges[u, v]
+
+
+def test_sparsify_mst_keeps_components_connected(large_graph: nx.Graph):
+    """Test that the spanning forest is kept before the strongest edges."""
+    subgraph = sparsify_graph(large_graph, "mst", max_nodes=None, max_edges=1999)
+
+    assert nx.is_tree(subgraph)
+    assert subgraph.number_of_nodes() == 2000
+
+
+def test_sparsify_kcore_with_node_budget():
+    """Test that the densest core is kept when the node budget drops most nodes."""
+    graph = nx.gnm_random_graph(380, 600, seed=0)
+    graph = nx.relabel_nodes(graph, {node: f"n{node}" for node in graph})
+    clique = [f"c{i}" for i in range(20)]
+    graph.add_edges_from(nx.complete_graph(clique).edges())
+    nx.set_edge_attributes(graph, 1.0, "edgewidth")
+    subgraph = sparsify_graph(graph, "kcore", max_nodes=150, max_edges=100)
+
+    assert subgraph.number_of_nodes() == 150
+    assert all(u in clique and v in clique for u, v in subgraph.edges())
+    assert subgraph.number_of_edges() == 100
+
+
+def test_sparsify_topk_keeps_strongest_edge_of_every_node():
+    """Test that every node keeps its strongest edge with the top-k strategy."""
+    graph = nx.complete_graph(6)
+    for u, v in graph.edges():
+        graph.edges[u, v]["edgewidth"] = float(u + v)
+    subgraph = sparsify_graph(graph, "topk", max_nodes=None, max_edges=6)
+
+    for node in graph:
+        strongest = max(graph[node], key=lambda n: graph.edges[node, n]["edgewidth"])
+        assert subgraph.has_edge(node, strongest)
+
+
+def test_register_sparsifier(large_graph: nx.Graph):
+    """Test that custom strategies can be registered."""
+    register_sparsifier("weakest", lambda graph, u, v, w: np.argsort(w))
+    try:
+        subgraph = sparsify_graph(large_graph, "weakest", max_edges=10)
+        weights = [w for _, _, w in subgraph.edges(data="edgewidth")]
+        assert max(weights) < 0.1
+    finally:
+        del SPARSIFY_STRATEGIES["weakest"]
+
+    with pytest.raises(ValueError, match="Unsupported sparsification strategy"):
+        sparsify_graph(large_graph, "weakest", max_edges=10)
+
+
+def test_networkx_to_cytoscape_attribute_whitelist():
+    """Test that only the listed attributes are serialized."""
+    graph = nx.Graph()
+    graph.add_edge("A", "B", width=-0.5, pvalue=0.01)
+    graph.nodes["A"].update(color="#ff0000", members=list(range(100)))
+    elements, _ = networkx_to_cytoscape(
+        graph, node_attributes=["color"], edge_attributes=["width"]
+    )
+
+    assert elements[0]["data"] == {
+        "color": "#ff0000",
+        "id": "A",
+        "value": "A",
+        "name": "A",
+    }
+    assert elements[2]["data"] == {"width": -0.5, "source": "A", "target": "B"}
+
+
+@pytest.mark.parametrize("method", LAYOUT_METHODS)
+def test_compute_layout_separates_clusters(method: str):
+    """Test that the nodes of two loosely connected cliques are laid out apart."""
+    graph = nx.barbell_graph(20, 0)
+    layout = compute_layout(graph, method=method, cache=False)
+    positions = np.array([layout[node] for node in graph])
+    left, right = positions[:20], positions[20:]
+    spread = np.linalg.norm(left - left.mean(axis=0), axis=1).mean()
+
+    assert np.abs(positions).max() <= 1.0 + 1e-9
+    assert np.linalg.norm(left.mean(axis=0) - right.mean(axis=0)) > 2 * spread
+
+
+@pytest.mark.parametrize("method", ["spring", "forceatlas2"])
+def test_compute_layout_large_graph(large_graph: nx.Graph, method: str):
+    """Test that force-directed layouts of large graphs use the sparse solver."""
+    start = time.perf_counter()
+    layout = compute_layout(large_graph, method=method, iterations=30, cache=False)
+
+    assert time.perf_counter() - start < 10
+    assert len(layout) == large_graph.number_of_nodes()
+    assert np.isfinite(np.array(list(layout.values()))).all()
+
+
+def test_compute_layout_cache():
+    """Test that equal graphs reuse the cached layout and changed graphs do not."""
+    graph = nx.les_miserables_graph()
+    layout = compute_layout(graph, method="forceatlas2", weight="weight")
+
+    assert compute_layout(graph.copy(), method="forceatlas2", weight="weight") is layout
+    graph.add_edge("Valjean", "Javert", weight=10)
+    assert compute_layout(graph, method="forceatlas2", weight="weight") is not layout
+
+
+def test_compute_layout_unsupported_method():
+    """Test that an unknown layout method raises a ValueError."""
+    with pytest.raises(ValueError, match="Unsupported layout method"):
+        compute_layout(nx.path_graph(3), method="circular")
+
+
+def test_apply_layout_sets_node_positions():
+    """Test that only node elements get a preset position."""
+    elements, _ = networkx_to_cytoscape(
+        nx.path_graph(2), node_attributes=[], edge_attributes=[]
+    )
+    apply_layout(elements, {0: (-1.0, 1.0), 1: (1.0, 0.0)}, width=200, height=100)
+
+    assert elements[0]["position"] == {"x": -100.0, "y": -50.0}
+    assert elements[1]["position"] == {"x": 100.0, "y": 0.0}
+    assert "position" not in elements[2]
+
+
+def _network_edges(n_nodes: int, n_edges: int) -> pd.DataFrame:
+    """Returns a random weighted edge list."""
+    graph = nx.gnm_random_graph(n_nodes, n_edges, seed=0)
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        [(f"n{u}", f"n{v}", rng.uniform(0, 1)) for u, v in graph.edges()],
+        columns=["node1", "node2", "weight"],
+    )
+
+
+@pytest.mark.parametrize(
+    "extra_args, n_nodes, n_edges",
+    [({}, 212, 200), ({"max_nodes": 100}, 100, None), ({"limit": 100}, 150, 100)],
+)
+def test_get_network_node_budget(extra_args: dict, n_nodes: int, n_edges):
+    """Test that networks within the edge limit are only cut to a given node budget."""
+    data = _network_edges(300, 200)
+    args = {"source": "node1", "target": "node2", "values": "weight"}
+    args.update(color_weight=False, node_layout=None, **extra_args)
+    net = get_network(data, "net", args)
+    elements = net["notebook"][0]
+    nodes = [e for e in elements if "source" not in e["data"]]
+    edges = [e for e in elements if "source" in e["data"]]
+
+    assert len(nodes) == n_nodes
+    if n_edges is not None:
+        assert len(edges) == n_edges
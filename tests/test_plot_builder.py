@@ -0,0 +1,40 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from vuecore.engines.plotly.plot_builder import project_columns
+
+
+def test_project_columns_keeps_referenced_columns(caplog):
+    """
+    Test that only the columns referenced by the plot arguments are kept,
+    without copying them, and that the dropped columns are logged.
+    """
+    data = pd.DataFrame(
+        {
+            "x": np.arange(5.0),
+            "y": np.arange(5.0) ** 2,
+            "group": list("aabbc"),
+            "gene": [f"G{i}" for i in range(5)],
+            **{f"annotation_{i}": np.zeros(5) for i in range(10)},
+        }
+    )
+    plot_args = {"x": "x", "y": "y", "color": "group", "hover_data": {"gene": True}}
+
+    with caplog.at_level(logging.DEBUG, logger="vuecore.engines.plotly.plot_builder"):
+        projected = project_columns(data, plot_args)
+
+    assert list(projected.columns) == ["x", "y", "group", "gene"]
+    assert np.shares_memory(projected["x"].to_numpy(), data["x"].to_numpy())
+    assert "Dropped 10 of 14 columns" in caplog.text
+
+
+def test_project_columns_leaves_wide_form_data():
+    """
+    Test that wide-form calls, which use every column, are not projected.
+    """
+    data = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+
+    assert project_columns(data, {"color": "a"}) is data
+    assert list(project_columns(data, {"y": ["a", "b"]}).columns) == ["a", "b"]
@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from vuecore.viz.sankey import get_sankey_plot
+
+SANKEY_ARGS = {
+    "source": "source",
+    "target": "target",
+    "weight": "weight",
+    "source_colors": "source_colors",
+    "target_colors": "target_colors",
+    "title": "Sankey plot",
+}
+
+
+@pytest.fixture
+def flows() -> pd.DataFrame:
+    """Fixture with pathway -> protein flows, with one duplicate link."""
+    return pd.DataFrame(
+        {
+            "source": ["P1", "P1", "P2", "P1"],
+            "target": ["A", "B", "B", "A"],
+            "weight": [1, 5, 2, 3],
+            "source_colors": ["#ff0000", "#ff0000", "blue", "#ff0000"],
+            "target_colors": ["#00ff00", "#00ff00", "#00ff00", "#00ff00"],
+        }
+    )
+
+
+def test_sankey_links(flows: pd.DataFrame):
+    """Test that links reference the factorized nodes and converted colors."""
+    trace = get_sankey_plot(flows, "sankey", SANKEY_ARGS).figure["data"][0]
+
+    assert trace["node"]["label"] == ["P1", "P2", "A", "B"]
+    assert list(trace["link"]["source"]) == [0, 0, 1, 0]
+    assert list(trace["link"]["target"]) == [2, 3, 3, 2]
+    assert trace["node"]["color"][:2] == ["rgba(255, 0, 0, 0.6)", "blue"]
+    assert trace["link"]["color"][2] == "blue"
+
+
+def test_sankey_aggregate_and_filter(flows: pd.DataFrame):
+    """Test that duplicate links are summed before the weight quantile filter."""
+    args = dict(SANKEY_ARGS, aggregate=True, min_weight_quantile=0.5)
+    trace = get_sankey_plot(flows, "sankey", args).figure["data"][0]
+
+    assert list(trace["link"]["value"]) == [4, 5]
+    assert trace["node"]["label"] == ["P1", "A", "B"]
@@ -0,0 +1,67 @@
+import warnings
+
+import pytest
+from pathlib import Path
+
+import kaleido
+import plotly.express as px
+
+from vuecore.engines.plotly.saver import renderer_session, save_many
+
+
+def test_save_many_interactive_formats(tmp_path: Path):
+    """
+    Test saving several figures at once, ensuring every file is written
+    and the paths are returned in order.
+    """
+    figs = [px.scatter(x=[1, 2, 3], y=[i, i + 1, i + 2]) for i in range(3)]
+    paths = [
+        str(tmp_path / f"figure_{i}.{ext}")
+        for i, ext in enumerate(["html", "json", "html"])
+    ]
+
+    saved = save_many(figs, paths)
+
+    assert saved == paths
+    for path in paths:
+        assert Path(path).exists(), f"Output file should exist: {path}"
+        assert Path(path).stat().st_size > 0, f"Output file should not be empty: {path}"
+
+
+def test_save_many_length_mismatch(tmp_path: Path):
+    """
+    Test that the numbers of figures and paths must match.
+    """
+    fig = px.scatter(x=[1, 2, 3], y=[1, 2, 3])
+
+    with pytest.raises(ValueError):
+        save_many([fig, fig], [str(tmp_path / "figure.html")])
+
+
+def test_nested_renderer_sessions_share_one_server(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that only the outermost session starts and stops the Kaleido server.
+    """
+    calls = []
+    running = []
+
+    def start_sync_server(**kwargs):
+        if running:
+            warnings.warn("Server already open.", RuntimeWarning)
+            return
+        running.append(True)
+        calls.append("start")
+
+    def stop_sync_server(**kwargs):
+        running.clear()
+        calls.append("stop")
+
+    monkeypatch.setattr(kaleido, "calc_fig_sync", lambda *args, **kwargs: b"")
+    monkeypatch.setattr(kaleido, "start_sync_server", start_sync_server)
+    monkeypatch.setattr(kaleido, "stop_sync_server", stop_sync_server)
+
+    with renderer_session():
+        with renderer_session(n=2):
+            assert running
+        assert running
+    assert calls == ["start", "stop"] and not running
@@ -95,3 +95,55 @@ def test_advanced_scatter_plot(
     assert (
         output_path.stat().st_size > 0
     ), f"Output file should not be empty: {output_path}"
+
+
+@pytest.mark.parametrize("density_method", ["grid", "kde", "knn"])
+def test_density_scatter_plot(sample_scatter_df: pd.DataFrame, density_method: str):
+    """
+    Test scatter plot creation with density coloring for each density estimator,
+    ensuring one density value is mapped to each point.
+    """
+    fig = create_scatter_plot(
+        data=sample_scatter_df,
+        x="gene_expression",
+        y="log_p_value",
+        color_by_density=True,
+        density_method=density_method,
+    )
+
+    marker_colors = fig.data[0].marker.color
+    assert len(marker_colors) == len(sample_scatter_df)
+    assert all(c > 0 for c in marker_colors), "Density values should be positive."
+
+
+@pytest.mark.parametrize(
+    "render_mode, webgl_threshold, expected_type",
+    [
+        ("auto", 1000, "scatter"),
+        ("auto", 5, "scattergl"),
+        ("svg", 5, "scatter"),
+        ("webgl", 1000, "scattergl"),
+    ],
+)
+def test_scatter_render_mode(
+    sample_scatter_df: pd.DataFrame,
+    render_mode: str,
+    webgl_threshold: int,
+    expected_type: str,
+):
+    """
+    Test that the scatter builder selects SVG or WebGL traces and that the
+    marker theme is applied to both.
+    """
+    fig = create_scatter_plot(
+        data=sample_scatter_df,
+        x="gene_expression",
+        y="log_p_value",
+        text="gene_name",
+        render_mode=render_mode,
+        webgl_threshold=webgl_threshold,
+        marker_line_width=2,
+    )
+
+    assert fig.data[0].type == expected_type
+    assert fig.data[0].marker.line.width == 2
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scipy.stats import gaussian_kde
+
+from vuecore.utils.statistics import (
+    MAX_AUTO_BINS,
+    compute_histogram,
+    compute_kde_curves,
+    get_density,
+)
+
+
+@pytest.fixture
+def two_cluster_points() -> tuple:
+    """Fixture with two well separated 2D Gaussian clusters."""
+    rng = np.random.default_rng(42)
+    x = np.concatenate([rng.normal(0, 1, 1500), rng.normal(5, 0.5, 1500)])
+    y = np.concatenate([rng.normal(0, 1, 1500), rng.normal(0, 0.5, 1500)])
+    return x, y
+
+
+@pytest.mark.parametrize("method", ["grid", "knn"])
+def test_fast_density_agrees_with_kde(two_cluster_points: tuple, method: str):
+    """Test that the fast density estimators rank points like the exact KDE."""
+    x, y = two_cluster_points
+    exact = get_density(x, y, method="kde")
+    approx = get_density(x, y, method=method)
+
+    assert approx.shape == exact.shape
+    assert np.corrcoef(exact, approx)[0, 1] > 0.9
+
+
+def test_grid_density_handles_missing_values():
+    """Test that points with missing coordinates get a NaN density."""
+    x = np.array([0.0, 1.0, np.nan, 2.0, 1.5])
+    y = np.array([0.0, 1.0, 1.0, np.nan, 0.5])
+    density = get_density(x, y, method="grid", grid_size=32)
+
+    assert np.isnan(density[[2, 3]]).all()
+    assert np.isfinite(density[[0, 1, 4]]).all()
+
+
+def test_unknown_density_method():
+    """Test that an unsupported density method raises a ValueError."""
+    with pytest.raises(ValueError, match="Unsupported density method"):
+        get_density(np.arange(5.0), np.arange(5.0), method="unknown")
+
+
+def test_compute_histogram_barnorm():
+    """Test that barnorm normalizes the stacked groups of each bin."""
+    data = pd.DataFrame(
+        {
+            "value": [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+            "group": ["A", "B", "A", "A", "B", "B"],
+        }
+    )
+    binned, value_name = compute_histogram(
+        data,
+        value_col="value",
+        group_cols=["group"],
+        stack_cols=["group"],
+        nbins=2,
+        barnorm="fraction",
+    )
+
+    assert value_name == "count"
+    totals = binned.groupby("value")[value_name].sum()
+    assert np.allclose(totals, 1.0)
+
+
+def test_compute_histogram_caps_automatic_bins():
+    """Test that outliers cannot raise the automatic number of bins above the cap."""
+    rng = np.random.default_rng(0)
+    heavy_tailed = pd.DataFrame({"value": rng.standard_cauchy(1_000_000)})
+    binned, value_name = compute_histogram(heavy_tailed, value_col="value")
+
+    assert len(binned) <= MAX_AUTO_BINS
+    assert binned[value_name].sum() == len(heavy_tailed)
+
+    # Below the cap, the bins are numpy's 'auto' bins
+    normal = pd.DataFrame({"value": np.r_[rng.normal(size=10_000), 1e6]})
+    binned, _ = compute_histogram(normal, value_col="value")
+    edges = np.histogram_bin_edges(normal["value"], bins="auto")
+    assert binned["bin_width"].iloc[0] == pytest.approx(np.diff(edges)[0])
+
+
+def test_kde_curves_match_gaussian_kde():
+    """Test that the binned FFT density per group matches scipy's exact KDE."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "group": np.repeat(["a", "b"], 2000),
+            "value": np.concatenate([rng.normal(0, 1, 2000), rng.normal(5, 3, 2000)]),
+        }
+    )
+
+    curves = compute_kde_curves(
+        data, "value", group_cols=["group"], grid_size=128, bandwidth=0.5
+    )
+
+    assert len(curves) == 2 * 128
+    for group, curve in curves.groupby("group"):
+        values = data.loc[data["group"] == group, "value"].to_numpy()
+        kde = gaussian_kde(values, bw_method=0.5 / values.std(ddof=1))
+        expected = kde(curve["value"].to_numpy())
+        assert np.allclose(curve["density"], expected, atol=1e-3)
@@ -0,0 +1,134 @@
+import dash
+import numpy as np
+import pandas as pd
+import pytest
+from dash import _callback as dash_callback
+from dash import html
+
+from vuecore.viz.tables import SERVER_TABLE_TYPE, TABLE_PAGERS, TablePager, get_table
+
+# Callbacks registered with dash.callback when the module was imported. Dash
+# moves them into the first app that serves a request, so each test app gets
+# its own copy
+_CALLBACK_MAP = {
+    key: value
+    for key, value in dash_callback.GLOBAL_CALLBACK_MAP.items()
+    if SERVER_TABLE_TYPE in key
+}
+_CALLBACK_LIST = [
+    value
+    for value in dash_callback.GLOBAL_CALLBACK_LIST
+    if SERVER_TABLE_TYPE in value["output"]
+]
+
+
+@pytest.fixture
+def dash_app(monkeypatch: pytest.MonkeyPatch) -> dash.Dash:
+    """Fixture with a Dash app that has served its first request."""
+    monkeypatch.setattr(dash_callback, "GLOBAL_CALLBACK_MAP", dict(_CALLBACK_MAP))
+    monkeypatch.setattr(dash_callback, "GLOBAL_CALLBACK_LIST", list(_CALLBACK_LIST))
+    app = dash.Dash(__name__)
+    app.layout = html.Div(id="page")
+    app.server.test_client().get("/")
+    return app
+
+
+@pytest.fixture
+def results() -> pd.DataFrame:
+    """Fixture with a large regulation results table."""
+    n = 100_000
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "identifier": [f"P{i}" for i in range(n)],
+            "log2FC": rng.normal(0, 1, n),
+            "padj": rng.uniform(0, 1, n),
+            "rejected": rng.uniform(0, 1, n) < 0.1,
+        }
+    )
+
+
+def test_server_side_table_embeds_one_page(results: pd.DataFrame):
+    """Test that a server-side table only embeds its first page."""
+    div = get_table(results, "results", {"server_side": True, "page_size": 50})
+    table = div.children[1]
+
+    token = table.id["index"]
+    assert table.id["type"] == SERVER_TABLE_TYPE and token.startswith("table_results_")
+    assert table.page_action == "custom"
+    assert len(table.data) == 50
+    assert table.page_count == 2000
+    assert TABLE_PAGERS.get(token).data is results
+    TABLE_PAGERS.discard(token)
+
+
+def test_server_side_renders_do_not_share_pagers(results: pd.DataFrame):
+    """Test that two renders of the same identifier keep separate pagers."""
+    first = get_table(results, "shared", {"server_side": True}).children[1]
+    other = results.head(10)
+    second = get_table(other, "shared", {"server_side": True}).children[1]
+
+    assert first.id["index"] != second.id["index"]
+    assert TABLE_PAGERS.get(first.id["index"]).data is results
+    assert TABLE_PAGERS.get(second.id["index"]).data is other
+    for table in (first, second):
+        TABLE_PAGERS.discard(table.id["index"])
+
+
+def test_pager_filters_sorts_and_slices(results: pd.DataFrame):
+    """Test that the pager filters and sorts the whole frame before slicing."""
+    pager = TablePager(results)
+    sort_by = [{"column_id": "log2FC", "direction": "desc"}]
+    query = "{padj} lt 0.05 && {rejected} eq True"
+    records, page_count = pager.page(1, 10, sort_by, query)
+
+    expected = results[(results["padj"] < 0.05) & results["rejected"]]
+    expected = expected.sort_values("log2FC", ascending=False)
+    assert page_count == -(-len(expected) // 10)
+    assert [r["identifier"] for r in records] == list(expected["identifier"][10:20])
+
+
+def test_pager_contains_filter():
+    """Test the 'contains' operator and list cells joined with ';'."""
+    data = pd.DataFrame({"gene": ["TP53", "BRCA1", "TP63"], "ids": [[1, 2], [3], [4]]})
+    records, page_count = TablePager(data).page(0, 25, None, "{gene} contains TP")
+
+    assert [r["gene"] for r in records] == ["TP53", "TP63"]
+    assert records[0]["ids"] == "1;2"
+    assert page_count == 1
+
+
+def test_server_side_table_pages_after_first_request(
+    results: pd.DataFrame, dash_app: dash.Dash
+):
+    """Test that a table rendered after the app's first request still pages."""
+    client = dash_app.server.test_client()
+    table = get_table(results, "late", {"server_side": True}).children[1]
+
+    outputs = [key for key in dash_app.callback_map if SERVER_TABLE_TYPE in key]
+    assert len(outputs) == 1
+    inputs = {"page_current": 2, "page_size": 10, "sort_by": [], "filter_query": ""}
+    response = client.post(
+        "/_dash-update-component",
+        json={
+            "output": outputs[0],
+            "outputs": [
+                {"id": table.id, "property": "data"},
+                {"id": table.id, "property": "page_count"},
+            ],
+            "inputs": [
+                {"id": table.id, "property": name, "value": value}
+                for name, value in inputs.items()
+            ],
+            "state": [{"id": table.id, "property": "id", "value": table.id}],
+            "changedPropIds": [],
+        },
+    )
+    TABLE_PAGERS.discard(table.id["index"])
+
+    assert response.status_code == 200
+    (page,) = response.get_json()["response"].values()
+    assert [row["identifier"] for row in page["data"]] == [
+        f"P{i}" for i in range(20, 30)
+    ]
+    assert page["page_count"] == 10_000
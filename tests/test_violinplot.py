@@ -125,3 +125,66 @@ def test_advanced_violin_plot(
     assert (
         output_path.stat().st_size > 0
     ), f"Output file should not be empty: {output_path}"
+
+
+def test_precomputed_violin_plot(sample_violin_data: pd.DataFrame, tmp_path: Path):
+    """
+    Test violin plot creation with server-side density estimation, ensuring
+    the violins are drawn as filled paths with a bounded number of points.
+    """
+    output_path = tmp_path / "precomputed_violin_test.html"
+
+    fig = create_violin_plot(
+        data=sample_violin_data,
+        x="Treatment",
+        y="Expression",
+        color="Sample_ID",
+        box=True,
+        points="all",
+        precompute_kde=True,
+        kde_grid_size=64,
+        max_points=10,
+        file_path=str(output_path),
+    )
+
+    assert output_path.exists(), f"Output file should exist: {output_path}"
+    violins = [trace for trace in fig.data if trace.fill == "toself"]
+    points = [trace for trace in fig.data if trace.mode == "markers"]
+    assert len(violins) == sample_violin_data["Sample_ID"].nunique()
+    assert all(trace.type == "scatter" for trace in violins)
+
+    n_violins = sample_violin_data.groupby(["Treatment", "Sample_ID"]).ngroups
+    assert sum(len(trace.y) for trace in points) <= 10 * n_violins
+    assert list(fig.layout.xaxis.ticktext) == list(
+        pd.unique(sample_violin_data["Treatment"])
+    )
+
+
+def test_precomputed_violin_points_skip_empty_groups(
+    sample_violin_data: pd.DataFrame,
+):
+    """
+    Test that the points of server-side violins stay on their own violin when
+    a group has no values.
+    """
+    data = sample_violin_data.copy()
+    empty = data["Sample_ID"] == data["Sample_ID"].iloc[0]
+    data.loc[empty, "Expression"] = np.nan
+
+    fig = create_violin_plot(
+        data=data,
+        x="Treatment",
+        y="Expression",
+        color="Sample_ID",
+        points="all",
+        precompute_kde=True,
+    )
+
+    treatments = list(pd.unique(data["Treatment"]))
+    groups = data.set_index("Expression")[["Treatment", "Sample_ID"]]
+    points = [trace for trace in fig.data if trace.mode == "markers"]
+    assert sum(len(trace.y) for trace in points) == (~empty).sum()
+    for trace in points:
+        expected = groups.loc[list(trace.y)]
+        assert (expected["Sample_ID"] == trace.name).all()
+        assert [treatments[round(x)] for x in trace.x] == list(expected["Treatment"])
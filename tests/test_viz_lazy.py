@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies only needed by the network, WGCNA and word cloud families
+NETWORK_TEXT_MODULES = [
+    "networkx",
+    "nltk",
+    "pyvis",
+    "wordcloud",
+    "webweb",
+    "cyjupyter",
+    "dash_cytoscape",
+    "acore",
+]
+
+
+def _cold_import(statement: str) -> dict:
+    """Runs an import in a fresh interpreter, returning its time and the modules loaded."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {NETWORK_TEXT_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'loaded': loaded}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_viz_package_import_is_light():
+    """
+    Test that importing the legacy viz package loads no plot family.
+    """
+    result = _cold_import("import vuecore.viz")
+    assert result["loaded"] == []
+
+
+@pytest.mark.parametrize(
+    "function",
+    ["run_volcano", "get_heatmapplot", "get_table", "get_sankey_plot", "get_barplot"],
+)
+def test_family_cold_start(function: str, record_property):
+    """
+    Test that using a function only imports its own plot family, and record
+    the cold-start cost of that family.
+    """
+    result = _cold_import(f"from vuecore.viz import {function}")
+    record_property(f"{function}_cold_start_seconds", round(result["elapsed"], 3))
+    assert result["loaded"] == [], f"{function} imported {result['loaded']}"
+
+
+def test_viz_lazy_attributes():
+    """
+    Test that every legacy function is listed and resolvable, and unknown
+    names raise AttributeError.
+    """
+    import vuecore.viz as viz
+
+    assert "get_network" in dir(viz)
+    assert callable(viz.get_volcanoplot)
+    with pytest.raises(AttributeError):
+        viz.not_a_plot
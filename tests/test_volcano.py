@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import plotly.io as pio
+
+from vuecore.utils.downsampling import density_thin_indices
+from vuecore.viz.volcano import VOLCANO_COLORS, run_volcano
+
+VOLCANO_ARGS = {
+    "alpha": 0.05,
+    "fc": 2,
+    "colorscale": "Blues",
+    "showscale": False,
+    "marker_size": 8,
+    "x_title": "log2FC",
+    "y_title": "-log10(pvalue)",
+    "num_annotations": 2,
+}
+
+
+@pytest.fixture
+def regulation_data() -> pd.DataFrame:
+    """Fixture with the regulation results of two comparisons."""
+    log2fc = [3.0, -2.5, 0.5, -0.4, 1.5, 0.2]
+    padj = [0.001, 0.01, 0.02, 0.03, 0.5, 0.9]
+    frames = []
+    for group in ["A", "B"]:
+        frames.append(
+            pd.DataFrame(
+                {
+                    "identifier": [f"P{i}" for i in range(len(log2fc))],
+                    "group1": group,
+                    "group2": "ctrl",
+                    "log2FC": log2fc,
+                    "pvalue": np.array(padj) / 5,
+                    "padj": padj,
+                }
+            )
+        )
+    data = pd.concat(frames, ignore_index=True)
+    data["-log10 pvalue"] = -np.log10(data["pvalue"])
+    return data
+
+
+def test_run_volcano_colors_and_annotations(regulation_data: pd.DataFrame):
+    """Test that hits are colored by class and the strongest ones annotated."""
+    figures = run_volcano(regulation_data, "volcano", VOLCANO_ARGS)
+
+    assert [graph.id for graph in figures] == ["volcanoA_ctrl", "volcanoB_ctrl"]
+    figure = figures[0].figure
+    background, trace = figure["data"]
+    # Non-significant hits are drawn as one single-color trace
+    assert list(background.x) == [1.5, 0.2]
+    assert background.marker.color == VOLCANO_COLORS["not_significant"][0]
+    # Hits are ordered by absolute log2FC
+    assert list(trace.x) == [3.0, -2.5, 0.5, -0.4]
+    expected = ["up", "down", "up_below_fc", "down_below_fc"]
+    assert list(trace.marker.color) == [VOLCANO_COLORS[c][0] for c in expected]
+    assert trace.type == "scattergl"
+    assert trace.text[0].startswith("<b>P0: 0<br>Comparison: A vs ctrl<br>log2FC = 3.0")
+    assert [a.text for a in figure["layout"].annotations[:2]] == ["P0", "P1"]
+
+
+def test_run_volcano_annotate_list(regulation_data: pd.DataFrame):
+    """Test that an annotation list replaces the default annotations."""
+    args = dict(VOLCANO_ARGS, annotate_list=["P3"])
+    figures = run_volcano(regulation_data, "volcano", args)
+
+    annotations = figures[1].figure["layout"].annotations
+    assert annotations[0].text == "P3"
+    assert annotations[0].font.color == VOLCANO_COLORS["down_below_fc"][1]
+
+
+def test_density_thinning_keeps_sparse_points():
+    """Test that density thinning subsamples the crowded regions first."""
+    rng = np.random.default_rng(0)
+    x = np.append(rng.normal(0, 1, 20000), [10.0, -10.0])
+    y = np.append(np.abs(rng.normal(0, 1, 20000)), [8.0, 9.0])
+    selected = density_thin_indices(x, y, 1000)
+
+    assert len(selected) == 1000
+    assert len(np.unique(selected)) == 1000
+    assert {20000, 20001} <= set(selected)
+
+
+def test_volcano_fits_byte_budget():
+    """Test that the non-significant hits are thinned to fit the byte budget."""
+    rng = np.random.default_rng(0)
+    n = 20000
+    pvalue = rng.uniform(0, 1, n)
+    data = pd.DataFrame(
+        {
+            "identifier": [f"P{i}" for i in range(n)],
+            "group1": "A",
+            "group2": "ctrl",
+            "log2FC": rng.normal(0, 1, n),
+            "pvalue": pvalue,
+            "padj": np.minimum(pvalue * 100, 1),
+            "-log10 pvalue": -np.log10(pvalue),
+        }
+    )
+    args = dict(VOLCANO_ARGS, max_bytes=500_000, width=600, height=500)
+    figure = run_volcano(data, "volcano", args)[0].figure
+
+    assert len(pio.to_json(figure, validate=False)) <= 500_000
+    assert 0 < len(figure["data"][0].x) < n
+    assert figure["layout"].width == 600
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from vuecore.wgcna import get_heatmap_labels, plot_labeled_heatmap
+
+
+@pytest.fixture
+def module_trait_cor() -> pd.DataFrame:
+    """Fixture with module-trait correlations."""
+    return pd.DataFrame(
+        [[0.9, -0.1, 0.5], [-0.7, 0.2, np.nan]],
+        index=["MEblue", "MEred"],
+        columns=["age", "bmi", "sex"],
+    )
+
+
+@pytest.fixture
+def text_matrix(module_trait_cor: pd.DataFrame) -> pd.DataFrame:
+    """Fixture with correlation and p-value labels."""
+    return module_trait_cor.round(2).astype(str) + "\n(0.01)"
+
+
+def test_labeled_heatmap_uses_trace_text(
+    module_trait_cor: pd.DataFrame, text_matrix: pd.DataFrame
+):
+    """Test that cell labels are drawn by the heatmap trace, not by annotations."""
+    figure = plot_labeled_heatmap(
+        module_trait_cor, text_matrix, title="Modules", row_annotation=True
+    )
+
+    heatmap = figure["data"][0]
+    assert heatmap.texttemplate == "%{text}"
+    assert np.asarray(heatmap.text)[0, 0] == "0.9<br>(0.01)"
+    assert not figure["layout"].annotations
+
+
+def test_heatmap_labels_threshold(
+    module_trait_cor: pd.DataFrame, text_matrix: pd.DataFrame
+):
+    """Test that only the strongest cells are labeled."""
+    labels = get_heatmap_labels(module_trait_cor, text_matrix, label_threshold=0.3)
+    assert (labels != "").tolist() == [[True, False, True], [True, False, False]]
+
+    labels = get_heatmap_labels(module_trait_cor, text_matrix, max_labels=2)
+    assert (labels != "").tolist() == [[True, False, False], [True, False, False]]
+
+
+def test_heatmap_labels_by_position(
+    module_trait_cor: pd.DataFrame, text_matrix: pd.DataFrame
+):
+    """Test that a text matrix of the same shape with other labels is matched by position."""
+    labels = get_heatmap_labels(module_trait_cor, text_matrix.reset_index(drop=True))
+
+    assert labels[1, 0] == "-0.7<br>(0.01)"
+    assert (labels != "").all()